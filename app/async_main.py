@@ -0,0 +1,348 @@
+"""Async entry point serving the same /api/* routes as app/main.py.
+
+Runs on Quart with psycopg 3 and an AsyncConnectionPool, so a slow query
+only parks a coroutine instead of tying up one of a handful of sync
+workers. SQL, parameter parsing and response shaping come from
+app/queries.py, so both entry points return identical responses.
+
+Install the extra dependencies with `pip install -r requirements-async.txt`
+and run with e.g. `hypercorn app.async_main:app --bind 0.0.0.0:5000`.
+"""
+import csv
+import io
+import os
+from contextlib import asynccontextmanager
+
+import psycopg
+from psycopg.errors import QueryCanceled
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+from quart import Quart, Response, jsonify, render_template, request
+
+from app import config
+from app.db import statement_timeout_for, record_timeout
+from app.json_provider import make_json_provider, dumps_line
+from app.queries import (
+    TOPIC_INDUSTRY_MAP, EXPORT_FETCH_SIZE, EXPORT_CHUNK_ROWS, DONATION_EXPORT_FIELDS,
+    SEARCH_POLITICIANS_SQL, POLITICIAN_BY_ID_SQL, POLITICIANS_BY_IDS_SQL, VOTE_COUNTS_SQL,
+    SEARCH_DONORS_SQL, DONOR_BY_ID_SQL, DONORS_BY_IDS_SQL, DONOR_CONTRIBUTIONS_SQL, DONOR_DONATION_COUNT_SQL,
+    DONATION_SUMMARY_SQL, FILTERED_DONATION_SUMMARY_SQL, BILL_SUBJECTS_SQL,
+    parse_id_list, parse_donation_page_args, parse_top_n,
+    format_politician, format_donor, format_donation, format_industry_total, order_batch,
+    donation_page, politician_profile, vote_page_queries, vote_page
+)
+
+
+app = Quart(__name__)
+app.json = make_json_provider(app, config.JSON_PROVIDER)
+
+# --- Connection Pool ---
+# Opened when the server starts serving, inside its event loop.
+pool = AsyncConnectionPool(
+    make_conninfo(**{k: v for k, v in config.conn_params.items() if v is not None}),
+    min_size=config.DB_POOL_MIN,
+    max_size=config.DB_POOL_MAX,
+    timeout=config.DB_POOL_TIMEOUT,
+    kwargs={"options": "-c search_path=pt,public", "row_factory": dict_row},
+    open=False
+)
+
+@app.before_serving
+async def open_pool():
+    await pool.open()
+
+@app.after_serving
+async def close_pool():
+    await pool.close()
+
+@asynccontextmanager
+async def db_connection(statement_timeout_ms=None):
+    """Checks out a pooled connection inside a transaction limited by the
+    current endpoint's statement_timeout budget (or the one given)."""
+    if statement_timeout_ms is None:
+        statement_timeout_ms = statement_timeout_for(request.endpoint)
+    async with pool.connection() as conn:
+        await conn.execute("SELECT set_config('statement_timeout', %s, true);",
+                           (str(int(statement_timeout_ms)),))
+        yield conn
+
+def db_error_response(e, message):
+    """Logs a failed route and builds its JSON error response (503 with a
+    Retry-After hint for timeouts, otherwise 500), as in app/main.py."""
+    print(f"{message}: {e}")
+    if isinstance(e, (QueryCanceled, PoolTimeout)):
+        record_timeout(request.endpoint, 'statement' if isinstance(e, QueryCanceled) else 'pool')
+        response = jsonify({
+            "error": "The request took too long, please retry shortly",
+            "retryAfter": config.RETRY_AFTER_SECONDS
+        })
+        response.headers['Retry-After'] = str(config.RETRY_AFTER_SECONDS)
+        return response, 503
+    return jsonify({"error": str(e)}), 500
+
+async def fetch_all(sql, params=None):
+    """Runs one query on a pooled connection and returns all rows."""
+    async with db_connection() as conn:
+        cur = await conn.execute(sql, params)
+        return await cur.fetchall()
+
+async def fetch_one(sql, params=None):
+    """Runs one query on a pooled connection and returns the first row, or None."""
+    async with db_connection() as conn:
+        cur = await conn.execute(sql, params)
+        return await cur.fetchone()
+
+async def fetch_vote_page(conn, politician_id, page=1, sort_order='DESC', bill_types=None, bill_subjects=None):
+    """Fetches one page of a politician's vote history with pagination info."""
+    count_sql, count_params, data_sql, data_params = vote_page_queries(
+        politician_id, page, sort_order, bill_types, bill_subjects)
+    cur = await conn.execute(count_sql, count_params)
+    total_votes = (await cur.fetchone())['count']
+    cur = await conn.execute(data_sql, data_params)
+    return vote_page(page, total_votes, await cur.fetchall())
+
+@app.route('/')
+async def index():
+    """Serves the main index.html file."""
+    return await render_template('index.html')
+
+@app.route('/donor_search.html')
+async def donor_search():
+    """Serves the donor_search.html file."""
+    return await render_template('donor_search.html')
+
+@app.route('/feedback.html')
+async def feedback():
+    """Serves the feedback.html file."""
+    return await render_template('feedback.html')
+
+@app.route('/api/politicians/search')
+async def search_politicians():
+    """Searches for politicians by name."""
+    query = request.args.get('name', '')
+    if len(query) < 2:
+        return jsonify([])
+    try:
+        politicians = await fetch_all(SEARCH_POLITICIANS_SQL, (f"%{query}%",))
+        return jsonify(politicians)
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error searching politicians")
+
+@app.route('/api/politician/<int:politician_id>')
+async def get_politician(politician_id):
+    """Gets a single politician by ID."""
+    try:
+        politician = await fetch_one(POLITICIAN_BY_ID_SQL, (politician_id,))
+        if politician is None:
+            return jsonify({"error": "Politician not found"}), 404
+        return jsonify(format_politician(politician))
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching politician")
+
+@app.route('/api/politicians')
+async def get_politicians_batch():
+    """Gets many politicians by ID in one query, e.g. /api/politicians?ids=1,2,3."""
+    ids, error = parse_id_list(request.args.get('ids'))
+    if error:
+        return jsonify({"error": error}), 400
+    try:
+        rows = await fetch_all(POLITICIANS_BY_IDS_SQL, (ids,))
+        politician_list, missing = order_batch(ids, rows, 'politicianid', format_politician)
+        return jsonify({"politicians": politician_list, "missing": missing})
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching politicians batch")
+
+@app.route('/api/donors/search')
+async def search_donors_route():
+    """Searches for donors by name."""
+    query = request.args.get('name', '')
+    if len(query) < 3:  # Match the 3-char minimum from the frontend
+        return jsonify([])
+    try:
+        donors = await fetch_all(SEARCH_DONORS_SQL, (f"%{query}%",))
+        return jsonify(donors)
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error searching donors")
+
+@app.route('/api/donor/<int:donor_id>')
+async def get_donor(donor_id):
+    """Gets a single donor by ID."""
+    try:
+        donor = await fetch_one(DONOR_BY_ID_SQL, (donor_id,))
+        if donor is None:
+            return jsonify({"error": "Donor not found"}), 404
+        return jsonify(format_donor(donor))
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching donor")
+
+@app.route('/api/donors')
+async def get_donors_batch():
+    """Gets many donors by ID in one query, e.g. /api/donors?ids=1,2,3."""
+    ids, error = parse_id_list(request.args.get('ids'))
+    if error:
+        return jsonify({"error": error}), 400
+    try:
+        rows = await fetch_all(DONORS_BY_IDS_SQL, (ids,))
+        donor_list, missing = order_batch(ids, rows, 'donorid', format_donor)
+        return jsonify({"donors": donor_list, "missing": missing})
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching donors batch")
+
+def stream_donor_contributions(donor_id, export_format):
+    """Streams a donor's full contribution history as NDJSON or CSV.
+
+    The pooled connection is checked out when the body starts streaming and
+    returned when it finishes or the client disconnects.
+    """
+    # The body is generated after the request context is gone
+    endpoint = request.endpoint
+    statement_timeout_ms = statement_timeout_for(endpoint)
+
+    async def generate():
+        try:
+            async with db_connection(statement_timeout_ms) as conn:
+                async with conn.cursor(name=f"donor_export_{donor_id}") as cur:
+                    cur.itersize = EXPORT_FETCH_SIZE
+                    await cur.execute(DONOR_CONTRIBUTIONS_SQL + ";", (donor_id,))
+
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer)
+                    if export_format == 'csv':
+                        writer.writerow(DONATION_EXPORT_FIELDS)
+
+                    i = 0
+                    async for row in cur:
+                        i += 1
+                        d = format_donation(row)
+                        if export_format == 'csv':
+                            writer.writerow([d[field] for field in DONATION_EXPORT_FIELDS])
+                        else:
+                            buffer.write(dumps_line(d))
+                        if i % EXPORT_CHUNK_ROWS == 0:
+                            yield buffer.getvalue().encode()
+                            buffer.seek(0); buffer.truncate()
+
+                    if buffer.tell():
+                        yield buffer.getvalue().encode()
+        except (Exception, psycopg.Error) as e:
+            # Headers are already sent, so the stream just ends early
+            if isinstance(e, QueryCanceled):
+                record_timeout(endpoint, 'statement')
+            print(f"Error streaming donor contributions: {e}")
+
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = Response(generate(), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f"attachment; filename=donor_{donor_id}_donations.{export_format}"
+    return response
+
+@app.route('/api/donor/<int:donor_id>/donations')
+async def get_donor_contributions(donor_id):
+    """Gets donations for a specific donor, joined with politician info.
+
+    Supports the same ?page=/per_page= and ?format=ndjson|csv options as the
+    sync app.
+    """
+    export_format = request.args.get('format', 'json').lower()
+    if export_format in ('ndjson', 'csv'):
+        return stream_donor_contributions(donor_id, export_format)
+    if export_format != 'json':
+        return jsonify({"error": f"Unsupported format: {export_format}"}), 400
+
+    paginated, page, per_page, error = parse_donation_page_args(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+
+    try:
+        if not paginated:
+            donations = await fetch_all(DONOR_CONTRIBUTIONS_SQL + ";", (donor_id,))
+            return jsonify([format_donation(d) for d in donations])
+
+        async with db_connection() as conn:
+            cur = await conn.execute(DONOR_DONATION_COUNT_SQL, (donor_id,))
+            total_donations = (await cur.fetchone())['count']
+            cur = await conn.execute(DONOR_CONTRIBUTIONS_SQL + " LIMIT %s OFFSET %s;",
+                                     (donor_id, per_page, (page - 1) * per_page))
+            donations = await cur.fetchall()
+        return jsonify(donation_page(page, per_page, total_donations, donations))
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching donor contributions")
+
+@app.route('/api/politician/<int:politician_id>/votes')
+async def get_politician_votes(politician_id):
+    """Gets paginated and filtered vote history for a politician."""
+    try:
+        page = int(request.args.get('page', 1))
+        sort_order = request.args.get('sort', 'desc').upper()
+        bill_types = request.args.getlist('type')
+        bill_subjects = request.args.getlist('subject')
+
+        async with db_connection() as conn:
+            votes = await fetch_vote_page(conn, politician_id, page, sort_order, bill_types, bill_subjects)
+        return jsonify(votes)
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching votes")
+
+@app.route('/api/politician/<int:politician_id>/donations/summary')
+async def get_donation_summary(politician_id):
+    """Gets UNFILTERED donation summary, grouped by INDUSTRY."""
+    try:
+        rows = await fetch_all(DONATION_SUMMARY_SQL, (politician_id,))
+        return jsonify([format_industry_total(row) for row in rows])
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching donation summary")
+
+@app.route('/api/politician/<int:politician_id>/profile')
+async def get_politician_profile(politician_id):
+    """Gets everything the politician detail view needs for its first render."""
+    top_n, error = parse_top_n(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+
+    try:
+        async with db_connection() as conn:
+            cur = await conn.execute(POLITICIAN_BY_ID_SQL, (politician_id,))
+            politician = await cur.fetchone()
+            if politician is None:
+                return jsonify({"error": "Politician not found"}), 404
+
+            votes = await fetch_vote_page(conn, politician_id)
+            cur = await conn.execute(DONATION_SUMMARY_SQL, (politician_id,))
+            summary_list = [format_industry_total(row) for row in await cur.fetchall()]
+            cur = await conn.execute(VOTE_COUNTS_SQL, (politician_id,))
+            vote_counts = await cur.fetchall()
+
+        return jsonify(politician_profile(politician, votes, summary_list, vote_counts, top_n))
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching politician profile")
+
+@app.route('/api/politician/<int:politician_id>/donations/summary/filtered')
+async def get_filtered_donation_summary(politician_id):
+    """Gets donation summary filtered by a bill topic."""
+    topic = request.args.get('topic')
+    if not topic:
+        return jsonify({"error": "No topic specified"}), 400
+
+    industries = TOPIC_INDUSTRY_MAP.get(topic)
+    if not industries:
+        return jsonify([])
+
+    try:
+        rows = await fetch_all(FILTERED_DONATION_SUMMARY_SQL, (politician_id, industries))
+        return jsonify([format_industry_total(row) for row in rows])
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching filtered donation summary")
+
+@app.route('/api/bills/subjects')
+async def get_all_bill_subjects():
+    """Gets all unique bill subjects from the Bills table."""
+    try:
+        rows = await fetch_all(BILL_SUBJECTS_SQL)
+        return jsonify([row['subject'] for row in rows])
+    except (Exception, psycopg.Error) as e:
+        return db_error_response(e, "Error fetching bill subjects")
+
+
+if __name__ == "__main__":
+    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=debug_mode)
@@ -1,50 +1,153 @@
-import os
-from dotenv import load_dotenv
-# from pathlib import Path
-
-load_dotenv('.env')
-
-# --- Base Directory ---
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-# --- Load Database Credentials from .env ---
-# We use os.getenv() to read the variables.
-# The second argument (e.g., "localhost") is a default value if the variable isn't found.
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = os.getenv("DB_PORT", "5432")
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-# --- Test Mode Override ---
-# When running tests, force usage of test database to prevent production data corruption
-if os.getenv("TESTING") == "true":
-    DB_NAME = "paper_trail_test"
-
-# --- Build the conn_params dictionary that all your scripts use ---
-# This dictionary is imported by your other scripts.
-conn_params = {
-    "host": DB_HOST,
-    "port": DB_PORT,
-    "dbname": DB_NAME,
-    "user": DB_USER,
-    "password": DB_PASSWORD
-}
-
-# --- Load API Key from .env ---
-CONGRESS_GOV_API_KEY = os.getenv("CONGRESS_GOV_API_KEY")
-
-# --- Non-Secret File Paths ---
-# These are not secrets, so they can stay here.
-FEC_DATA_FOLDER_PATH = os.path.join(BASE_DIR, "contributions")
-VOTE_DATA_FOLDER_PATH = os.path.join(BASE_DIR, "votes")
-MEMBER_FILE_PATH = os.path.join(BASE_DIR, "HSall_members.json")
-BILL_DATA_PATH = os.path.join(BASE_DIR, "bills")
-
-# --- Sanity Check (Optional but Recommended) ---
-# This will warn you if you forgot to fill in your .env file.
-if not DB_NAME or not DB_USER or not DB_PASSWORD:
-    print("WARNING: Database credentials (DB_NAME, DB_USER, DB_PASSWORD) not found in .env file.")
-
-if not CONGRESS_GOV_API_KEY:
+import os
+from dotenv import load_dotenv
+# from pathlib import Path
+
+load_dotenv('.env')
+
+# --- Base Directory ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --- Load Database Credentials from .env ---
+# We use os.getenv() to read the variables.
+# The second argument (e.g., "localhost") is a default value if the variable isn't found.
+DB_HOST = os.getenv("DB_HOST", "localhost")
+DB_PORT = os.getenv("DB_PORT", "5432")
+DB_NAME = os.getenv("DB_NAME")
+DB_USER = os.getenv("DB_USER")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+
+# --- Test Mode Override ---
+# When running tests, force usage of test database to prevent production data corruption
+if os.getenv("TESTING") == "true":
+    DB_NAME = "paper_trail_test"
+
+# --- Build the conn_params dictionary that all your scripts use ---
+# This dictionary is imported by your other scripts.
+conn_params = {
+    "host": DB_HOST,
+    "port": DB_PORT,
+    "dbname": DB_NAME,
+    "user": DB_USER,
+    "password": DB_PASSWORD
+}
+
+# --- API Connection Pool ---
+# Each app process keeps up to DB_POOL_MAX open connections and waits up to
+# DB_POOL_TIMEOUT seconds for a free one before failing the request.
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+# --- Read Replicas ---
+# Comma-separated libpq DSNs of streaming replicas, e.g.
+# DB_REPLICA_DSNS="host=replica1 dbname=paper_trail user=app password=secret"
+# GET requests read from them round-robin so they are not slowed down by the
+# loaders writing to the primary. Every DB_REPLICA_CHECK_INTERVAL seconds each
+# replica is checked; one that is unreachable or more than
+# DB_REPLICA_MAX_VERSION_LAG data versions (loader runs) behind the primary
+# is skipped until it catches up. With no usable replica the primary serves.
+DB_REPLICA_DSNS = [dsn.strip() for dsn in os.getenv("DB_REPLICA_DSNS", "").split(",") if dsn.strip()]
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5"))
+DB_REPLICA_MAX_VERSION_LAG = int(os.getenv("DB_REPLICA_MAX_VERSION_LAG", "0"))
+DB_REPLICA_CONNECT_TIMEOUT = int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", "2"))
+
+# --- Query Budgets ---
+# statement_timeout applied per API endpoint when a connection is checked
+# out, so a pathological query is cancelled in Postgres well before the
+# gunicorn worker timeout. Override individual budgets with e.g.
+# STATEMENT_TIMEOUTS="search_donors_route=2000,get_politician_votes=4000".
+# Timed-out requests get a 503 with a Retry-After of RETRY_AFTER_SECONDS.
+STATEMENT_TIMEOUT_MS = int(os.getenv("STATEMENT_TIMEOUT_MS", "10000"))
+STATEMENT_TIMEOUTS_MS = {
+    "get_politician": 2000,
+    "get_donor": 2000,
+    "get_politicians_batch": 2000,
+    "get_donors_batch": 2000,
+    "search_politicians": 3000,
+    "search_donors_route": 5000,
+    "get_politician_votes": 5000,
+    "get_donation_summary": 5000,
+    "get_filtered_donation_summary": 5000,
+    "get_all_bill_subjects": 5000,
+    "get_politician_profile": 8000,
+    "get_donor_contributions": 10000,
+}
+for _item in os.getenv("STATEMENT_TIMEOUTS", "").split(","):
+    if "=" in _item:
+        _endpoint, _ms = _item.split("=", 1)
+        STATEMENT_TIMEOUTS_MS[_endpoint.strip()] = int(_ms)
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", "5"))
+
+# --- API JSON Encoding ---
+# JSON_PROVIDER is 'auto' (orjson if installed), 'orjson' or 'stdlib'.
+# With PG_JSON_PASSTHROUGH on, the largest endpoints (donor contributions and
+# vote pages) have Postgres build the JSON and send the text as-is.
+JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto").lower()
+PG_JSON_PASSTHROUGH = os.getenv("PG_JSON_PASSTHROUGH", "false").lower() == "true"
+
+# --- HTTP Caching and Compression ---
+# API ETags are derived from the data_version row the loaders bump; the app
+# re-reads it at most every DATA_VERSION_TTL seconds. Responses of at least
+# COMPRESS_MIN_SIZE bytes are brotli (if installed) or gzip compressed.
+# HTML pages are cacheable by browsers for TEMPLATE_MAX_AGE seconds.
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", "5"))
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+TEMPLATE_MAX_AGE = int(os.getenv("TEMPLATE_MAX_AGE", "86400"))
+
+# --- Slow Query Log ---
+# Off unless SLOW_QUERY_MS is set. Queries slower than that many milliseconds
+# are appended as JSON lines to SLOW_QUERY_LOG_PATH (rotated at
+# SLOW_QUERY_LOG_MAX_BYTES, keeping SLOW_QUERY_LOG_BACKUPS old files). A
+# SLOW_QUERY_EXPLAIN_SAMPLE fraction of the ones that succeeded is re-run in
+# the background under EXPLAIN (ANALYZE, BUFFERS), on a replica if
+# DB_REPLICA_DSNS lists any, and logged with its plan.
+# Summarize the log with bin/slow_query_report.py.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS")) if os.getenv("SLOW_QUERY_MS") else None
+SLOW_QUERY_LOG_PATH = os.getenv(
+    "SLOW_QUERY_LOG_PATH", os.path.join(os.path.dirname(BASE_DIR), "local", "slow_queries.log")
+)
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "5"))
+SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE", "0.1"))
+
+# --- Loader Run Reports ---
+# Every bin/ loader run writes a JSON report of its per-stage wall and CPU
+# time, row counts, rows/sec and peak RSS to this directory.
+LOADER_REPORT_DIR = os.getenv(
+    "LOADER_REPORT_DIR", os.path.join(os.path.dirname(BASE_DIR), "local", "loader_runs")
+)
+
+# --- Load API Key from .env ---
+CONGRESS_GOV_API_KEY = os.getenv("CONGRESS_GOV_API_KEY")
+
+# --- Congress.gov Fetching ---
+# The API allows 5,000 requests per hour per key. bin/congress_api.py spreads
+# requests over CONGRESS_API_WORKERS threads within that rate, allowing bursts
+# of up to CONGRESS_API_BURST requests.
+CONGRESS_API_RATE_PER_HOUR = float(os.getenv("CONGRESS_API_RATE_PER_HOUR", "5000"))
+CONGRESS_API_BURST = int(os.getenv("CONGRESS_API_BURST", "50"))
+CONGRESS_API_WORKERS = int(os.getenv("CONGRESS_API_WORKERS", "8"))
+# Responses are cached (gzip-compressed) in CONGRESS_API_CACHE_DIR; set it
+# empty to disable the cache. With CONGRESS_API_OFFLINE on, nothing is
+# requested and every response must come from the cache.
+CONGRESS_API_CACHE_DIR = os.getenv(
+    "CONGRESS_API_CACHE_DIR", os.path.join(os.path.dirname(BASE_DIR), "local", "congress_cache")
+)
+CONGRESS_API_OFFLINE = os.getenv("CONGRESS_API_OFFLINE", "false").lower() == "true"
+
+# --- Non-Secret File Paths ---
+# These are not secrets, so they can stay here.
+FEC_DATA_FOLDER_PATH = os.path.join(BASE_DIR, "contributions")
+VOTE_DATA_FOLDER_PATH = os.path.join(BASE_DIR, "votes")
+MEMBER_FILE_PATH = os.path.join(BASE_DIR, "HSall_members.json")
+BILL_DATA_PATH = os.path.join(BASE_DIR, "bills")
+
+# --- Sanity Check (Optional but Recommended) ---
+# This will warn you if you forgot to fill in your .env file.
+if not DB_NAME or not DB_USER or not DB_PASSWORD:
+    print("WARNING: Database credentials (DB_NAME, DB_USER, DB_PASSWORD) not found in .env file.")
+
+if not CONGRESS_GOV_API_KEY:
     print("WARNING: CONGRESS_GOV_API_KEY not found in .env file.")
\ No newline at end of file
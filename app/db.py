@@ -0,0 +1,302 @@
+import itertools
+import threading
+import time
+from collections import Counter
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+from flask import g, has_app_context, has_request_context, request
+from psycopg2 import pool
+
+from app import config
+from app import slow_queries
+
+
+# --- Query Timing ---
+# Every pooled connection uses these cursors, so each execute() adds to the
+# current request's DB time, query count and rows (read by app/metrics.py)
+# and, when enabled, reaches the slow query log (app/slow_queries.py).
+# Statements that fail, including those cancelled by their statement_timeout,
+# are logged too but never re-run under EXPLAIN.
+
+def _record_query(query, vars, seconds, rowcount, error=None):
+    """Adds one query's duration and rows to the current request, if any."""
+    if config.SLOW_QUERY_MS is not None:
+        endpoint = request.endpoint if has_request_context() else None
+        slow_queries.record_query(query, vars, seconds, rowcount, endpoint,
+                                  error=error, timeout_ms=statement_timeout_for(endpoint))
+    if not has_app_context() or "request_start" not in g:
+        return
+    g.db_time = g.get("db_time", 0.0) + seconds
+    g.db_queries = g.get("db_queries", 0) + 1
+    if rowcount and rowcount > 0:
+        g.db_rows = g.get("db_rows", 0) + rowcount
+
+
+class TimedCursor(psycopg2.extensions.cursor):
+    """Cursor that records each execute() against the current request."""
+
+    def execute(self, query, vars=None):
+        start = time.perf_counter()
+        error = None
+        try:
+            return super().execute(query, vars)
+        except psycopg2.Error as e:
+            error = e
+            raise
+        finally:
+            _record_query(query, vars, time.perf_counter() - start, self.rowcount, error)
+
+
+class TimedDictCursor(psycopg2.extras.DictCursor):
+    """DictCursor that records each execute() against the current request.
+
+    For server-side (named) cursors only the DECLARE is timed; rows fetched
+    while streaming are not counted.
+    """
+
+    def execute(self, query, vars=None):
+        start = time.perf_counter()
+        error = None
+        try:
+            return super().execute(query, vars)
+        except psycopg2.Error as e:
+            error = e
+            raise
+        finally:
+            _record_query(query, vars, time.perf_counter() - start, self.rowcount, error)
+
+
+# --- Connection Pools ---
+# Created lazily so each gunicorn worker builds its own pools after forking.
+# Reads from GET requests go round-robin to the healthy replicas listed in
+# DB_REPLICA_DSNS; everything else, and every read when no replica is
+# usable, goes to the primary.
+
+class DatabasePool:
+    """The connection pool for one database server.
+
+    At most DB_POOL_MAX connections are checked out at once; callers wait up
+    to DB_POOL_TIMEOUT seconds for a free one. For replicas, healthy,
+    data_version and error are refreshed by check_replicas().
+    """
+
+    def __init__(self, name, dsn=None):
+        self.name = name
+        self.dsn = dsn
+        self.healthy = False
+        self.data_version = None
+        self.error = None
+        self.checkouts = 0
+        self._pool = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(config.DB_POOL_MAX)
+
+    def get_pool(self):
+        """Returns the underlying ThreadedConnectionPool, creating it on first use."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.dsn is None:
+                        args, kwargs = (), dict(config.conn_params)
+                    else:
+                        args, kwargs = (self.dsn,), {"connect_timeout": config.DB_REPLICA_CONNECT_TIMEOUT}
+                    self._pool = pool.ThreadedConnectionPool(
+                        config.DB_POOL_MIN,
+                        config.DB_POOL_MAX,
+                        *args,
+                        options="-c search_path=pt,public",
+                        cursor_factory=TimedCursor,
+                        **kwargs
+                    )
+        return self._pool
+
+    def getconn(self):
+        if not self._slots.acquire(timeout=config.DB_POOL_TIMEOUT):
+            raise pool.PoolError("Timed out waiting for a database connection")
+        try:
+            conn = self.get_pool().getconn()
+        except Exception:
+            self._slots.release()
+            raise
+        self.checkouts += 1
+        return conn
+
+    def putconn(self, conn):
+        """Returns a connection, discarding it if it is broken."""
+        try:
+            discard = bool(conn.closed)
+            if not discard:
+                try:
+                    # End any open transaction so the next user starts clean
+                    conn.rollback()
+                except psycopg2.Error:
+                    discard = True
+            self.get_pool().putconn(conn, close=discard)
+        finally:
+            self._slots.release()
+
+
+_primary = DatabasePool("primary")
+_replicas = [DatabasePool(f"replica{n}", dsn) for n, dsn in enumerate(config.DB_REPLICA_DSNS, 1)]
+_next_replica = itertools.count()
+_checked_out = {}  # id(conn) -> DatabasePool it came from
+_checked_out_lock = threading.Lock()
+
+
+def get_pool():
+    """Returns the primary's connection pool, creating it on first use."""
+    return _primary.get_pool()
+
+
+# --- Replica Health ---
+# A replica is used only while it answers and has replayed the loads the
+# primary has: its data_version (bumped by every loader, see app/schema.py)
+# may trail the primary's by at most DB_REPLICA_MAX_VERSION_LAG.
+_health_lock = threading.Lock()
+_last_health_check = 0.0
+
+
+def _read_data_version(db_pool):
+    conn = db_pool.getconn()
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT version FROM data_version;")
+        row = cur.fetchone()
+        cur.close()
+        return row[0] if row else None
+    finally:
+        db_pool.putconn(conn)
+
+
+def check_replicas(force=False):
+    """Refreshes replica health, at most every DB_REPLICA_CHECK_INTERVAL seconds.
+
+    Only one thread checks at a time; the others keep using the last result.
+    """
+    global _last_health_check
+    if not _replicas:
+        return
+    if not force and time.monotonic() - _last_health_check < config.DB_REPLICA_CHECK_INTERVAL:
+        return
+    if not _health_lock.acquire(blocking=False):
+        return
+    try:
+        _last_health_check = time.monotonic()
+        try:
+            primary_version = _read_data_version(_primary)
+        except (Exception, psycopg2.Error) as e:
+            # Without the primary's version only reachability can be checked
+            print(f"Error reading primary data version: {e}")
+            primary_version = None
+
+        for replica in _replicas:
+            try:
+                version = _read_data_version(replica)
+            except (Exception, psycopg2.Error) as e:
+                replica.healthy = False
+                replica.error = str(e).strip()
+                continue
+            replica.data_version = version
+            if primary_version is not None and (version is None
+                                                or primary_version - version > config.DB_REPLICA_MAX_VERSION_LAG):
+                replica.healthy = False
+                replica.error = f"at data version {version}, primary at {primary_version}"
+            else:
+                replica.healthy = True
+                replica.error = None
+    finally:
+        _health_lock.release()
+
+
+def get_replica_status():
+    """Returns name, health, data version and checkout count of every pool."""
+    return [
+        {"name": p.name, "healthy": p.healthy if p.dsn else True, "data_version": p.data_version,
+         "error": p.error, "checkouts": p.checkouts}
+        for p in [_primary] + _replicas
+    ]
+
+
+def _choose_pool(readonly):
+    if readonly and _replicas:
+        check_replicas()
+        healthy = [replica for replica in _replicas if replica.healthy]
+        if healthy:
+            return healthy[next(_next_replica) % len(healthy)]
+    return _primary
+
+
+# --- Query Budgets ---
+# Requests that hit their statement_timeout or waited too long for a pooled
+# connection, keyed by (endpoint, kind).
+_timeouts = Counter()
+_timeouts_lock = threading.Lock()
+
+
+def statement_timeout_for(endpoint):
+    """Returns the statement_timeout budget in ms for an API endpoint."""
+    return config.STATEMENT_TIMEOUTS_MS.get(endpoint, config.STATEMENT_TIMEOUT_MS)
+
+
+def record_timeout(endpoint, kind):
+    """Counts a timed-out request; kind is 'statement' or 'pool'."""
+    with _timeouts_lock:
+        _timeouts[(endpoint, kind)] += 1
+
+
+def get_timeout_counts():
+    """Returns a copy of the {(endpoint, kind): count} timeout counters."""
+    with _timeouts_lock:
+        return dict(_timeouts)
+
+
+def get_db_connection(statement_timeout_ms=None, readonly=None):
+    """Checks out a pooled connection with search_path set to pt, public.
+
+    Read-only connections come from a healthy replica when any are
+    configured, otherwise (or if the replica cannot be reached) from the
+    primary. readonly defaults to whether the current request is a GET.
+    Waits up to DB_POOL_TIMEOUT seconds when every connection is in use.
+    Inside a request, statement_timeout defaults to the current endpoint's
+    budget; it is set transaction-locally, so it ends with the transaction
+    that release_db_connection() rolls back. Always hand the connection back with
+    release_db_connection().
+    """
+    if readonly is None:
+        readonly = has_request_context() and request.method in ("GET", "HEAD")
+    if statement_timeout_ms is None and has_request_context():
+        statement_timeout_ms = statement_timeout_for(request.endpoint)
+
+    db_pool = _choose_pool(readonly)
+    try:
+        conn = db_pool.getconn()
+    except psycopg2.Error as e:
+        if db_pool is _primary or isinstance(e, pool.PoolError):
+            raise
+        # Replica went away since the last health check
+        db_pool.healthy = False
+        db_pool.error = str(e).strip()
+        db_pool = _primary
+        conn = db_pool.getconn()
+
+    try:
+        if statement_timeout_ms:
+            cur = conn.cursor()
+            # set_config(..., true) is the parameterizable form of SET LOCAL
+            cur.execute("SELECT set_config('statement_timeout', %s, true);", (str(int(statement_timeout_ms)),))
+            cur.close()
+    except Exception:
+        db_pool.putconn(conn)
+        raise
+    with _checked_out_lock:
+        _checked_out[id(conn)] = db_pool
+    return conn
+
+
+def release_db_connection(conn):
+    """Returns a connection to the pool it came from, discarding it if it is broken."""
+    with _checked_out_lock:
+        db_pool = _checked_out.pop(id(conn), _primary)
+    db_pool.putconn(conn)
@@ -0,0 +1,161 @@
+"""Conditional requests and response compression for the Flask app.
+
+API data only changes when the loaders run, and each loader bumps the
+data_version row (see app/schema.py). Every GET under /api/ gets a weak ETag
+made from that version plus the request path and query string. A request
+whose If-None-Match already holds that tag is answered with 304 before the
+route runs. Large responses are compressed with brotli (when the optional
+brotli package is installed) or gzip, and the HTML pages get long-lived
+Cache-Control headers.
+"""
+import gzip
+import hashlib
+import threading
+import time
+
+import psycopg2
+from flask import current_app, g, request
+from werkzeug.http import is_resource_modified
+
+from app import config
+from app.db import get_db_connection, release_db_connection
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+# --- Data Version Cache ---
+# (version, updated_at) from the data_version table, re-read at most every
+# DATA_VERSION_TTL seconds per process.
+_version_lock = threading.Lock()
+_version_cache = {"value": None, "expires": 0.0}
+
+
+def get_data_version():
+    """Returns (version, updated_at), or None if the marker is unavailable."""
+    now = time.monotonic()
+    if now < _version_cache["expires"]:
+        return _version_cache["value"]
+
+    with _version_lock:
+        if now < _version_cache["expires"]:
+            return _version_cache["value"]
+        value = None
+        conn = None
+        try:
+            # Always the primary: replicas are judged against this version
+            conn = get_db_connection(readonly=False)
+            cur = conn.cursor()
+            cur.execute("SELECT version, updated_at FROM data_version;")
+            value = cur.fetchone()
+            cur.close()
+        except (Exception, psycopg2.Error) as e:
+            # Without a version the API is simply served without ETags
+            print(f"Error reading data version: {e}")
+        finally:
+            if conn:
+                release_db_connection(conn)
+        # Failures are cached too, so a missing table costs one query per TTL
+        _version_cache["value"] = tuple(value) if value else None
+        _version_cache["expires"] = time.monotonic() + config.DATA_VERSION_TTL
+        return _version_cache["value"]
+
+
+def reset_data_version_cache():
+    """Forgets the cached version so the next request re-reads it."""
+    with _version_lock:
+        _version_cache["value"] = None
+        _version_cache["expires"] = 0.0
+
+
+def make_api_etag(version, full_path):
+    """Builds the ETag value for an API URL at a given data version."""
+    digest = hashlib.sha1(full_path.encode("utf-8")).hexdigest()[:16]
+    return f"v{version}-{digest}"
+
+
+# --- Compression ---
+
+def choose_encoding():
+    """Picks the best encoding the client accepts, or None."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality("br") > 0:
+        return "br"
+    if accepted.quality("gzip") > 0:
+        return "gzip"
+    return None
+
+
+def compress_response(response):
+    """Compresses a buffered response body in place if it is worth it."""
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or "Content-Encoding" in response.headers):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < config.COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = choose_encoding()
+    if encoding == "br":
+        data = brotli.compress(data, quality=config.BROTLI_QUALITY)
+    elif encoding == "gzip":
+        data = gzip.compress(data, compresslevel=config.GZIP_LEVEL)
+    else:
+        return response
+
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+# --- Request Hooks ---
+
+def check_not_modified():
+    """Answers a GET /api/ request with 304 when the client's copy is current."""
+    if request.method not in ("GET", "HEAD") or not request.path.startswith("/api/"):
+        return None
+
+    data_version = get_data_version()
+    if data_version is None:
+        return None
+    version, updated_at = data_version
+
+    etag = make_api_etag(version, request.full_path)
+    g.api_etag = etag
+    g.api_last_modified = updated_at
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=updated_at):
+        response = current_app.response_class(status=304)
+        set_api_cache_headers(response, etag, updated_at)
+        return response
+    return None
+
+
+def set_api_cache_headers(response, etag, last_modified):
+    """Marks an API response as revalidatable against the data version."""
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    # Clients may keep the body but must revalidate before reusing it
+    response.headers["Cache-Control"] = "public, no-cache"
+
+
+def finalize_response(response):
+    """Adds caching headers and compresses the response."""
+    etag = g.get("api_etag")
+    if etag and response.status_code == 200 and not response.is_streamed:
+        set_api_cache_headers(response, etag, g.api_last_modified)
+    elif response.status_code == 200 and response.mimetype == "text/html":
+        response.headers["Cache-Control"] = f"public, max-age={config.TEMPLATE_MAX_AGE}"
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+    return compress_response(response)
+
+
+def init_http_cache(app):
+    """Registers the conditional request and compression hooks on the app."""
+    app.before_request(check_not_modified)
+    app.after_request(finalize_response)
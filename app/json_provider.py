@@ -0,0 +1,135 @@
+"""JSON serialization for API responses.
+
+The app registers one of two providers (see make_json_provider): an orjson
+provider when orjson is installed, or a stdlib fallback. Both understand the
+types psycopg2 hands back (Decimal, date/datetime and DictRow), so routes can
+return rows without converting every field by hand. Dates are written as ISO
+8601 strings (YYYY-MM-DD), which is what the frontend parses.
+
+For the largest responses there is also a passthrough mode where Postgres
+builds the JSON document itself (json_agg/row_to_json) and the text is sent
+to the client as-is, without materializing Python rows at all.
+"""
+import datetime
+import decimal
+import json
+
+import psycopg2.extras
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def default(o):
+    """Converts database types the encoders do not handle natively."""
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    if isinstance(o, psycopg2.extras.DictRow):
+        return dict(o)
+    if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+        return o.isoformat()
+    # orjson passes subclasses of builtins (OPT_PASSTHROUGH_SUBCLASS) here
+    if isinstance(o, dict):
+        return dict(o)
+    if isinstance(o, (list, tuple, set, frozenset)):
+        return list(o)
+    if isinstance(o, str):
+        return str(o)
+    if isinstance(o, int):
+        return int(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    Keys are not sorted (Flask's default provider sorts them), which is a
+    large part of the speedup on big responses.
+    """
+
+    option = (orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Hand orjson's bytes straight to the response, skipping the decode
+        data = orjson.dumps(obj, default=default, option=self.option)
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
+def _convert_rows(obj):
+    """Turns DictRows nested in lists/dicts into dicts.
+
+    DictRow subclasses list, so the stdlib encoder would write it as an
+    array without ever calling default().
+    """
+    if isinstance(obj, psycopg2.extras.DictRow):
+        return dict(obj)
+    if isinstance(obj, (list, tuple)):
+        return [_convert_rows(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _convert_rows(value) for key, value in obj.items()}
+    return obj
+
+
+class StdlibProvider(DefaultJSONProvider):
+    """Flask's default provider with ISO dates, Decimal and DictRow support."""
+
+    default = staticmethod(default)
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        return super().dumps(_convert_rows(obj), **kwargs)
+
+
+def make_json_provider(app, name='auto'):
+    """Builds the JSON provider named by config.JSON_PROVIDER.
+
+    'auto' uses orjson when it is installed and the stdlib provider otherwise.
+    """
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_PROVIDER=orjson but orjson is not installed")
+    if name in ('auto', 'orjson') and orjson is not None:
+        return OrjsonProvider(app)
+    return StdlibProvider(app)
+
+
+# --- Postgres-built JSON ---
+
+def json_array_sql(sql):
+    """Wraps a row-returning query so Postgres returns all of its rows as a
+    single JSON array (as text), one object per row keyed by column name.
+
+    Rows keep the order of the inner query's ORDER BY.
+    """
+    sql = sql.strip().rstrip(';')
+    return f"SELECT COALESCE(json_agg(q), '[]'::json)::text FROM ({sql}) q;"
+
+
+def fetch_json_text(cur, sql, params=None):
+    """Executes a query that returns one JSON text value and returns it."""
+    cur.execute(sql, params)
+    return cur.fetchone()[0]
+
+
+def json_text_response(app, text):
+    """Sends JSON text built by Postgres without re-encoding it."""
+    return app.response_class(text, mimetype="application/json")
+
+
+def dumps_line(obj):
+    """Serializes one NDJSON record with whichever encoder is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=OrjsonProvider.option).decode() + "\n"
+    return json.dumps(_convert_rows(obj), default=default) + "\n"
@@ -1,488 +1,497 @@
-import psycopg2
-import psycopg2.extras
-import os
-from flask import Flask, render_template, jsonify, request
-from app import config
-
-
-app = Flask(__name__)
-
-# --- TOPIC TO INDUSTRY MAPPING ---
-TOPIC_INDUSTRY_MAP = {
-    "Health": ["Health Professionals", "Pharmaceuticals", "Health Services", "Hospitals & Nursing Homes"],
-    "Finance": ["Real Estate", "Commercial Banks", "Securities & Investment", "Insurance", "Finance"],
-    "Technology": ["Telecom Services", "Internet", "Electronics"],
-    "Defense": ["Defense Aerospace"],
-    "Energy": ["Oil & Gas", "Electric Utilities", "Gas Utilities"],
-    "Law": ["Lawyers & Lobbyists", "Consulting", "Business Services"],
-    "Education": ["Education"],
-    "Foreign Relations": ["Pro-Israel"],
-    "Government Operations": ["Government"]
-}
-
-
-def get_db_connection():
-    """Establishes database connection."""
-    conn = psycopg2.connect(**config.conn_params)
-    cursor = conn.cursor()
-    cursor.execute("SET search_path TO pt, public;")
-    conn.commit()
-    cursor.close()
-    return conn
-
-@app.route('/')
-def index():
-    """Serves the main index.html file."""
-    return render_template('index.html')
-
-@app.route('/donor_search.html')
-def donor_search():
-    """Serves the donor_search.html file."""
-    return render_template('donor_search.html')
-
-# --- NEW ROUTE FOR FEEDBACK PAGE ---
-@app.route('/feedback.html')
-def feedback():
-    """Serves the feedback.html file."""
-    return render_template('feedback.html')
-# -----------------------------------
-
-@app.route('/api/politicians/search')
-def search_politicians():
-    """Searches for politicians by name."""
-    query = request.args.get('name', '')
-    if len(query) < 2:
-        return jsonify([])
-
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-      # Using 'Politicians' table name based on previous lack of error
-        sql = """
-            SELECT PoliticianID, FirstName, LastName, Party, State, Role, IsActive
-            FROM Politicians
-            WHERE (FirstName || ' ' || LastName) ILIKE %s
-            ORDER BY IsActive DESC, LastName, FirstName;
-        """
-        search_query = f"%{query}%"
-        cur.execute(sql, (search_query,))
-
-
-        politicians = cur.fetchall()
-
-        cur.close()
-        return jsonify([dict(p) for p in politicians])
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error searching politicians: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/politician/<int:politician_id>')
-def get_politician(politician_id):
-    """Gets a single politician by ID."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        sql = """
-            SELECT PoliticianID, FirstName, LastName, Party, State, Role, IsActive
-            FROM Politicians
-            WHERE PoliticianID = %s;
-        """
-        cur.execute(sql, (politician_id,))
-        politician = cur.fetchone()
-        cur.close()
-
-        if politician is None:
-            return jsonify({"error": "Politician not found"}), 404
-
-        # Format keys to lowercase to match the JavaScript
-        return jsonify({
-            "politicianid": politician['politicianid'],
-            "firstname": politician['firstname'],
-            "lastname": politician['lastname'],
-            "party": politician['party'],
-            "state": politician['state'],
-            "role": politician['role'],
-            "isactive": politician['isactive']
-        })
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching politician: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/donors/search')
-def search_donors_route():
-    """Searches for donors by name."""
-    query = request.args.get('name', '')
-    if len(query) < 3:  # Match the 3-char minimum from the frontend
-        return jsonify([])
-
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        # Query the 'Donors' table
-        sql = """
-            SELECT DonorID, Name, DonorType, Employer, State
-            FROM Donors
-            WHERE Name ILIKE %s
-            ORDER BY Name;
-        """
-        search_query = f"%{query}%"
-        cur.execute(sql, (search_query,))
-        donors = cur.fetchall()
-        cur.close()
-
-        # Format the keys to be lowercase to match the JavaScript
-        donor_list = []
-        for d in donors:
-            donor_list.append({
-                "donorid": d['donorid'],
-                "name": d['name'],
-                "donortype": d['donortype'],
-                "employer": d['employer'],
-                "state": d['state']
-            })
-            
-        return jsonify(donor_list)
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error searching donors: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/donor/<int:donor_id>')
-def get_donor(donor_id):
-    """Gets a single donor by ID."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        sql = """
-            SELECT DonorID, Name, DonorType, Employer, State
-            FROM Donors
-            WHERE DonorID = %s;
-        """
-        cur.execute(sql, (donor_id,))
-        donor = cur.fetchone()
-        cur.close()
-
-        if donor is None:
-            return jsonify({"error": "Donor not found"}), 404
-
-        # Format keys to lowercase to match the JavaScript
-        return jsonify({
-            "donorid": donor['donorid'],
-            "name": donor['name'],
-            "donortype": donor['donortype'],
-            "employer": donor['employer'],
-            "state": donor['state']
-        })
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching donor: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/donor/<int:donor_id>/donations')
-def get_donor_contributions(donor_id):
-    """Gets all donations for a specific donor, joined with politician info."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        # Join donations with politicians to get the recipient's info
-        # Using lowercase table names 'donations' and 'politicians'
-        # based on your other routes
-        sql = """
-            SELECT 
-                t.Amount, 
-                t.Date,
-                p.FirstName, 
-                p.LastName, 
-                p.Party, 
-                p.State
-            FROM donations t
-            JOIN Politicians p ON t.PoliticianID = p.PoliticianID
-            WHERE t.DonorID = %s
-            ORDER BY t.Date DESC, t.Amount DESC;
-        """
-        cur.execute(sql, (donor_id,))
-        donations = cur.fetchall()
-        cur.close()
-
-        # Format the list to match what the frontend JavaScript expects
-        donation_list = []
-        for d in donations:
-            donation_list.append({
-                # Ensure amount is a float for JSON
-                "amount": float(d['amount']), 
-                "date": d['date'],
-                "firstname": d['firstname'],
-                "lastname": d['lastname'],
-                "party": d['party'],
-                "state": d['state']
-            })
-        
-        return jsonify(donation_list)
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching donor contributions: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/politician/<int:politician_id>/votes')
-def get_politician_votes(politician_id):
-    """Gets paginated and filtered vote history for a politician."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        page = int(request.args.get('page', 1))
-        per_page = 10
-        offset = (page - 1) * per_page
-        sort_order = request.args.get('sort', 'desc').upper()
-        if sort_order not in ['ASC', 'DESC']:
-            sort_order = 'DESC'
-
-        bill_types = request.args.getlist('type') # e.g., ['hr', 's']
-        bill_subjects = request.args.getlist('subject')
-
-        where_clauses = ["v.PoliticianID = %s"]
-        params = [politician_id]
-
-        # Bill type mapping from frontend format to database format
-        BILL_TYPE_MAP = {
-            'hr': 'H.R.%',
-            's': 'S.%',
-            'hjres': 'H.J.Res.%',
-            'sjres': 'S.J.Res.%',
-            'hconres': 'H.Con.Res.%',
-            'sconres': 'S.Con.Res.%',
-            'hres': 'H.Res.%',
-            'sres': 'S.Res.%'
-        }
-
-        if bill_types:
-            # Build OR conditions for bill numbers starting with the types
-            # Example: "(b.BillNumber ILIKE 'H.R.%' OR b.BillNumber ILIKE 'S.%')"
-            type_conditions = []
-            for bill_type in bill_types:
-                # Map lowercase type to actual bill number format
-                pattern = BILL_TYPE_MAP.get(bill_type.lower())
-                if pattern:
-                    type_conditions.append("b.BillNumber ILIKE %s")
-                    params.append(pattern)
-
-            # Only add filter if we have valid bill types
-            if type_conditions:
-                where_clauses.append(f"({' OR '.join(type_conditions)})")
-
-        if bill_subjects:
-            where_clauses.append("b.subjects && %s")
-            params.append(bill_subjects)
-
-        where_sql = " AND ".join(where_clauses)
-
-        count_sql = f"SELECT COUNT(*) FROM votes v JOIN bills b ON v.BillID = b.BillID WHERE {where_sql};"
-        # Make sure params are passed as a tuple
-        cur.execute(count_sql, tuple(params))
-        total_votes = cur.fetchone()['count']
-        total_pages = (total_votes + per_page - 1) // per_page
-
-        # Selecting columns that exist in your tables
-        data_sql = f"""
-            SELECT v.VoteID, v.vote, b.BillNumber, b.Title, b.DateIntroduced, b.subjects
-            FROM votes v
-            JOIN bills b ON v.BillID = b.BillID
-            WHERE {where_sql}
-            ORDER BY b.DateIntroduced {sort_order}
-            LIMIT %s OFFSET %s;
-        """
-        # Create a new list for data query params including limit and offset
-        data_params = list(params)
-        data_params.extend([per_page, offset])
-
-        cur.execute(data_sql, tuple(data_params))
-        votes_data = cur.fetchall()
-
-        votes_list = []
-        for row in votes_data:
-            # Convert date to ISO format string for consistent API response
-            date_introduced = row['dateintroduced']
-            if hasattr(date_introduced, 'isoformat'):
-                date_introduced = date_introduced.isoformat()
-
-            votes_list.append({
-                "VoteID": row['voteid'],
-                "Vote": row['vote'],
-                "BillNumber": row['billnumber'],
-                "Title": row['title'],
-                "DateIntroduced": date_introduced,
-                "subjects": row['subjects']
-            })
-
-        cur.close()
-
-        return jsonify({
-            "pagination": {
-                "currentPage": page,
-                "totalPages": total_pages,
-                "totalVotes": total_votes
-            },
-            "votes": votes_list
-        })
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching votes: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/politician/<int:politician_id>/donations/summary')
-def get_donation_summary(politician_id):
-    """Gets UNFILTERED donation summary, grouped by INDUSTRY."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        # --- CORRECTED: Use lowercase 'donations' table name ---
-        # Assuming 'donors' table name is also lowercase
-        sql = """
-            SELECT d.Industry, SUM(t.Amount) AS TotalAmount
-            FROM donations t
-            JOIN donors d ON t.DonorID = d.DonorID
-            WHERE t.PoliticianID = %s
-            GROUP BY d.Industry
-            HAVING d.Industry IS NOT NULL
-            ORDER BY TotalAmount DESC;
-        """
-
-        cur.execute(sql, (politician_id,))
-        summary_data = cur.fetchall()
-
-        summary_list = [
-            # Assuming Industry and Amount column names are correct
-            {"industry": row['industry'] or 'Other', "totalamount": float(row['totalamount'])}
-            for row in summary_data
-        ]
-
-        cur.close()
-        return jsonify(summary_list)
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching donation summary: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/politician/<int:politician_id>/donations/summary/filtered')
-def get_filtered_donation_summary(politician_id):
-    """Gets donation summary filtered by a bill topic."""
-    topic = request.args.get('topic')
-    if not topic:
-        return jsonify({"error": "No topic specified"}), 400
-
-    industries = TOPIC_INDUSTRY_MAP.get(topic)
-    if not industries:
-        return jsonify([])
-
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-
-        # --- CORRECTED: Use lowercase 'donations' table name ---
-        # Assuming 'donors' table name is also lowercase
-        sql = """
-            SELECT d.Industry, SUM(t.Amount) AS TotalAmount
-            FROM donations t
-            JOIN donors d ON t.DonorID = d.DonorID
-            WHERE t.PoliticianID = %s
-            AND d.Industry = ANY(%s)
-            GROUP BY d.Industry
-            HAVING d.Industry IS NOT NULL
-            ORDER BY TotalAmount DESC;
-        """
-
-        cur.execute(sql, (politician_id, industries))
-        summary_data = cur.fetchall()
-
-        summary_list = [
-            # Assuming Industry and Amount column names are correct
-            {"industry": row['industry'], "totalamount": float(row['totalamount'])}
-            for row in summary_data
-        ]
-
-        cur.close()
-        return jsonify(summary_list)
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching filtered donation summary: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-@app.route('/api/bills/subjects')
-def get_all_bill_subjects():
-    """Gets all unique bill subjects from the Bills table."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-        
-        # Use UNNEST to expand the 'subjects' array column,
-        # get all distinct non-null subjects, and order them.
-        sql = """
-            SELECT DISTINCT UNNEST(subjects) AS subject 
-            FROM Bills 
-            WHERE subjects IS NOT NULL AND subjects != '{}'
-            ORDER BY subject;
-        """
-        cur.execute(sql)
-        results = cur.fetchall()
-        
-        # Convert the list of dicts ([{'subject': 'Health'}, ...])
-        # into a simple list of strings (['Health', ...])
-        subject_list = [row['subject'] for row in results] 
-        
-        cur.close()
-        return jsonify(subject_list) # Flask automatically returns this as JSON
-
-    except (Exception, psycopg2.Error) as e:
-        print(f"Error fetching bill subjects: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
-
-
-if __name__ == "__main__":
-    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=debug_mode)
+import psycopg2
+from psycopg2.errors import QueryCanceled
+from psycopg2.pool import PoolError
+import os
+import io
+import csv
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+from app import config
+from app.db import get_db_connection, release_db_connection, record_timeout, TimedDictCursor
+from app.json_provider import make_json_provider, json_array_sql, fetch_json_text, json_text_response, dumps_line
+from app.http_cache import init_http_cache
+from app.metrics import init_metrics
+# SQL, limits and response shaping shared with app/async_main.py
+from app.queries import (
+    TOPIC_INDUSTRY_MAP, EXPORT_FETCH_SIZE, EXPORT_CHUNK_ROWS, DONATION_EXPORT_FIELDS,
+    SEARCH_POLITICIANS_SQL, POLITICIAN_BY_ID_SQL, POLITICIANS_BY_IDS_SQL, VOTE_COUNTS_SQL,
+    SEARCH_DONORS_SQL, DONOR_BY_ID_SQL, DONORS_BY_IDS_SQL, DONOR_CONTRIBUTIONS_SQL, DONOR_DONATION_COUNT_SQL,
+    DONATION_SUMMARY_SQL, FILTERED_DONATION_SUMMARY_SQL, BILL_SUBJECTS_SQL,
+    parse_id_list, parse_donation_page_args, parse_top_n,
+    format_politician, format_donor, format_donation, format_industry_total, order_batch,
+    donation_page, politician_profile, vote_page_queries, vote_page, vote_page_json_query
+)
+
+
+app = Flask(__name__)
+app.json = make_json_provider(app, config.JSON_PROVIDER)
+# Metrics first: their after_request hook then runs last and sees the final response
+init_metrics(app)
+init_http_cache(app)
+
+def db_error_response(e, message):
+    """Logs a failed route and builds its JSON error response.
+
+    A query cancelled by its statement_timeout, or a request that waited too
+    long for a pooled connection, gets a 503 with a Retry-After hint and is
+    counted against the route. Anything else is a 500.
+    """
+    print(f"{message}: {e}")
+    if isinstance(e, (QueryCanceled, PoolError)):
+        record_timeout(request.endpoint, 'statement' if isinstance(e, QueryCanceled) else 'pool')
+        response = jsonify({
+            "error": "The request took too long, please retry shortly",
+            "retryAfter": config.RETRY_AFTER_SECONDS
+        })
+        response.headers['Retry-After'] = str(config.RETRY_AFTER_SECONDS)
+        return response, 503
+    return jsonify({"error": str(e)}), 500
+
+def fetch_politician(cur, politician_id):
+    """Fetches a single Politicians row by ID, or None."""
+    cur.execute(POLITICIAN_BY_ID_SQL, (politician_id,))
+    return cur.fetchone()
+
+def fetch_vote_page(cur, politician_id, page=1, sort_order='DESC', bill_types=None, bill_subjects=None):
+    """Fetches one page of a politician's vote history with pagination info."""
+    count_sql, count_params, data_sql, data_params = vote_page_queries(
+        politician_id, page, sort_order, bill_types, bill_subjects)
+    cur.execute(count_sql, count_params)
+    total_votes = cur.fetchone()['count']
+    cur.execute(data_sql, data_params)
+    return vote_page(page, total_votes, cur.fetchall())
+
+def fetch_vote_page_json(cur, politician_id, page=1, sort_order='DESC', bill_types=None, bill_subjects=None):
+    """Same response as fetch_vote_page, but built as JSON text by Postgres."""
+    sql, params = vote_page_json_query(politician_id, page, sort_order, bill_types, bill_subjects)
+    return fetch_json_text(cur, sql, params)
+
+def fetch_donation_summary(cur, politician_id):
+    """Fetches a politician's donation totals grouped by industry, largest first."""
+    cur.execute(DONATION_SUMMARY_SQL, (politician_id,))
+    return [format_industry_total(row) for row in cur.fetchall()]
+
+@app.route('/')
+def index():
+    """Serves the main index.html file."""
+    return render_template('index.html')
+
+@app.route('/donor_search.html')
+def donor_search():
+    """Serves the donor_search.html file."""
+    return render_template('donor_search.html')
+
+# --- NEW ROUTE FOR FEEDBACK PAGE ---
+@app.route('/feedback.html')
+def feedback():
+    """Serves the feedback.html file."""
+    return render_template('feedback.html')
+# -----------------------------------
+
+@app.route('/api/politicians/search')
+def search_politicians():
+    """Searches for politicians by name."""
+    query = request.args.get('name', '')
+    if len(query) < 2:
+        return jsonify([])
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        search_query = f"%{query}%"
+        cur.execute(SEARCH_POLITICIANS_SQL, (search_query,))
+
+
+        politicians = cur.fetchall()
+
+        cur.close()
+        return jsonify([dict(p) for p in politicians])
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error searching politicians")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politician/<int:politician_id>')
+def get_politician(politician_id):
+    """Gets a single politician by ID."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        politician = fetch_politician(cur, politician_id)
+        cur.close()
+
+        if politician is None:
+            return jsonify({"error": "Politician not found"}), 404
+
+        return jsonify(format_politician(politician))
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching politician")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politicians')
+def get_politicians_batch():
+    """Gets many politicians by ID in one query, e.g. /api/politicians?ids=1,2,3."""
+    ids, error = parse_id_list(request.args.get('ids'))
+    if error:
+        return jsonify({"error": error}), 400
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        cur.execute(POLITICIANS_BY_IDS_SQL, (ids,))
+        # Return results in the order the IDs were requested
+        politician_list, missing = order_batch(ids, cur.fetchall(), 'politicianid', format_politician)
+        cur.close()
+
+        return jsonify({"politicians": politician_list, "missing": missing})
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching politicians batch")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/donors/search')
+def search_donors_route():
+    """Searches for donors by name."""
+    query = request.args.get('name', '')
+    if len(query) < 3:  # Match the 3-char minimum from the frontend
+        return jsonify([])
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        search_query = f"%{query}%"
+        cur.execute(SEARCH_DONORS_SQL, (search_query,))
+        donors = cur.fetchall()
+        cur.close()
+
+        # DictCursor keys are already lowercase, matching the JavaScript
+        return jsonify(donors)
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error searching donors")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/donor/<int:donor_id>')
+def get_donor(donor_id):
+    """Gets a single donor by ID."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        cur.execute(DONOR_BY_ID_SQL, (donor_id,))
+        donor = cur.fetchone()
+        cur.close()
+
+        if donor is None:
+            return jsonify({"error": "Donor not found"}), 404
+
+        return jsonify(format_donor(donor))
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching donor")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/donors')
+def get_donors_batch():
+    """Gets many donors by ID in one query, e.g. /api/donors?ids=1,2,3."""
+    ids, error = parse_id_list(request.args.get('ids'))
+    if error:
+        return jsonify({"error": error}), 400
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        cur.execute(DONORS_BY_IDS_SQL, (ids,))
+        # Return results in the order the IDs were requested
+        donor_list, missing = order_batch(ids, cur.fetchall(), 'donorid', format_donor)
+        cur.close()
+
+        return jsonify({"donors": donor_list, "missing": missing})
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching donors batch")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+def stream_donor_contributions(donor_id, export_format):
+    """Streams a donor's full contribution history as NDJSON or CSV.
+
+    Rows are read through a server-side (named) cursor EXPORT_FETCH_SIZE at a
+    time and written out in chunks, so memory stays flat however many
+    donations the donor has. The pooled connection is held until the stream
+    finishes or the client disconnects.
+    """
+    conn = get_db_connection()
+    released = []
+
+    def release():
+        if not released:
+            released.append(True)
+            release_db_connection(conn)
+
+    def generate():
+        try:
+            cur = conn.cursor(name=f"donor_export_{donor_id}", cursor_factory=TimedDictCursor)
+            cur.itersize = EXPORT_FETCH_SIZE
+            cur.execute(DONOR_CONTRIBUTIONS_SQL + ";", (donor_id,))
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if export_format == 'csv':
+                writer.writerow(DONATION_EXPORT_FIELDS)
+
+            for i, row in enumerate(cur, start=1):
+                d = format_donation(row)
+                if export_format == 'csv':
+                    writer.writerow([d[field] for field in DONATION_EXPORT_FIELDS])
+                else:
+                    buffer.write(dumps_line(d))
+                if i % EXPORT_CHUNK_ROWS == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0); buffer.truncate()
+
+            if buffer.tell():
+                yield buffer.getvalue()
+            cur.close()
+        except (Exception, psycopg2.Error) as e:
+            # Headers are already sent, so the stream just ends early
+            if isinstance(e, QueryCanceled):
+                record_timeout(request.endpoint, 'statement')
+            print(f"Error streaming donor contributions: {e}")
+        finally:
+            release()
+
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f"attachment; filename=donor_{donor_id}_donations.{export_format}"
+    response.call_on_close(release)
+    return response
+
+@app.route('/api/donor/<int:donor_id>/donations')
+def get_donor_contributions(donor_id):
+    """Gets donations for a specific donor, joined with politician info.
+
+    By default returns the full list. ?page=N (with optional per_page) returns
+    one page plus pagination info, and ?format=ndjson|csv streams the full
+    history as a download.
+    """
+    export_format = request.args.get('format', 'json').lower()
+    if export_format in ('ndjson', 'csv'):
+        try:
+            return stream_donor_contributions(donor_id, export_format)
+        except (Exception, psycopg2.Error) as e:
+            return db_error_response(e, "Error exporting donor contributions")
+    if export_format != 'json':
+        return jsonify({"error": f"Unsupported format: {export_format}"}), 400
+
+    paginated, page, per_page, error = parse_donation_page_args(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        if config.PG_JSON_PASSTHROUGH:
+            cur.close()
+            cur = conn.cursor()
+            sql = DONOR_CONTRIBUTIONS_SQL
+            params = (donor_id,)
+            if paginated:
+                sql += " LIMIT %s OFFSET %s"
+                params = (donor_id, per_page, (page - 1) * per_page)
+            donations_json = fetch_json_text(cur, json_array_sql(sql), params)
+            if paginated:
+                cur.execute(DONOR_DONATION_COUNT_SQL, (donor_id,))
+                pagination = donation_page(page, per_page, cur.fetchone()[0], [])["pagination"]
+                donations_json = f'{{"pagination":{app.json.dumps(pagination)},"donations":{donations_json}}}'
+            cur.close()
+            return json_text_response(app, donations_json)
+
+        if not paginated:
+            cur.execute(DONOR_CONTRIBUTIONS_SQL + ";", (donor_id,))
+            donations = cur.fetchall()
+            cur.close()
+            return jsonify([format_donation(d) for d in donations])
+
+        cur.execute(DONOR_DONATION_COUNT_SQL, (donor_id,))
+        total_donations = cur.fetchone()['count']
+
+        cur.execute(DONOR_CONTRIBUTIONS_SQL + " LIMIT %s OFFSET %s;", (donor_id, per_page, (page - 1) * per_page))
+        donations = cur.fetchall()
+        cur.close()
+
+        return jsonify(donation_page(page, per_page, total_donations, donations))
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching donor contributions")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politician/<int:politician_id>/votes')
+def get_politician_votes(politician_id):
+    """Gets paginated and filtered vote history for a politician."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        page = int(request.args.get('page', 1))
+        sort_order = request.args.get('sort', 'desc').upper()
+        bill_types = request.args.getlist('type') # e.g., ['hr', 's']
+        bill_subjects = request.args.getlist('subject')
+
+        if config.PG_JSON_PASSTHROUGH:
+            vote_page_json = fetch_vote_page_json(cur, politician_id, page, sort_order, bill_types, bill_subjects)
+            cur.close()
+            return json_text_response(app, vote_page_json)
+
+        votes = fetch_vote_page(cur, politician_id, page, sort_order, bill_types, bill_subjects)
+        cur.close()
+
+        return jsonify(votes)
+
+    except (Exception, psycopg2.Error) as e:
+        import traceback
+        traceback.print_exc()
+        return db_error_response(e, "Error fetching votes")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politician/<int:politician_id>/donations/summary')
+def get_donation_summary(politician_id):
+    """Gets UNFILTERED donation summary, grouped by INDUSTRY."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        summary_list = fetch_donation_summary(cur, politician_id)
+
+        cur.close()
+        return jsonify(summary_list)
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching donation summary")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politician/<int:politician_id>/profile')
+def get_politician_profile(politician_id):
+    """Gets everything the politician detail view needs for its first render.
+
+    Returns the politician record, the first page of votes, the top-N industry
+    totals (with the remainder rolled up), and a count per vote type, all
+    queried over a single pooled connection.
+    """
+    top_n, error = parse_top_n(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        politician = fetch_politician(cur, politician_id)
+        if politician is None:
+            cur.close()
+            return jsonify({"error": "Politician not found"}), 404
+
+        votes = fetch_vote_page(cur, politician_id)
+        summary_list = fetch_donation_summary(cur, politician_id)
+
+        cur.execute(VOTE_COUNTS_SQL, (politician_id,))
+        vote_counts = cur.fetchall()
+        cur.close()
+
+        return jsonify(politician_profile(politician, votes, summary_list, vote_counts, top_n))
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching politician profile")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/politician/<int:politician_id>/donations/summary/filtered')
+def get_filtered_donation_summary(politician_id):
+    """Gets donation summary filtered by a bill topic."""
+    topic = request.args.get('topic')
+    if not topic:
+        return jsonify({"error": "No topic specified"}), 400
+
+    industries = TOPIC_INDUSTRY_MAP.get(topic)
+    if not industries:
+        return jsonify([])
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        cur.execute(FILTERED_DONATION_SUMMARY_SQL, (politician_id, industries))
+        summary_list = [format_industry_total(row) for row in cur.fetchall()]
+
+        cur.close()
+        return jsonify(summary_list)
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching filtered donation summary")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@app.route('/api/bills/subjects')
+def get_all_bill_subjects():
+    """Gets all unique bill subjects from the Bills table."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor(cursor_factory=TimedDictCursor)
+
+        cur.execute(BILL_SUBJECTS_SQL)
+        results = cur.fetchall()
+        
+        # Convert the list of dicts ([{'subject': 'Health'}, ...])
+        # into a simple list of strings (['Health', ...])
+        subject_list = [row['subject'] for row in results] 
+        
+        cur.close()
+        return jsonify(subject_list) # Flask automatically returns this as JSON
+
+    except (Exception, psycopg2.Error) as e:
+        return db_error_response(e, "Error fetching bill subjects")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+
+if __name__ == "__main__":
+    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=debug_mode)
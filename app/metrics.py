@@ -0,0 +1,162 @@
+"""Per-route request instrumentation exposed in Prometheus text format.
+
+Every request records its wall time, the time spent in database calls, the
+rows those calls returned, the response size and whether it was answered
+from the client's cache (a 304 from app/http_cache.py). Each is kept as a
+histogram per route and served from /metrics. Responses also carry a
+Server-Timing header with the db/app split for browser devtools.
+
+Database time is measured by the Timed* cursor classes in app/db.py, which
+every pooled connection uses. Metrics are per process, so with several
+gunicorn workers each one reports its own share.
+"""
+import bisect
+import threading
+import time
+
+from flask import g, request
+
+from app.db import get_replica_status, get_timeout_counts
+
+
+# --- Histograms ---
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """A Prometheus histogram with one series per route."""
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.series = {}  # route -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, route, value):
+        counts = self.series.setdefault(route, [0] * (len(self.buckets) + 1) + [0.0])
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for route, counts in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+            cumulative += counts[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{route="{route}",le="+Inf"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{route="{route}"}} {counts[-1]}')
+            lines.append(f'{self.name}_count{{route="{route}"}} {cumulative}')
+        return lines
+
+
+_lock = threading.Lock()
+_histograms = {
+    "duration": Histogram("http_request_duration_seconds", "Request wall time per route.", DURATION_BUCKETS),
+    "db": Histogram("http_request_db_seconds", "Time spent in database calls per request.", DURATION_BUCKETS),
+    "rows": Histogram("http_response_db_rows", "Database rows returned per request.", ROW_BUCKETS),
+    "bytes": Histogram("http_response_bytes", "Response body size per request (after compression).", BYTE_BUCKETS),
+}
+_requests = {}    # (route, status) -> count
+_cache_hits = {}  # route -> count of 304 responses
+
+
+def _route():
+    """Returns the URL rule of the current request, e.g. /api/donor/<int:donor_id>."""
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+
+# --- Request Hooks ---
+
+def start_timer():
+    """Starts the request clock and resets the DB counters."""
+    g.request_start = time.perf_counter()
+    g.db_time = 0.0
+    g.db_queries = 0
+    g.db_rows = 0
+
+
+def record_request(response):
+    """Records the request's metrics and adds the Server-Timing header."""
+    start = g.get("request_start")
+    if start is None:
+        return response
+    elapsed = time.perf_counter() - start
+    db_time = g.get("db_time", 0.0)
+    route = _route()
+
+    if response.is_streamed:
+        # Streamed bodies have no size yet; count what is known up front
+        size = response.content_length or 0
+    else:
+        size = len(response.get_data())
+
+    with _lock:
+        _histograms["duration"].observe(route, elapsed)
+        _histograms["db"].observe(route, db_time)
+        _histograms["rows"].observe(route, g.get("db_rows", 0))
+        _histograms["bytes"].observe(route, size)
+        key = (route, response.status_code)
+        _requests[key] = _requests.get(key, 0) + 1
+        if response.status_code == 304:
+            _cache_hits[route] = _cache_hits.get(route, 0) + 1
+
+    response.headers["Server-Timing"] = (
+        f'db;dur={db_time * 1000:.1f};desc="{g.get("db_queries", 0)} queries", '
+        f'app;dur={(elapsed - db_time) * 1000:.1f}, '
+        f'total;dur={elapsed * 1000:.1f}'
+    )
+    return response
+
+
+def render_metrics():
+    """Returns all metrics in the Prometheus text exposition format."""
+    with _lock:
+        lines = []
+        for histogram in _histograms.values():
+            lines.extend(histogram.render())
+
+        lines.append("# HELP http_requests_total Requests per route and status code.")
+        lines.append("# TYPE http_requests_total counter")
+        for (route, status), count in sorted(_requests.items()):
+            lines.append(f'http_requests_total{{route="{route}",status="{status}"}} {count}')
+
+        lines.append("# HELP http_cache_hits_total Requests answered with 304 Not Modified.")
+        lines.append("# TYPE http_cache_hits_total counter")
+        for route, count in sorted(_cache_hits.items()):
+            lines.append(f'http_cache_hits_total{{route="{route}"}} {count}')
+
+    lines.append("# HELP db_timeouts_total Statement and pool timeouts per endpoint.")
+    lines.append("# TYPE db_timeouts_total counter")
+    for (endpoint, kind), count in sorted(get_timeout_counts().items(), key=str):
+        lines.append(f'db_timeouts_total{{endpoint="{endpoint}",kind="{kind}"}} {count}')
+
+    status = get_replica_status()
+    lines.append("# HELP db_pool_checkouts_total Connections checked out per database server.")
+    lines.append("# TYPE db_pool_checkouts_total counter")
+    for db_pool in status:
+        lines.append(f'db_pool_checkouts_total{{pool="{db_pool["name"]}"}} {db_pool["checkouts"]}')
+    lines.append("# HELP db_replica_healthy Whether a read replica is currently used (1) or skipped (0).")
+    lines.append("# TYPE db_replica_healthy gauge")
+    for db_pool in status[1:]:
+        lines.append(f'db_replica_healthy{{pool="{db_pool["name"]}"}} {int(db_pool["healthy"])}')
+    return "\n".join(lines) + "\n"
+
+
+def init_metrics(app):
+    """Registers the instrumentation hooks and the /metrics route.
+
+    Call before init_http_cache() so the timer starts first and the metrics
+    see the final, compressed response.
+    """
+    app.before_request(start_timer)
+    app.after_request(record_request)
+
+    @app.route('/metrics')
+    def metrics():
+        """Serves request metrics in Prometheus text format."""
+        return app.response_class(render_metrics(), mimetype="text/plain; version=0.0.4")
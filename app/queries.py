@@ -0,0 +1,372 @@
+"""SQL and response shaping shared by the API entry points.
+
+app/main.py (Flask + psycopg2) and app/async_main.py (Quart + psycopg 3)
+serve the same /api/* routes. Both drivers use %s placeholders and return
+rows keyed by lowercase column name, so the queries and the functions that
+turn rows into response dicts live here and only the I/O differs.
+"""
+
+# --- TOPIC TO INDUSTRY MAPPING ---
+TOPIC_INDUSTRY_MAP = {
+    "Health": ["Health Professionals", "Pharmaceuticals", "Health Services", "Hospitals & Nursing Homes"],
+    "Finance": ["Real Estate", "Commercial Banks", "Securities & Investment", "Insurance", "Finance"],
+    "Technology": ["Telecom Services", "Internet", "Electronics"],
+    "Defense": ["Defense Aerospace"],
+    "Energy": ["Oil & Gas", "Electric Utilities", "Gas Utilities"],
+    "Law": ["Lawyers & Lobbyists", "Consulting", "Business Services"],
+    "Education": ["Education"],
+    "Foreign Relations": ["Pro-Israel"],
+    "Government Operations": ["Government"]
+}
+
+# --- BILL TYPE CODES ---
+# Values accepted by the votes endpoint's 'type' filter, matching the
+# BillType column of politician_vote_timeline (see app/schema.py).
+BILL_TYPE_CODES = {'hr', 's', 'hjres', 'sjres', 'hconres', 'sconres', 'hres', 'sres'}
+
+# Maximum number of IDs accepted by the batch lookup endpoints
+MAX_BATCH_IDS = 100
+
+# Vote history page size, and the default/maximum number of industries
+# returned by the politician profile endpoint
+VOTES_PER_PAGE = 10
+PROFILE_TOP_INDUSTRIES = 10
+PROFILE_MAX_INDUSTRIES = 50
+
+# Donor contribution paging, and the server-side cursor batch size and
+# rows-per-chunk used when streaming an export
+DONATIONS_PER_PAGE = 100
+MAX_DONATIONS_PER_PAGE = 500
+EXPORT_FETCH_SIZE = 2000
+EXPORT_CHUNK_ROWS = 500
+DONATION_EXPORT_FIELDS = ["amount", "date", "firstname", "lastname", "party", "state"]
+
+
+# --- Politicians ---
+
+SEARCH_POLITICIANS_SQL = """
+    SELECT PoliticianID, FirstName, LastName, Party, State, Role, IsActive
+    FROM Politicians
+    WHERE (FirstName || ' ' || LastName) ILIKE %s
+    ORDER BY IsActive DESC, LastName, FirstName;
+"""
+
+POLITICIAN_BY_ID_SQL = """
+    SELECT PoliticianID, FirstName, LastName, Party, State, Role, IsActive
+    FROM Politicians
+    WHERE PoliticianID = %s;
+"""
+
+POLITICIANS_BY_IDS_SQL = """
+    SELECT PoliticianID, FirstName, LastName, Party, State, Role, IsActive
+    FROM Politicians
+    WHERE PoliticianID = ANY(%s);
+"""
+
+VOTE_COUNTS_SQL = """
+    SELECT Vote, COUNT(*) AS Total
+    FROM politician_vote_timeline
+    WHERE PoliticianID = %s
+    GROUP BY Vote;
+"""
+
+# --- Donors ---
+
+SEARCH_DONORS_SQL = """
+    SELECT DonorID, Name, DonorType, Employer, State
+    FROM Donors
+    WHERE Name ILIKE %s
+    ORDER BY Name;
+"""
+
+DONOR_BY_ID_SQL = """
+    SELECT DonorID, Name, DonorType, Employer, State
+    FROM Donors
+    WHERE DonorID = %s;
+"""
+
+DONORS_BY_IDS_SQL = """
+    SELECT DonorID, Name, DonorType, Employer, State
+    FROM Donors
+    WHERE DonorID = ANY(%s);
+"""
+
+# Join donations with politicians to get the recipient's info. Callers
+# append LIMIT/OFFSET as needed.
+DONOR_CONTRIBUTIONS_SQL = """
+    SELECT t.Amount, t.Date, p.FirstName, p.LastName, p.Party, p.State
+    FROM donations t
+    JOIN Politicians p ON t.PoliticianID = p.PoliticianID
+    WHERE t.DonorID = %s
+    ORDER BY t.Date DESC, t.Amount DESC, t.DonationID DESC
+"""
+
+DONOR_DONATION_COUNT_SQL = "SELECT COUNT(*) AS count FROM donations WHERE DonorID = %s;"
+
+# --- Donation Summaries ---
+
+DONATION_SUMMARY_SQL = """
+    SELECT d.Industry, SUM(t.Amount) AS TotalAmount
+    FROM donations t
+    JOIN donors d ON t.DonorID = d.DonorID
+    WHERE t.PoliticianID = %s
+    GROUP BY d.Industry
+    HAVING d.Industry IS NOT NULL
+    ORDER BY TotalAmount DESC;
+"""
+
+FILTERED_DONATION_SUMMARY_SQL = """
+    SELECT d.Industry, SUM(t.Amount) AS TotalAmount
+    FROM donations t
+    JOIN donors d ON t.DonorID = d.DonorID
+    WHERE t.PoliticianID = %s
+    AND d.Industry = ANY(%s)
+    GROUP BY d.Industry
+    HAVING d.Industry IS NOT NULL
+    ORDER BY TotalAmount DESC;
+"""
+
+# --- Bills ---
+
+# Use UNNEST to expand the 'subjects' array column,
+# get all distinct non-null subjects, and order them.
+BILL_SUBJECTS_SQL = """
+    SELECT DISTINCT UNNEST(subjects) AS subject
+    FROM Bills
+    WHERE subjects IS NOT NULL AND subjects != '{}'
+    ORDER BY subject;
+"""
+
+
+# --- Request Parsing ---
+
+def parse_id_list(raw_ids):
+    """Parses a comma-separated 'ids' parameter into a de-duplicated list of ints.
+
+    Returns (ids, error_message); request order is preserved.
+    """
+    ids = {}  # dict keys keep insertion order
+    for part in (raw_ids or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        # isdecimal, not isdigit: int() rejects digits like '²'
+        if not part.isdecimal():
+            return None, f"Invalid id: {part}"
+        ids[int(part)] = None
+        if len(ids) > MAX_BATCH_IDS:
+            return None, f"Too many ids (maximum {MAX_BATCH_IDS})"
+    if not ids:
+        return None, "No ids specified"
+    return list(ids), None
+
+def parse_donation_page_args(args):
+    """Reads ?page=/&per_page= for donor contributions.
+
+    Returns (paginated, page, per_page, error_message).
+    """
+    if 'page' not in args:
+        return False, None, None, None
+    try:
+        page = int(args.get('page', 1))
+        per_page = int(args.get('per_page', DONATIONS_PER_PAGE))
+    except ValueError:
+        return True, None, None, "page and per_page must be integers"
+    if page < 1 or per_page < 1:
+        return True, None, None, "page and per_page must be positive"
+    return True, page, min(per_page, MAX_DONATIONS_PER_PAGE), None
+
+def parse_top_n(args):
+    """Reads ?top= for the profile endpoint. Returns (top_n, error_message)."""
+    try:
+        top_n = int(args.get('top', PROFILE_TOP_INDUSTRIES))
+    except ValueError:
+        return None, "top must be an integer"
+    return max(1, min(top_n, PROFILE_MAX_INDUSTRIES)), None
+
+
+# --- Response Shaping ---
+
+def format_politician(politician):
+    """Formats a Politicians row with lowercase keys to match the JavaScript."""
+    return {
+        "politicianid": politician['politicianid'],
+        "firstname": politician['firstname'],
+        "lastname": politician['lastname'],
+        "party": politician['party'],
+        "state": politician['state'],
+        "role": politician['role'],
+        "isactive": politician['isactive']
+    }
+
+def format_donor(donor):
+    """Formats a Donors row with lowercase keys to match the JavaScript."""
+    return {
+        "donorid": donor['donorid'],
+        "name": donor['name'],
+        "donortype": donor['donortype'],
+        "employer": donor['employer'],
+        "state": donor['state']
+    }
+
+def format_donation(d):
+    """Formats a donor contribution row to match what the frontend JavaScript expects."""
+    return {
+        # Ensure amount is a float for JSON
+        "amount": float(d['amount']),
+        "date": d['date'],
+        "firstname": d['firstname'],
+        "lastname": d['lastname'],
+        "party": d['party'],
+        "state": d['state']
+    }
+
+def format_industry_total(row):
+    """Formats an industry total row from the donation summary queries."""
+    return {"industry": row['industry'] or 'Other', "totalamount": float(row['totalamount'])}
+
+def order_batch(ids, rows, key, formatter):
+    """Orders batch lookup rows by the requested IDs.
+
+    Returns (formatted rows in request order, IDs that were not found).
+    """
+    found = {row[key]: row for row in rows}
+    return (
+        [formatter(found[i]) for i in ids if i in found],
+        [i for i in ids if i not in found]
+    )
+
+def donation_page(page, per_page, total_donations, rows):
+    """Builds the paginated donor contributions response."""
+    return {
+        "pagination": {
+            "currentPage": page,
+            "perPage": per_page,
+            "totalPages": (total_donations + per_page - 1) // per_page,
+            "totalDonations": total_donations
+        },
+        "donations": [format_donation(d) for d in rows]
+    }
+
+def politician_profile(politician, vote_page, summary_list, vote_count_rows, top_n):
+    """Builds the politician profile response from its component queries."""
+    remainder = summary_list[top_n:]
+    return {
+        "politician": format_politician(politician),
+        "votes": vote_page,
+        "voteCounts": {row['vote']: row['total'] for row in vote_count_rows},
+        "donationSummary": summary_list[:top_n],
+        "donationSummaryOther": {
+            "industries": len(remainder),
+            "totalamount": sum(d['totalamount'] for d in remainder)
+        }
+    }
+
+
+# --- Vote History ---
+
+def build_vote_filters(politician_id, bill_types=None, bill_subjects=None):
+    """Builds the WHERE clause and params for a politician's vote history."""
+    # Served from the denormalized politician_vote_timeline table (built by
+    # bin/populate_votes.py), so a page is one range scan on
+    # (PoliticianID, DateIntroduced) with no join back to Bills.
+    where_clauses = ["t.PoliticianID = %s"]
+    params = [politician_id]
+
+    if bill_types:
+        # Only known type codes (e.g. 'hr', 's') are matched against the
+        # stored BillType column; anything else is ignored.
+        valid_types = sorted({t.lower() for t in bill_types if t.lower() in BILL_TYPE_CODES})
+        if valid_types:
+            where_clauses.append("t.BillType = ANY(%s)")
+            params.append(valid_types)
+
+    if bill_subjects:
+        # Explicit cast so both drivers' list adaptation compares as text[]
+        where_clauses.append("t.subjects && %s::text[]")
+        params.append(bill_subjects)
+
+    return " AND ".join(where_clauses), params
+
+def vote_page_queries(politician_id, page=1, sort_order='DESC', bill_types=None, bill_subjects=None):
+    """Builds the count and data queries for one page of vote history.
+
+    Returns (count_sql, count_params, data_sql, data_params).
+    """
+    per_page = VOTES_PER_PAGE
+    offset = (page - 1) * per_page
+    if sort_order not in ['ASC', 'DESC']:
+        sort_order = 'DESC'
+
+    where_sql, params = build_vote_filters(politician_id, bill_types, bill_subjects)
+
+    count_sql = f"SELECT COUNT(*) AS count FROM politician_vote_timeline t WHERE {where_sql};"
+    data_sql = f"""
+        SELECT t.VoteID, t.Vote, t.BillNumber, t.Title, t.DateIntroduced, t.subjects
+        FROM politician_vote_timeline t
+        WHERE {where_sql}
+        ORDER BY t.DateIntroduced {sort_order}, t.VoteID {sort_order}
+        LIMIT %s OFFSET %s;
+    """
+    return count_sql, tuple(params), data_sql, tuple(params + [per_page, offset])
+
+def vote_page(page, total_votes, rows):
+    """Builds the vote history response from the count and the page rows."""
+    # DateIntroduced is left as a date; the JSON provider writes it as ISO
+    return {
+        "pagination": {
+            "currentPage": page,
+            "totalPages": (total_votes + VOTES_PER_PAGE - 1) // VOTES_PER_PAGE,
+            "totalVotes": total_votes
+        },
+        "votes": [
+            {
+                "VoteID": row['voteid'],
+                "Vote": row['vote'],
+                "BillNumber": row['billnumber'],
+                "Title": row['title'],
+                "DateIntroduced": row['dateintroduced'],
+                "subjects": row['subjects']
+            }
+            for row in rows
+        ]
+    }
+
+def vote_page_json_query(politician_id, page=1, sort_order='DESC', bill_types=None, bill_subjects=None):
+    """Builds one query that returns a vote_page() response as JSON text.
+
+    Returns (sql, params).
+    """
+    per_page = VOTES_PER_PAGE
+    offset = (page - 1) * per_page
+    if sort_order not in ['ASC', 'DESC']:
+        sort_order = 'DESC'
+
+    where_sql, params = build_vote_filters(politician_id, bill_types, bill_subjects)
+
+    # Quoted aliases keep the camel-case keys vote_page() returns
+    sql = f"""
+        SELECT json_build_object(
+            'pagination', json_build_object(
+                'currentPage', %s,
+                'totalPages', (c.total + %s - 1) / %s,
+                'totalVotes', c.total
+            ),
+            'votes', COALESCE(v.votes, '[]'::json)
+        )::text
+        FROM (
+            SELECT COUNT(*) AS total FROM politician_vote_timeline t WHERE {where_sql}
+        ) c,
+        (
+            SELECT json_agg(q) AS votes
+            FROM (
+                SELECT t.VoteID AS "VoteID", t.Vote AS "Vote", t.BillNumber AS "BillNumber",
+                       t.Title AS "Title", t.DateIntroduced AS "DateIntroduced", t.subjects
+                FROM politician_vote_timeline t
+                WHERE {where_sql}
+                ORDER BY t.DateIntroduced {sort_order}, t.VoteID {sort_order}
+                LIMIT %s OFFSET %s
+            ) q
+        ) v;
+    """
+    return sql, tuple([page, per_page, per_page] + params + params + [per_page, offset])
@@ -0,0 +1,125 @@
+"""Derived and bookkeeping tables that the API reads but the base schema does not define.
+
+The loaders in bin/ build these after the base tables are populated, and the
+test suite creates them on top of the schema restored from the pg_dump.
+"""
+
+# --- Bill Type Code and Number ---
+# Canonical lowercase type code taken from the leading letters of a bill
+# number, e.g. 'H.R.1234' and 'HR1234' -> 'hr', 'S.J.Res.5' -> 'sjres',
+# and the number itself ('H.R.1234' -> 1234). bin/name_normalization.py's
+# split_bill_number does the same in Python.
+BILL_TYPE_SQL = "LOWER(REGEXP_REPLACE(SUBSTRING({col} FROM '^[A-Za-z. ]*'), '[^A-Za-z]', '', 'g'))"
+BILL_NUM_SQL = "SUBSTRING({col} FROM '[0-9]+')::INT"
+
+
+def add_bill_number_keys(cur):
+    """Adds Bills.bill_type and bill_num, split from BillNumber, and an index on (Congress, bill_type, bill_num).
+
+    Roll calls are linked to bills and votes filtered by type with exact
+    comparisons on these generated columns instead of reparsing BillNumber.
+    """
+    cur.execute(f"""
+        ALTER TABLE Bills
+            ADD COLUMN IF NOT EXISTS bill_type TEXT GENERATED ALWAYS AS ({BILL_TYPE_SQL.format(col='BillNumber')}) STORED,
+            ADD COLUMN IF NOT EXISTS bill_num INT GENERATED ALWAYS AS ({BILL_NUM_SQL.format(col='BillNumber')}) STORED;
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bills_congress_type_num
+        ON Bills (Congress, bill_type, bill_num);
+    """)
+
+
+def add_politician_name_keys(cur):
+    """Adds lowercase copies of Politicians' FirstName, LastName and State, and an index on them.
+
+    The loaders match names case-insensitively; comparing these generated
+    columns uses the index where LOWER() on every row could not.
+    """
+    cur.execute("""
+        ALTER TABLE Politicians
+            ADD COLUMN IF NOT EXISTS FirstNameKey TEXT GENERATED ALWAYS AS (LOWER(FirstName)) STORED,
+            ADD COLUMN IF NOT EXISTS LastNameKey TEXT GENERATED ALWAYS AS (LOWER(LastName)) STORED,
+            ADD COLUMN IF NOT EXISTS StateKey TEXT GENERATED ALWAYS AS (LOWER(State)) STORED;
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_politicians_name_keys
+        ON Politicians (LastNameKey, StateKey, FirstNameKey);
+    """)
+
+
+def create_vote_timeline_table(cur):
+    """Creates the politician_vote_timeline table and its clustering index."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS politician_vote_timeline (
+            VoteID INT PRIMARY KEY,
+            PoliticianID INT NOT NULL,
+            DateIntroduced DATE,
+            BillType TEXT,
+            subjects TEXT[],
+            BillNumber TEXT,
+            Title TEXT,
+            Vote TEXT
+        );
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_vote_timeline_politician_date
+        ON politician_vote_timeline (PoliticianID, DateIntroduced, VoteID);
+    """)
+
+
+def rebuild_vote_timeline(cur):
+    """Repopulates politician_vote_timeline from Votes joined to Bills (see add_bill_number_keys).
+
+    Returns the number of rows written.
+    """
+    cur.execute("TRUNCATE politician_vote_timeline;")
+    cur.execute("""
+        INSERT INTO politician_vote_timeline
+            (VoteID, PoliticianID, DateIntroduced, BillType, subjects, BillNumber, Title, Vote)
+        SELECT v.VoteID, v.PoliticianID, b.DateIntroduced,
+               b.bill_type,
+               b.subjects, b.BillNumber, b.Title, v.Vote
+        FROM Votes v
+        JOIN Bills b ON v.BillID = b.BillID
+        WHERE v.PoliticianID IS NOT NULL;
+    """)
+    return cur.rowcount
+
+
+def cluster_vote_timeline(cur):
+    """Physically orders the timeline by (PoliticianID, DateIntroduced) so a
+    vote page is read from contiguous heap pages."""
+    cur.execute("CLUSTER politician_vote_timeline USING idx_vote_timeline_politician_date;")
+    cur.execute("ANALYZE politician_vote_timeline;")
+
+
+def create_data_version_table(cur):
+    """Creates the single-row data_version marker table."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            version BIGINT NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            source TEXT
+        );
+    """)
+
+
+def bump_data_version(cur, source):
+    """Records that a loader changed the data the API serves.
+
+    The API derives its ETags from this version, so cached responses are
+    invalidated the next time it is read. Returns the new version.
+    """
+    create_data_version_table(cur)
+    cur.execute("""
+        INSERT INTO data_version (id, version, updated_at, source)
+        VALUES (TRUE, 1, now(), %s)
+        ON CONFLICT (id) DO UPDATE
+        SET version = data_version.version + 1,
+            updated_at = now(),
+            source = EXCLUDED.source
+        RETURNING version;
+    """, (source,))
+    return cur.fetchone()[0]
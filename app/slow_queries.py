@@ -0,0 +1,227 @@
+"""Opt-in log of slow SQL statements.
+
+With SLOW_QUERY_MS set, every statement run through the pooled connections
+(see the Timed* cursors in app/db.py) that takes longer than the threshold is
+written as one JSON line to a rotating file under local/. Each line holds the
+normalized SQL (whitespace collapsed, literals replaced by ?), a fingerprint
+of it, the shape of the parameters (types and array lengths, not values),
+the duration, the rows returned and the API endpoint that ran it. Statements
+that failed are logged with the error's class name, and those cancelled by
+their statement_timeout are flagged "cancelled".
+
+A sampled fraction of slow SELECTs that succeeded is handed to a background
+thread that re-runs them under EXPLAIN (ANALYZE, BUFFERS) on its own
+connection and logs the plan with the record, so the request that hit the
+slow query never waits on the EXPLAIN. That connection goes to a replica when
+DB_REPLICA_DSNS lists any, and each EXPLAIN gets the statement_timeout of the
+endpoint that ran the statement. The dynamic vote-history SQL gets one fingerprint per
+combination of filters, which is what makes its regressions visible in
+bin/slow_query_report.py.
+"""
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+import psycopg2
+import psycopg2.extensions
+
+from app import config
+
+
+# Plans waiting for the EXPLAIN thread; beyond this the record is logged
+# without one rather than queueing more work against a struggling database.
+EXPLAIN_QUEUE_SIZE = 100
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+# --- Normalization ---
+
+def normalize_sql(query):
+    """Returns query with literals replaced by ? and whitespace collapsed.
+
+    Placeholders (%s, %(name)s) are kept, so statements that differ only in
+    their parameter values normalize to the same text.
+    """
+    if isinstance(query, bytes):
+        query = query.decode("utf-8", "replace")
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    return _WHITESPACE.sub(" ", query).strip().rstrip(";").rstrip()
+
+
+def fingerprint(normalized_sql):
+    """Returns a short stable id for a normalized statement."""
+    return hashlib.sha1(normalized_sql.encode("utf-8")).hexdigest()[:12]
+
+
+def _value_shape(value):
+    if value is None:
+        return "null"
+    if isinstance(value, (list, tuple)):
+        inner = _value_shape(value[0]) if value else "empty"
+        return f"{inner}[{len(value)}]"
+    return type(value).__name__
+
+
+def params_shape(vars):
+    """Describes query parameters by type (and length, for arrays) only.
+
+    e.g. (42, ['hr', 's'], 25) -> ['int', 'str[2]', 'int']
+    """
+    if vars is None:
+        return None
+    if isinstance(vars, dict):
+        return {key: _value_shape(value) for key, value in vars.items()}
+    return [_value_shape(value) for value in vars]
+
+
+# --- Log File ---
+
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger():
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            os.makedirs(os.path.dirname(config.SLOW_QUERY_LOG_PATH) or ".", exist_ok=True)
+            handler = RotatingFileHandler(
+                config.SLOW_QUERY_LOG_PATH,
+                maxBytes=config.SLOW_QUERY_LOG_MAX_BYTES,
+                backupCount=config.SLOW_QUERY_LOG_BACKUPS,
+                encoding="utf-8",
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("paper_trail.slow_queries")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+            _logger = logger
+        return _logger
+
+
+def close_log():
+    """Closes the log file; the next slow query reopens it (used by tests)."""
+    global _logger
+    with _logger_lock:
+        if _logger is not None:
+            for handler in list(_logger.handlers):
+                _logger.removeHandler(handler)
+                handler.close()
+            _logger = None
+
+
+def _write(record):
+    _get_logger().info(json.dumps(record, default=str))
+
+
+# --- Sampled EXPLAIN ---
+
+_explain_queue = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+_explain_thread = None
+_explain_thread_lock = threading.Lock()
+
+
+def _explain_connect():
+    """Connects to the first replica that answers, or to the primary if none are configured."""
+    if not config.DB_REPLICA_DSNS:
+        return psycopg2.connect(options="-c search_path=pt,public", **config.conn_params)
+    error = None
+    for dsn in config.DB_REPLICA_DSNS:
+        try:
+            return psycopg2.connect(dsn, options="-c search_path=pt,public",
+                                    connect_timeout=config.DB_REPLICA_CONNECT_TIMEOUT)
+        except psycopg2.OperationalError as e:
+            error = e
+    raise error
+
+
+def _explain_worker():
+    """Re-runs queued statements under EXPLAIN ANALYZE and logs them."""
+    conn = None
+    while True:
+        record, query, vars, timeout_ms = _explain_queue.get()
+        try:
+            if conn is None or conn.closed:
+                conn = _explain_connect()
+            with conn.cursor() as cur:
+                if timeout_ms:
+                    cur.execute("SELECT set_config('statement_timeout', %s, true);", (str(int(timeout_ms)),))
+                cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, vars)
+                record["plan"] = cur.fetchone()[0]
+            # ANALYZE executes the statement; never keep anything it did
+            conn.rollback()
+        except psycopg2.Error as e:
+            record["explain_error"] = str(e).strip()
+            if conn is not None and not conn.closed:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    conn.close()
+        finally:
+            _write(record)
+            _explain_queue.task_done()
+
+
+def _start_explain_thread():
+    global _explain_thread
+    with _explain_thread_lock:
+        if _explain_thread is None or not _explain_thread.is_alive():
+            _explain_thread = threading.Thread(
+                target=_explain_worker, name="slow-query-explain", daemon=True
+            )
+            _explain_thread.start()
+
+
+def _is_explainable(normalized_sql):
+    first_word = normalized_sql.lstrip("(").split(" ", 1)[0].upper()
+    return first_word in ("SELECT", "WITH")
+
+
+# --- Entry Point ---
+
+def record_query(query, vars, seconds, rowcount=None, endpoint=None, error=None, timeout_ms=None):
+    """Logs query if it ran longer than SLOW_QUERY_MS; no-op when disabled.
+
+    error is the exception the statement raised, if any; failed statements
+    are not sampled for EXPLAIN. timeout_ms is the statement_timeout the
+    EXPLAIN runs under (the endpoint's budget).
+    """
+    if config.SLOW_QUERY_MS is None or seconds * 1000 < config.SLOW_QUERY_MS:
+        return
+    if isinstance(query, bytes):
+        query = query.decode("utf-8", "replace")
+    sql = normalize_sql(query)
+    record = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        "fingerprint": fingerprint(sql),
+        "endpoint": endpoint,
+        "duration_ms": round(seconds * 1000, 2),
+        "rows": rowcount if rowcount is not None and rowcount >= 0 else None,
+        "sql": sql,
+        "params": params_shape(vars),
+    }
+    if error is not None:
+        record["error"] = type(error).__name__
+        if isinstance(error, psycopg2.extensions.QueryCanceledError):
+            record["cancelled"] = True
+
+    if error is None and _is_explainable(sql) and random.random() < config.SLOW_QUERY_EXPLAIN_SAMPLE:
+        _start_explain_thread()
+        try:
+            _explain_queue.put_nowait((record, query, vars, timeout_ms))
+            return
+        except queue.Full:
+            record["explain_error"] = "explain queue full"
+    _write(record)
@@ -0,0 +1,135 @@
+"""Compares how the sync (gunicorn) and async (hypercorn) servers hold up
+when slow queries are in flight.
+
+Start both servers against the same database, e.g.
+
+    gunicorn app.main:app --bind 127.0.0.1:5000 --workers 4 --timeout 120
+    hypercorn app.async_main:app --bind 127.0.0.1:5001
+
+then run
+
+    python benchmarks/async_vs_sync.py \
+        --target sync=http://127.0.0.1:5000 --target async=http://127.0.0.1:5001
+
+For each target, --slow-clients threads loop on a slow endpoint (by default a
+leading-wildcard donor search, which scans Donors) while --fast-clients
+threads loop on a cheap lookup. With only four sync workers the slow
+requests queue the fast ones behind them; the async server keeps answering
+them. The script reports throughput and latency percentiles for both
+request classes and can save them as JSON with --output.
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def percentile(values, pct):
+    """Returns the pct-th percentile of values (nearest rank), or None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def client_loop(base_url, path, deadline, results, timeout):
+    """Requests base_url + path until the deadline, recording latencies and when it stopped."""
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url + path, timeout=timeout) as response:
+                response.read()
+            results["latencies"].append(time.perf_counter() - start)
+        except (urllib.error.URLError, OSError):
+            results["errors"] += 1
+    results["finished"].append(time.monotonic())
+
+
+def run_target(base_url, args):
+    """Runs the mixed slow/fast workload against one server."""
+    deadline = time.monotonic() + args.duration
+    slow = {"latencies": [], "errors": 0, "finished": []}
+    fast = {"latencies": [], "errors": 0, "finished": []}
+
+    threads = [
+        threading.Thread(target=client_loop, args=(base_url, args.slow_path, deadline, slow, args.timeout))
+        for _ in range(args.slow_clients)
+    ]
+    # Let the slow requests occupy the server before measuring fast ones
+    slow["start"] = time.monotonic()
+    for t in threads:
+        t.start()
+    time.sleep(args.warmup)
+    fast_threads = [
+        threading.Thread(target=client_loop, args=(base_url, args.fast_path, deadline, fast, args.timeout))
+        for _ in range(args.fast_clients)
+    ]
+    fast["start"] = time.monotonic()
+    for t in fast_threads:
+        t.start()
+    for t in threads + fast_threads:
+        t.join()
+
+    # Each class over its own window: slow clients run through the warmup,
+    # fast ones only after it, and both finish their last in-flight request
+    windows = {name: max(r["finished"], default=r["start"]) - r["start"]
+               for name, r in (("slow", slow), ("fast", fast))}
+    return {
+        name: {
+            "requests": len(r["latencies"]),
+            "errors": r["errors"],
+            "seconds": round(windows[name], 2),
+            "throughput_rps": len(r["latencies"]) / windows[name] if windows[name] > 0 else None,
+            "p50_ms": _ms(percentile(r["latencies"], 50)),
+            "p95_ms": _ms(percentile(r["latencies"], 95)),
+            "p99_ms": _ms(percentile(r["latencies"], 99)),
+            "mean_ms": _ms(statistics.fmean(r["latencies"]) if r["latencies"] else None),
+        }
+        for name, r in (("slow", slow), ("fast", fast))
+    }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", action="append", required=True,
+                        help="name=base_url of a running server; repeat for each server")
+    parser.add_argument("--slow-path", default="/api/donors/search?name=son")
+    parser.add_argument("--fast-path", default="/api/politician/1")
+    parser.add_argument("--slow-clients", type=int, default=16)
+    parser.add_argument("--fast-clients", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per target")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds of slow-only load first")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = {"settings": {k: v for k, v in vars(args).items() if k not in ("target", "output")},
+              "targets": {}}
+    for target in args.target:
+        name, _, base_url = target.partition("=")
+        print(f"Running {name} ({base_url}) for {args.duration:.0f}s...")
+        report["targets"][name] = run_target(base_url.rstrip("/"), args)
+
+    print(f"\n{'target':<10}{'class':<6}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, classes in report["targets"].items():
+        for cls, r in classes.items():
+            rps = f"{r['throughput_rps']:.1f}" if r["throughput_rps"] is not None else "-"
+            print(f"{name:<10}{cls:<6}{rps:>9}{str(r['p50_ms']):>10}{str(r['p95_ms']):>10}"
+                  f"{str(r['p99_ms']):>10}{r['errors']:>8}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Fills a benchmark database with synthetic data at production-like scale.
+
+At --scale 1 this writes 12k politicians, 120k bills, 1M donors, 30M
+donations and 5M votes, then rebuilds the vote timeline, analyzes the
+tables and bumps the data version, the same steps the loaders finish with.
+Rows are generated inside Postgres with generate_series, in chunks of
+--chunk-size rows, so nothing is streamed from Python.
+
+The pt schema must already exist in the target database (restore it from
+the pg_dump as in the README). Existing rows are only replaced with
+--truncate, and the database must be named on the command line:
+
+    python benchmarks/generate_data.py --dbname paper_trail_bench --truncate
+    python benchmarks/generate_data.py --dbname paper_trail_bench --truncate --scale 0.01
+
+The data is deterministic for a given scale: IDs, names and links are
+derived from the row number, and amounts come from a fixed random seed.
+Every (donor, politician, amount, date), (politician, bill) and
+(first name, last name, state) combination is unique, matching the
+constraints the loaders rely on.
+"""
+import argparse
+import os
+import sys
+import time
+
+import psycopg2
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config
+from app.schema import (add_bill_number_keys, create_vote_timeline_table, rebuild_vote_timeline, cluster_vote_timeline,
+                        create_data_version_table, bump_data_version)
+
+# Row counts at --scale 1
+DEFAULT_COUNTS = {
+    "politicians": 12_000,
+    "bills": 120_000,
+    "donors": 1_000_000,
+    "donations": 30_000_000,
+    "votes": 5_000_000,
+}
+MIN_COUNTS = {"politicians": 100, "bills": 100, "donors": 100, "donations": 100, "votes": 100}
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Christopher", "Nancy", "Daniel", "Lisa", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+    "Donald", "Ashley", "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell", "Carter", "Roberts",
+]
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY",
+    "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND",
+    "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+# Politicians.State holds full names (as Congress.gov lists them), Donors.State the FEC codes
+STATE_NAMES = [
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut", "Delaware", "Florida",
+    "Georgia", "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine",
+    "Maryland", "Massachusetts", "Michigan", "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska",
+    "Nevada", "New Hampshire", "New Jersey", "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
+    "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota", "Tennessee", "Texas",
+    "Utah", "Vermont", "Virginia", "Washington", "West Virginia", "Wisconsin", "Wyoming",
+]
+EMPLOYERS = [
+    "Self-Employed", "Retired", "Not Employed", "Google", "Microsoft", "JPMorgan Chase", "Kaiser Permanente",
+    "Lockheed Martin", "ExxonMobil", "Goldman Sachs", "Pfizer", "University of California", "Amazon",
+    "Deloitte", "State of Texas", "Boeing", "Wells Fargo", "Mayo Clinic", "Chevron", "Jones Day",
+]
+INDUSTRIES = [
+    "Retired", "Health Professionals", "Pharmaceuticals", "Real Estate", "Securities & Investment",
+    "Lawyers & Lobbyists", "Oil & Gas", "Electronics", "Internet", "Education", "Defense Aerospace",
+    "Commercial Banks", "Insurance", "Business Services", "Electric Utilities", "Government",
+]
+# Weighted roughly like enacted bills: mostly H.R. and S.
+BILL_TYPES = ["HR", "HR", "HR", "HR", "HR", "HR", "S", "S", "S", "HJRES", "SJRES", "HRES", "SRES", "HCONRES"]
+SUBJECTS = [
+    "Health", "Taxation", "Armed Forces and National Security", "Government Operations and Politics",
+    "Crime and Law Enforcement", "Education", "Energy", "Environmental Protection", "Finance and Financial Sector",
+    "Transportation and Public Works", "Immigration", "International Affairs", "Agriculture and Food",
+    "Public Lands and Natural Resources", "Commerce", "Labor and Employment", "Science, Technology, Communications",
+    "Social Welfare", "Housing and Community Development", "Economics and Public Finance",
+]
+
+POLITICIANS_SQL = """
+    INSERT INTO Politicians (FirstName, LastName, Party, Chamber, State, District, IsActive, Role)
+    SELECT (%(first)s::text[])[1 + i %% %(nf)s],
+           (%(last)s::text[])[1 + (i / %(nf)s) %% %(nl)s]
+               || CASE WHEN i >= %(nf)s * %(nl)s THEN ' ' || (i / (%(nf)s * %(nl)s))::text ELSE '' END,
+           CASE WHEN i %% 10 < 5 THEN 'Democrat' WHEN i %% 10 < 9 THEN 'Republican' ELSE 'Independent' END,
+           CASE WHEN i %% 5 = 0 THEN 'Senate' ELSE 'House' END,
+           (%(state_names)s::text[])[1 + (i / 7) %% %(ns)s],
+           CASE WHEN i %% 5 = 0 THEN NULL ELSE 1 + i %% 20 END,
+           i %% 23 = 0,
+           CASE WHEN i %% 5 = 0 THEN 'Senator' ELSE 'Representative' END
+    FROM generate_series(%(lo)s, %(hi)s) AS i;
+"""
+
+BILLS_SQL = """
+    INSERT INTO Bills (BillNumber, Title, DateIntroduced, Congress, subjects)
+    SELECT (%(types)s::text[])[1 + i %% %(nt)s] || (i + 1)::text,
+           'Synthetic ' || (%(subjects)s::text[])[1 + i %% %(nsub)s] || ' Act of ' || (i + 1)::text,
+           DATE '2003-01-03' + (i %% 12) * 730 + (i / 12) %% 700,
+           108 + i %% 12,
+           ARRAY[(%(subjects)s::text[])[1 + i %% %(nsub)s],
+                 (%(subjects)s::text[])[1 + (i / %(nsub)s) %% %(nsub)s]]
+    FROM generate_series(%(lo)s, %(hi)s) AS i;
+"""
+
+DONORS_SQL = """
+    INSERT INTO Donors (Name, DonorType, Employer, State, Industry)
+    SELECT upper((%(last)s::text[])[1 + (i / %(nf)s) %% %(nl)s] || ', ' || (%(first)s::text[])[1 + i %% %(nf)s]
+               || ' ' || chr(65 + (i / (%(nf)s * %(nl)s)) %% 26)
+               || CASE WHEN i >= 26 * %(nf)s * %(nl)s THEN (i / (26 * %(nf)s * %(nl)s))::text ELSE '' END),
+           CASE i %% 20 WHEN 0 THEN 'PAC' WHEN 1 THEN 'Corporation' ELSE 'Individual' END,
+           (%(employers)s::text[])[1 + (i / 3) %% %(ne)s],
+           (%(states)s::text[])[1 + (i / 11) %% %(ns)s],
+           (%(industries)s::text[])[1 + (i / 5) %% %(ni)s]
+    FROM generate_series(%(lo)s, %(hi)s) AS i;
+"""
+
+# Donation i belongs to donor i % donors in round i / donors; rounds are 240
+# days apart, so a donor's donations never share a date.
+DONATIONS_SQL = """
+    INSERT INTO Donations (DonorID, PoliticianID, Amount, Date, ContributionType)
+    SELECT d.donor_id,
+           1 + (d.donor_id * 31 + d.round * 7919) %% %(politicians)s,
+           round((25 + 3300 * power(random(), 4))::numeric, 2),
+           DATE '2004-01-01' + d.round * 240 + d.donor_id %% 240,
+           CASE WHEN d.donor_id %% 20 < 2 THEN 'PAC/Party' ELSE 'Individual' END
+    FROM (SELECT 1 + i %% %(donors)s AS donor_id, i / %(donors)s AS round
+          FROM generate_series(%(lo)s, %(hi)s) AS i) d;
+"""
+
+# Vote i is cast by politician i % politicians on the politician's
+# (i / politicians)-th bill, offset per politician so bills get spread out.
+VOTES_SQL = """
+    INSERT INTO Votes (PoliticianID, BillID, Vote)
+    SELECT v.politician_id,
+           1 + (v.k + v.politician_id * 97) %% %(bills)s,
+           CASE WHEN (v.k * 7 + v.politician_id) %% 20 < 11 THEN 'Yea'
+                WHEN (v.k * 7 + v.politician_id) %% 20 < 18 THEN 'Nay'
+                WHEN (v.k * 7 + v.politician_id) %% 20 = 18 THEN 'Not Voting'
+                ELSE 'Present' END
+    FROM (SELECT 1 + i %% %(politicians)s AS politician_id, i / %(politicians)s AS k
+          FROM generate_series(%(lo)s, %(hi)s) AS i) v;
+"""
+
+TABLES = ["politician_vote_timeline", "fec_politician_map", "Votes", "Donations", "Donors", "Bills", "Politicians"]
+
+
+def scaled_counts(scale):
+    """Returns the row count of each table at the given scale."""
+    counts = {name: max(MIN_COUNTS[name], int(count * scale)) for name, count in DEFAULT_COUNTS.items()}
+    # Each politician votes on distinct bills, so there must be enough of them
+    counts["bills"] = max(counts["bills"], counts["votes"] // counts["politicians"] + 1)
+    return counts
+
+
+def insert_in_chunks(conn, label, sql, total, chunk_size, params):
+    """Runs sql over generate_series(lo, hi) chunks, committing each one."""
+    cur = conn.cursor()
+    start = time.perf_counter()
+    for lo in range(0, total, chunk_size):
+        hi = min(lo + chunk_size, total) - 1
+        cur.execute(sql, dict(params, lo=lo, hi=hi))
+        conn.commit()
+        elapsed = time.perf_counter() - start
+        print(f"  {label}: {hi + 1:,}/{total:,} rows ({(hi + 1) / elapsed:,.0f} rows/s)")
+    cur.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dbname", required=True, help="benchmark database to fill")
+    parser.add_argument("--scale", type=float, default=1.0, help="fraction of the default row counts")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="rows per INSERT")
+    parser.add_argument("--truncate", action="store_true", help="empty the tables first")
+    parser.add_argument("--seed", type=float, default=0.42, help="setseed() value for donation amounts")
+    args = parser.parse_args()
+
+    if args.dbname == config.DB_NAME and os.getenv("TESTING") != "true":
+        sys.exit(f"Refusing to overwrite the configured application database '{args.dbname}'.")
+
+    counts = scaled_counts(args.scale)
+    conn = psycopg2.connect(**dict(config.conn_params, dbname=args.dbname),
+                            options="-c search_path=pt,public")
+    cur = conn.cursor()
+    add_bill_number_keys(cur)
+    create_vote_timeline_table(cur)
+    create_data_version_table(cur)
+    cur.execute("SELECT count(*) FROM Politicians;")
+    if cur.fetchone()[0] and not args.truncate:
+        sys.exit("Tables already hold data; rerun with --truncate to replace it.")
+    if args.truncate:
+        print("Truncating tables...")
+        cur.execute(f"TRUNCATE TABLE {', '.join(TABLES)} RESTART IDENTITY CASCADE;")
+    # A single process keeps random() reproducible under setseed()
+    cur.execute("SET max_parallel_workers_per_gather = 0;")
+    cur.execute("SELECT setseed(%s);", (args.seed,))
+    conn.commit()
+
+    print("Generating " + ", ".join(f"{count:,} {name}" for name, count in counts.items()))
+    total_start = time.perf_counter()
+    params = {
+        "first": FIRST_NAMES, "nf": len(FIRST_NAMES), "last": LAST_NAMES, "nl": len(LAST_NAMES),
+        "states": STATES, "state_names": STATE_NAMES, "ns": len(STATES),
+        "employers": EMPLOYERS, "ne": len(EMPLOYERS),
+        "industries": INDUSTRIES, "ni": len(INDUSTRIES), "types": BILL_TYPES, "nt": len(BILL_TYPES),
+        "subjects": SUBJECTS, "nsub": len(SUBJECTS), **counts,
+    }
+    insert_in_chunks(conn, "Politicians", POLITICIANS_SQL, counts["politicians"], args.chunk_size, params)
+    insert_in_chunks(conn, "Bills", BILLS_SQL, counts["bills"], args.chunk_size, params)
+    insert_in_chunks(conn, "Donors", DONORS_SQL, counts["donors"], args.chunk_size, params)
+    insert_in_chunks(conn, "Donations", DONATIONS_SQL, counts["donations"], args.chunk_size, params)
+    insert_in_chunks(conn, "Votes", VOTES_SQL, counts["votes"], args.chunk_size, params)
+
+    print("Rebuilding vote timeline...")
+    rebuild_vote_timeline(cur)
+    cluster_vote_timeline(cur)
+    bump_data_version(cur, "benchmarks/generate_data")
+    conn.commit()
+
+    print("Analyzing tables...")
+    conn.autocommit = True
+    for table in TABLES:
+        cur.execute(f"ANALYZE {table};")
+    cur.close()
+    conn.close()
+    print(f"Done in {time.perf_counter() - total_start:.0f}s.")
+
+
+if __name__ == "__main__":
+    main()
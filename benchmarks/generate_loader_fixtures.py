@@ -0,0 +1,423 @@
+"""Writes synthetic FEC, Voteview and BILLSTATUS files for the loaders.
+
+The files have the layout and formats of the real downloads, so
+bin/build_fec_map.py, bin/populate_donors_and_donations.py,
+bin/populate_votes.py and bin/populate_bills.py read them unchanged:
+
+    <output>/contributions/cn24.zip, cm24.zip, ccl24.zip, pas224.zip, indiv24.zip
+    <output>/votes/HS118_votes.json, HS118_rollcalls.json
+    <output>/HSall_members.json
+    <output>/bills/118/BILLSTATUS-118-hr.zip (-s, -hjres, -sjres)
+
+Members of Congress appear consistently in every source (Voteview icpsr
+and bioguide IDs, FEC candidate IDs and principal committees), so the
+matching steps find real work to do; challengers, PACs and non-enacted
+bills that must be filtered out are mixed in at realistic rates.
+
+Sizes are per Congress (and its two-year FEC cycle) and scale with
+--scale. At --scale 1 one Congress has ~540 members, 1,300 roll calls
+(~370k member votes), 13,750 bills, 15k PACs, 600k PAC contributions and
+5M individual contributions. Output is deterministic for a given --seed.
+
+    python benchmarks/generate_loader_fixtures.py --congresses 117-118 --scale 0.1
+    python benchmarks/loader_benchmark.py --dbname paper_trail_bench
+"""
+import argparse
+import io
+import json
+import os
+import random
+import time
+import zipfile
+from datetime import date, timedelta
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(project_root, "local", "fixtures")
+
+# Per Congress at --scale 1
+HOUSE_ROLLCALLS = 700
+SENATE_ROLLCALLS = 600
+BILLS_PER_TYPE = {"hr": 9000, "s": 4500, "hjres": 150, "sjres": 100}
+CHALLENGERS = 2500
+PACS = 15_000
+PAS2_ROWS = 600_000
+INDIV_ROWS = 5_000_000
+# Not scaled
+HOUSE_SEATS = 435
+ENACTED_FRACTION = 0.03
+TURNOVER = 0.1
+
+STATE_NAMES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "FL": "Florida", "GA": "Georgia",
+    "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
+    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi", "MO": "Missouri",
+    "MT": "Montana", "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire", "NJ": "New Jersey",
+    "NM": "New Mexico", "NY": "New York", "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+    "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont",
+    "VA": "Virginia", "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+STATE_NAMES_LIST = list(STATE_NAMES)
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Christopher", "Nancy", "Daniel", "Lisa", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+]
+LAST_NAME_ENDINGS = ["", "son", "ton", "ley", "er", "man", "field", "wood"]
+EMPLOYERS = ["SELF-EMPLOYED", "RETIRED", "NOT EMPLOYED", "GOOGLE", "MICROSOFT", "JPMORGAN CHASE",
+             "KAISER PERMANENTE", "LOCKHEED MARTIN", "EXXONMOBIL", "GOLDMAN SACHS", "PFIZER", "BOEING"]
+OCCUPATIONS = ["RETIRED", "ATTORNEY", "PHYSICIAN", "CEO", "ENGINEER", "CONSULTANT", "HOMEMAKER", "EXECUTIVE"]
+POLICY_AREAS = ["Health", "Taxation", "Armed Forces and National Security", "Education", "Energy",
+                "Crime and Law Enforcement", "Immigration", "Agriculture and Food", "Commerce",
+                "Government Operations and Politics", "Transportation and Public Works"]
+LEGISLATIVE_SUBJECTS = ["Medicare", "Income tax rates", "Military personnel", "Higher education", "Oil and gas",
+                        "Border security", "Crop insurance", "Small business", "Federal budget process",
+                        "Highways and roads", "Congressional oversight", "Veterans' medical care"]
+# (cast_code, weight): mostly Yea/Nay, some not voting
+CAST_CODES = [(1, 55), (6, 38), (9, 5), (7, 2)]
+INDIV_AMOUNTS = [(25, 20), (100, 20), (250, 12), (500, 10), (1000, 10), (2800, 12), (3300, 12), (5000, 4)]
+
+
+def cycle_year(congress):
+    """The FEC election cycle ending during a Congress (118 -> 2024)."""
+    return 2 * congress + 1788
+
+
+def congress_start(congress):
+    return date(cycle_year(congress) - 1, 1, 3)
+
+
+def fec_date(d):
+    return d.strftime("%m%d%Y")
+
+
+class Person:
+    """One member of Congress (or challenger) across all sources."""
+
+    def __init__(self, rng, seq, state, chamber, district):
+        self.first = rng.choice(FIRST_NAMES)
+        self.middle = rng.choice("ABCDEFGHJKLMNPRSTW")
+        self.last = rng.choice(LAST_NAMES) + rng.choice(LAST_NAME_ENDINGS)
+        self.state = state
+        self.chamber = chamber
+        self.district = district
+        self.party = rng.choice(["Democratic", "Republican"])
+        self.icpsr = 20000 + seq
+        self.bioguide = f"{self.last[0]}{seq:06d}"
+        office = "H" if chamber == "House" else "S"
+        self.cand_id = f"{office}{seq % 10}{state}{seq:05d}"
+        self.committee_id = f"C{seq:08d}"
+
+
+def generate_members(rng, congresses):
+    """Returns {congress: [Person]} with some turnover between Congresses."""
+    seats = [("House", STATE_NAMES_LIST[n % 50], n // 50 + 1) for n in range(HOUSE_SEATS)]
+    seats += [("Senate", state, 0) for state in STATE_NAMES_LIST for _ in range(2)]
+    seq = 0
+    holders = []
+    for chamber, state, district in seats:
+        seq += 1
+        holders.append(Person(rng, seq, state, chamber, district))
+
+    members = {}
+    for congress in congresses:
+        for i, (chamber, state, district) in enumerate(seats):
+            if congress != congresses[0] and rng.random() < TURNOVER:
+                seq += 1
+                holders[i] = Person(rng, seq, state, chamber, district)
+        members[congress] = list(holders)
+    return members, seq
+
+
+
+def _xml_escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("'", "&apos;")
+
+
+def bill_status_xml(rng, congress, bill_type, number, enacted, members):
+    """Returns one BILLSTATUS document in the bulk-data (v3) layout."""
+    introduced = congress_start(congress) + timedelta(days=rng.randint(0, 600))
+    sponsor = rng.choice(members)
+    cosponsors = rng.sample(members, rng.randint(0, 20))
+    policy_area = rng.choice(POLICY_AREAS)
+    subjects = rng.sample(LEGISLATIVE_SUBJECTS, rng.randint(1, 5))
+    title = f"{policy_area} Improvement Act of {introduced.year} No. {number}"
+
+    actions = [(introduced, "Introduced in House" if bill_type.startswith("h") else "Introduced in Senate",
+                "IntroReferral")]
+    day = introduced
+    for _ in range(rng.randint(1, 8)):
+        day += timedelta(days=rng.randint(1, 40))
+        actions.append((day, "Referred to the Committee on " + policy_area + ".", "IntroReferral"))
+    if enacted:
+        day += timedelta(days=rng.randint(1, 30))
+        law_number = f"{congress}-{rng.randint(1, 350)}"
+        actions.append((day, f"Became Public Law No: {law_number}.", "BecameLaw"))
+    latest_date, latest_text, _ = actions[-1]
+
+    def person(p, extra=""):
+        return (f"<item><bioguideId>{p.bioguide}</bioguideId>"
+                f"<fullName>{_xml_escape(f'Rep. {p.last}, {p.first} [{p.party[0]}-{p.state}]')}</fullName>"
+                f"<firstName>{p.first}</firstName><lastName>{_xml_escape(p.last)}</lastName>"
+                f"<party>{p.party[0]}</party><state>{p.state}</state>{extra}</item>")
+
+    parts = [
+        "<?xml version='1.0' encoding='utf-8'?>",
+        "<billStatus><version>3.0.0</version><bill>",
+        f"<number>{number}</number><type>{bill_type.upper()}</type>",
+        f"<introducedDate>{introduced.isoformat()}</introducedDate><congress>{congress}</congress>",
+        f"<title>{_xml_escape(title)}</title>",
+        f"<policyArea><name>{_xml_escape(policy_area)}</name></policyArea>",
+        "<subjects><legislativeSubjects>",
+        *(f"<item><name>{_xml_escape(s)}</name></item>" for s in subjects),
+        "</legislativeSubjects></subjects>",
+        "<sponsors>", person(sponsor), "</sponsors>",
+        "<cosponsors>",
+        *(person(c, f"<sponsorshipDate>{(introduced + timedelta(days=rng.randint(0, 90))).isoformat()}"
+                    "</sponsorshipDate><isOriginalCosponsor>False</isOriginalCosponsor>") for c in cosponsors),
+        "</cosponsors>",
+        "<actions>",
+        *(f"<item><actionDate>{d.isoformat()}</actionDate><text>{_xml_escape(t)}</text><type>{k}</type></item>"
+          for d, t, k in actions),
+        "</actions>",
+    ]
+    if enacted:
+        parts.append(f"<laws><item><type>Public Law</type><number>{law_number}</number></item></laws>")
+    parts.append(f"<latestAction><actionDate>{latest_date.isoformat()}</actionDate>"
+                 f"<text>{_xml_escape(latest_text)}</text></latestAction>")
+    parts.append("</bill></billStatus>")
+    return "".join(parts)
+
+
+def write_bills(rng, out_dir, congress, members, scale):
+    """Writes the BILLSTATUS zips for one Congress; returns {type: [enacted numbers]}."""
+    congress_dir = os.path.join(out_dir, "bills", str(congress))
+    os.makedirs(congress_dir, exist_ok=True)
+    enacted = {}
+    for bill_type, count in BILLS_PER_TYPE.items():
+        enacted[bill_type] = []
+        path = os.path.join(congress_dir, f"BILLSTATUS-{congress}-{bill_type}.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for number in range(1, max(1, int(count * scale)) + 1):
+                is_enacted = rng.random() < ENACTED_FRACTION
+                if is_enacted:
+                    enacted[bill_type].append(number)
+                zf.writestr(f"BILLSTATUS-{congress}{bill_type}{number}.xml",
+                            bill_status_xml(rng, congress, bill_type, number, is_enacted, members))
+    return enacted
+
+
+class _JsonArrayWriter:
+    """Streams a JSON array of objects to a file."""
+
+    def __init__(self, path):
+        self.f = open(path, "w", encoding="utf-8")
+        self.f.write("[")
+        self.count = 0
+
+    def write(self, obj):
+        self.f.write(("," if self.count else "") + "\n" + json.dumps(obj))
+        self.count += 1
+
+    def close(self):
+        self.f.write("\n]\n")
+        self.f.close()
+
+
+def write_votes(rng, out_dir, congress, members, enacted, scale):
+    """Writes HS<congress>_rollcalls.json and HS<congress>_votes.json; returns the vote count."""
+    votes_dir = os.path.join(out_dir, "votes")
+    os.makedirs(votes_dir, exist_ok=True)
+    enacted_numbers = [f"{t.upper()}{n}" for t, numbers in enacted.items() for n in numbers]
+    cast_codes, cast_weights = zip(*CAST_CODES)
+
+    rollcalls = _JsonArrayWriter(os.path.join(votes_dir, f"HS{congress}_rollcalls.json"))
+    votes = _JsonArrayWriter(os.path.join(votes_dir, f"HS{congress}_votes.json"))
+    for chamber, count in (("House", HOUSE_ROLLCALLS), ("Senate", SENATE_ROLLCALLS)):
+        voters = [m for m in members if m.chamber == chamber]
+        for rollnumber in range(1, max(1, int(count * scale)) + 1):
+            pick = rng.random()
+            if pick < 0.4 and enacted_numbers:
+                bill_number = rng.choice(enacted_numbers)
+            elif pick < 0.8:
+                bill_type = rng.choice(list(BILLS_PER_TYPE))
+                bill_number = f"{bill_type.upper()}{rng.randint(1, max(1, int(BILLS_PER_TYPE[bill_type] * scale)))}"
+            else:
+                bill_number = None  # procedural votes
+            vote_date = congress_start(congress) + timedelta(days=rng.randint(0, 700))
+            rollcalls.write({
+                "congress": congress, "chamber": chamber, "rollnumber": rollnumber,
+                "date": vote_date.isoformat(), "bill_number": bill_number,
+                "vote_question": "On Passage" if bill_number else "On Motion to Adjourn",
+                "yea_count": 0, "nay_count": 0,
+            })
+            codes = rng.choices(cast_codes, cast_weights, k=len(voters))
+            for member, code in zip(voters, codes):
+                votes.write({"congress": congress, "chamber": chamber, "rollnumber": rollnumber,
+                             "icpsr": member.icpsr, "cast_code": code, "prob": 100.0})
+    rollcalls.close()
+    votes.close()
+    return votes.count
+
+
+def _open_fec_zip(zip_path, txt_name):
+    zf = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED)
+    return zf, io.TextIOWrapper(zf.open(txt_name, "w"), encoding="latin-1", newline="")
+
+
+def _write_rows(path, txt_name, rows):
+    zf, f = _open_fec_zip(path, txt_name)
+    count = 0
+    for row in rows:
+        f.write("|".join(str(v) for v in row) + "\n")
+        count += 1
+    f.close()
+    zf.close()
+    return count
+
+
+def write_fec_cycle(rng, out_dir, congress, members, next_seq, scale):
+    """Writes cn/cm/ccl/pas2/indiv zips for the cycle of one Congress; returns row counts."""
+    fec_dir = os.path.join(out_dir, "contributions")
+    os.makedirs(fec_dir, exist_ok=True)
+    year = cycle_year(congress)
+    yy = f"{year % 100:02d}"
+    start = congress_start(congress)
+
+    challengers = []
+    for _ in range(int(CHALLENGERS * scale)):
+        next_seq += 1
+        template = rng.choice(members)
+        challengers.append(Person(rng, next_seq, template.state, template.chamber, template.district))
+    candidates = members + challengers
+
+    def cand_row(p):
+        office = "H" if p.chamber == "House" else "S"
+        party = "DEM" if p.party == "Democratic" else "REP"
+        district = f"{p.district:02d}" if office == "H" else "00"
+        status = "I" if p in members else "C"
+        return [p.cand_id, f"{p.last.upper()}, {p.first.upper()} {p.middle}", party, year, p.state, office,
+                district, status, "C", p.committee_id, "123 MAIN ST", "", "SPRINGFIELD", p.state, "12345"]
+
+    counts = {"cn": _write_rows(os.path.join(fec_dir, f"cn{yy}.zip"), "cn.txt", map(cand_row, candidates))}
+
+    pacs = [(f"C9{n:07d}", f"{rng.choice(LAST_NAMES).upper()} {rng.choice(['INDUSTRIES', 'ASSOCIATION', 'PAC', 'COALITION'])} PAC {n}")
+            for n in range(max(1, int(PACS * scale)))]
+
+    def committee_rows():
+        for p in candidates:
+            yield [p.committee_id, f"{p.last.upper()} FOR {'CONGRESS' if p.chamber == 'House' else 'SENATE'}",
+                   "TREASURER, A", "1 ELM ST", "", "SPRINGFIELD", p.state, "12345", "P",
+                   "H" if p.chamber == "House" else "S", "DEM" if p.party == "Democratic" else "REP", "Q", "",
+                   "", p.cand_id]
+        for cmte_id, name in pacs:
+            yield [cmte_id, name, "TREASURER, B", "2 OAK ST", "", "WASHINGTON", "DC", "20001", "U", "Q", "",
+                   "M", "T", name, ""]
+
+    counts["cm"] = _write_rows(os.path.join(fec_dir, f"cm{yy}.zip"), "cm.txt", committee_rows())
+    counts["ccl"] = _write_rows(
+        os.path.join(fec_dir, f"ccl{yy}.zip"), "ccl.txt",
+        ([p.cand_id, year, year, p.committee_id, "H" if p.chamber == "House" else "S", "P", f"{n + 1:012d}"]
+         for n, p in enumerate(candidates)))
+
+    def pas2_rows():
+        for n in range(int(PAS2_ROWS * scale)):
+            cmte_id, _ = rng.choice(pacs)
+            recipient = rng.choice(candidates)
+            amount = rng.choice([500, 1000, 2500, 5000, 5000, 10000])
+            yield [cmte_id, "N", "Q2", f"G{year}", f"2024{n:014d}", "24K", "CCM",
+                   f"{recipient.last.upper()} FOR CONGRESS", "SPRINGFIELD", recipient.state, "12345", "", "",
+                   fec_date(start + timedelta(days=rng.randint(0, 700))), amount, recipient.committee_id,
+                   recipient.cand_id, f"SB23.{n}", 1000000 + n, "", "", 4000000000000000 + n]
+
+    counts["pas2"] = _write_rows(os.path.join(fec_dir, f"pas2{yy}.zip"), "itpas2.txt", pas2_rows())
+
+    indiv_count = int(INDIV_ROWS * scale)
+    donors = [(f"{rng.choice(LAST_NAMES).upper()}, {rng.choice(FIRST_NAMES).upper()}",
+               rng.choice(STATE_NAMES_LIST), rng.choice(EMPLOYERS), rng.choice(OCCUPATIONS))
+              for _ in range(max(1, indiv_count // 8))]
+    amounts, amount_weights = zip(*INDIV_AMOUNTS)
+
+    def indiv_rows():
+        for n in range(indiv_count):
+            name, state, employer, occupation = rng.choice(donors)
+            pick = rng.random()
+            if pick < 0.85:
+                cmte_id, tran_tp, other_id = rng.choice(candidates).committee_id, "15", ""
+            elif pick < 0.95:
+                cmte_id, tran_tp, other_id = rng.choice(candidates).committee_id, "15E", rng.choice(pacs)[0]
+            else:
+                cmte_id, tran_tp, other_id = rng.choice(pacs)[0], "15", ""
+            yield [cmte_id, "N", "Q3", f"P{year}", f"2024{n:014d}", tran_tp, "IND", name, "SPRINGFIELD", state,
+                   "123450000", employer, occupation, fec_date(start + timedelta(days=rng.randint(0, 700))),
+                   rng.choices(amounts, amount_weights)[0], other_id, f"A{n}", 2000000 + n, "", "",
+                   1000000000000000 + n]
+
+    counts["indiv"] = _write_rows(os.path.join(fec_dir, f"indiv{yy}.zip"), "itcont.txt", indiv_rows())
+    return counts, next_seq
+
+
+def parse_congresses(spec):
+    """'117-118' or '118' -> [117, 118]."""
+    lo, _, hi = spec.partition("-")
+    return list(range(int(lo), int(hi or lo) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="directory to write the fixtures to")
+    parser.add_argument("--congresses", default="118", help="Congress or range, e.g. 117-118 (108-119 supported)")
+    parser.add_argument("--scale", type=float, default=0.1, help="fraction of the per-Congress sizes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    congresses = parse_congresses(args.congresses)
+    start = time.perf_counter()
+    members, next_seq = generate_members(rng, congresses)
+
+    member_rows = []
+    seen = set()
+    for congress in congresses:
+        for p in members[congress]:
+            if (congress, p.icpsr) in seen:
+                continue
+            seen.add((congress, p.icpsr))
+            member_rows.append({
+                "congress": congress, "chamber": p.chamber, "icpsr": p.icpsr, "bioguide_id": p.bioguide,
+                "state_abbrev": p.state, "district_code": p.district,
+                "party_code": 100 if p.party == "Democratic" else 200,
+                "bioname": f"{p.last.upper()}, {p.first} {p.middle}.",
+            })
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, "HSall_members.json"), "w", encoding="utf-8") as f:
+        json.dump(member_rows, f)
+    manifest = {"seed": args.seed, "scale": args.scale, "congresses": congresses,
+                "members": len({row["icpsr"] for row in member_rows}), "per_congress": {}}
+
+    for congress in congresses:
+        print(f"Congress {congress}: bills...", flush=True)
+        enacted = write_bills(rng, args.output, congress, members[congress], args.scale)
+        print(f"Congress {congress}: votes...", flush=True)
+        vote_count = write_votes(rng, args.output, congress, members[congress], enacted, args.scale)
+        print(f"Congress {congress}: FEC cycle {cycle_year(congress)}...", flush=True)
+        fec_counts, next_seq = write_fec_cycle(rng, args.output, congress, members[congress], next_seq, args.scale)
+        manifest["per_congress"][congress] = {
+            "enacted_bills": sum(len(n) for n in enacted.values()), "votes": vote_count, **fec_counts,
+        }
+
+    with open(os.path.join(args.output, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(json.dumps(manifest["per_congress"], indent=2))
+    print(f"Wrote fixtures to {args.output} in {time.perf_counter() - start:.0f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Replays a realistic mix of /api/* calls against a running server.
+
+Fill a database with benchmarks/generate_data.py, point a server at it and
+run e.g.
+
+    gunicorn app.main:app --bind 127.0.0.1:5000 --workers 4
+    python benchmarks/load_test.py --base-url http://127.0.0.1:5000 --scale 1
+
+--scale must match the one the data was generated with, since it decides
+which IDs exist. Each of the --concurrency client threads draws requests
+from MIX with its own seeded random generator, so two runs with the same
+--seed send the same requests. The report gives throughput and p50/p95/p99
+latency overall and per request kind, plus the database time the server
+reported in its Server-Timing header. Results are written as JSON (by
+default to benchmarks/results/, named after the current commit) and
+--compare prints the change against an earlier result file.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from benchmarks.async_vs_sync import percentile
+from benchmarks.generate_data import BILL_TYPES, LAST_NAMES, SUBJECTS, scaled_counts
+
+RESULTS_DIR = os.path.join(project_root, "benchmarks", "results")
+_DB_TIMING = re.compile(r'(?:^|,\s*)db;dur=([\d.]+)')
+
+
+def _politician(rng, counts):
+    return rng.randint(1, counts["politicians"])
+
+
+def _donor(rng, counts):
+    # Most lookups are for a small set of popular donors
+    if rng.random() < 0.8:
+        return rng.randint(1, max(1, counts["donors"] // 100))
+    return rng.randint(1, counts["donors"])
+
+
+# (kind, weight, path builder) -- weights roughly follow the page views of
+# the site: profile and vote pages dominate, exports are rare.
+MIX = [
+    ("politician", 10, lambda rng, c: f"/api/politician/{_politician(rng, c)}"),
+    ("politician_search", 8, lambda rng, c: f"/api/politicians/search?name={rng.choice(LAST_NAMES)}"),
+    ("politician_batch", 3, lambda rng, c: "/api/politicians?ids="
+        + ",".join(str(_politician(rng, c)) for _ in range(20))),
+    ("profile", 15, lambda rng, c: f"/api/politician/{_politician(rng, c)}/profile"),
+    ("votes", 15, lambda rng, c: f"/api/politician/{_politician(rng, c)}/votes?page={rng.randint(1, 5)}"),
+    ("votes_by_type", 5, lambda rng, c: f"/api/politician/{_politician(rng, c)}/votes"
+        f"?type={rng.choice(BILL_TYPES).lower()}"),
+    ("votes_by_subject", 5, lambda rng, c: f"/api/politician/{_politician(rng, c)}/votes"
+        f"?subject={urllib.parse.quote(rng.choice(SUBJECTS))}&sort=asc"),
+    ("donation_summary", 8, lambda rng, c: f"/api/politician/{_politician(rng, c)}/donations/summary"),
+    ("filtered_summary", 4, lambda rng, c: f"/api/politician/{_politician(rng, c)}/donations/summary/filtered"
+        f"?topic={rng.choice(['Health', 'Finance', 'Technology', 'Energy'])}"),
+    ("donor_search", 8, lambda rng, c: f"/api/donors/search?name={rng.choice(LAST_NAMES)}"),
+    ("donor", 6, lambda rng, c: f"/api/donor/{_donor(rng, c)}"),
+    ("donor_donations", 8, lambda rng, c: f"/api/donor/{_donor(rng, c)}/donations?page={rng.randint(1, 3)}"),
+    ("donor_export", 1, lambda rng, c: f"/api/donor/{_donor(rng, c)}/donations?format=csv"),
+    ("bill_subjects", 4, lambda rng, c: "/api/bills/subjects"),
+]
+
+
+def client_loop(base_url, rng, counts, deadline, results, lock, timeout):
+    """Sends requests from MIX until the deadline, recording each one."""
+    kinds = [kind for kind, _, _ in MIX]
+    weights = [weight for _, weight, _ in MIX]
+    builders = {kind: build for kind, _, build in MIX}
+    while time.monotonic() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        path = builders[kind](rng, counts)
+        start = time.perf_counter()
+        db_ms = None
+        try:
+            with urllib.request.urlopen(base_url + path, timeout=timeout) as response:
+                response.read()
+                match = _DB_TIMING.search(response.headers.get("Server-Timing", ""))
+                db_ms = float(match.group(1)) if match else None
+            error = False
+        except (urllib.error.URLError, OSError):
+            error = True
+        elapsed = time.perf_counter() - start
+        with lock:
+            r = results.setdefault(kind, {"latencies": [], "db_ms": [], "errors": 0})
+            if error:
+                r["errors"] += 1
+            else:
+                r["latencies"].append(elapsed)
+                if db_ms is not None:
+                    r["db_ms"].append(db_ms)
+
+
+def summarize(latencies, db_ms, errors, seconds):
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / seconds, 1) if seconds > 0 else None,
+        "p50_ms": _ms(percentile(latencies, 50)),
+        "p95_ms": _ms(percentile(latencies, 95)),
+        "p99_ms": _ms(percentile(latencies, 99)),
+        "mean_db_ms": round(statistics.fmean(db_ms), 1) if db_ms else None,
+        "p95_db_ms": percentile(db_ms, 95),
+    }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(report, baseline=None):
+    print(f"\n{'kind':<20}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'db ms':>8}{'errors':>8}"
+          + (f"{'p95 vs base':>13}" if baseline else ""))
+    rows = sorted(report["kinds"].items()) + [("TOTAL", report["total"])]
+    for kind, r in rows:
+        line = (f"{kind:<20}{str(r['throughput_rps']):>8}{str(r['p50_ms']):>9}{str(r['p95_ms']):>9}"
+                f"{str(r['p99_ms']):>9}{str(r['mean_db_ms']):>8}{r['errors']:>8}")
+        if baseline:
+            base = baseline["total"] if kind == "TOTAL" else baseline["kinds"].get(kind)
+            if base and base.get("p95_ms") and r["p95_ms"] is not None:
+                line += f"{(r['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100:>+12.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--scale", type=float, default=1.0, help="scale the data was generated with")
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to measure")
+    parser.add_argument("--warmup", type=float, default=10.0, help="seconds of unmeasured load first")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the request sequence")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/load-<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare p95 latencies with")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    counts = scaled_counts(args.scale)
+    lock = threading.Lock()
+
+    report = None
+    for phase, seconds in (("warmup", args.warmup), ("measure", args.duration)):
+        if seconds <= 0:
+            continue
+        print(f"{phase}: {args.concurrency} clients for {seconds:.0f}s against {base_url}...")
+        results = {}
+        deadline = time.monotonic() + seconds
+        threads = [
+            threading.Thread(target=client_loop, args=(
+                base_url, random.Random(args.seed * 1000 + n + (0 if phase == "measure" else 500)),
+                counts, deadline, results, lock, args.timeout))
+            for n in range(args.concurrency)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if phase == "measure":
+            report = {
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "settings": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+                "kinds": {kind: summarize(r["latencies"], r["db_ms"], r["errors"], seconds)
+                          for kind, r in results.items()},
+                "total": summarize(
+                    [x for r in results.values() for x in r["latencies"]],
+                    [x for r in results.values() for x in r["db_ms"]],
+                    sum(r["errors"] for r in results.values()), seconds),
+            }
+
+    if report is None:
+        sys.exit("Nothing measured; --duration must be positive.")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
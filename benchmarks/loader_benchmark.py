@@ -0,0 +1,298 @@
+"""Times the data loaders against synthetic fixture files.
+
+Generate fixtures first, then run the loaders on a scratch database:
+
+    python benchmarks/generate_loader_fixtures.py --congresses 117-118 --scale 0.1
+    python benchmarks/loader_benchmark.py --dbname paper_trail_bench
+
+The loaders run in pipeline order (bills, FEC map, donations, ICPSR map, votes), unchanged
+apart from their input paths, after Politicians is seeded from the fixture
+member file the way populate_politicians.py would fill it from Congress.gov.
+The votes are then loaded a second time with populate_votes.py --sql
+(populate_votes_sql), which resolves them in Postgres instead of Python;
+compare the two at full Voteview scale with --congresses 108-119 --scale 1.
+Likewise the bills are loaded again with populate_bills.py --details
+(populate_bills_details), which keeps subjects, sponsors and actions of
+every bill from the same parse.
+Each loader's wall time is split into three stages:
+
+    parse    reading the source files (ET.parse, csv rows, json.load)
+    write    sending rows to Postgres (execute_values, COPY, the vote timeline rebuild)
+    resolve  everything else: matching names, IDs and bills in Python, or in
+             Postgres for populate_votes_sql's INSERT ... SELECT
+
+by wrapping those calls in the loader modules, so the split works without
+changes to the loaders themselves. Row counts per table, the stage times and
+rows/sec are printed and written as JSON (by default to benchmarks/results/,
+named after the current commit) for comparing runs. Loader output goes to
+<fixtures>/loader_benchmark.log unless --verbose is given.
+"""
+import argparse
+import contextlib
+import functools
+import json
+import os
+import sys
+import time
+import types
+from datetime import datetime, timezone
+
+import psycopg2
+import psycopg2.extensions
+from psycopg2.extras import execute_values
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config
+from app.schema import create_data_version_table
+from benchmarks.generate_loader_fixtures import DEFAULT_OUTPUT, STATE_NAMES
+from benchmarks.load_test import RESULTS_DIR, git_commit
+
+STAGES = ("parse", "resolve", "write")
+
+
+class StageTimer:
+    """Accumulates seconds per stage; nested timed calls count once, for the outer stage."""
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self._active = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self._active:
+            yield
+            return
+        self._active = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            self._active = None
+
+    def wrap(self, name, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return timed
+
+    def iterate(self, name, iterable):
+        """Yields from iterable, charging the time spent producing each item to name."""
+        it = iter(iterable)
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.seconds[name] += clock() - start
+                return
+            self.seconds[name] += clock() - start
+            yield item
+
+    def reset(self):
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+
+
+def _shim(module, **overrides):
+    """A stand-in for module with some attributes replaced."""
+    shim = types.ModuleType(module.__name__)
+    shim.__dict__.update(vars(module))
+    shim.__dict__.update(overrides)
+    return shim
+
+
+def _timed_connect(connect, timer):
+    """Wraps psycopg2.connect so the connection's cursors time copy_expert as write."""
+    class CopyTimedCursor(psycopg2.extensions.cursor):
+        def copy_expert(self, *args, **kwargs):
+            with timer.stage("write"):
+                return super().copy_expert(*args, **kwargs)
+
+    @functools.wraps(connect)
+    def timed(*args, **kwargs):
+        kwargs.setdefault("cursor_factory", CopyTimedCursor)
+        return connect(*args, **kwargs)
+    return timed
+
+
+@contextlib.contextmanager
+def instrumented(loader, timer):
+    """Routes the loader's parse and write calls through timer while active."""
+    patches = {
+        "execute_values": timer.wrap("write", loader.execute_values),
+        "psycopg2": _shim(loader.psycopg2, connect=_timed_connect(loader.psycopg2.connect, timer)),
+    }
+    if hasattr(loader, "csv"):
+        reader = loader.csv.reader
+        patches["csv"] = _shim(loader.csv, reader=lambda *a, **kw: timer.iterate("parse", reader(*a, **kw)))
+    if hasattr(loader, "ET"):
+        patches["ET"] = _shim(loader.ET, parse=timer.wrap("parse", loader.ET.parse))
+    if hasattr(loader, "json"):
+        patches["json"] = _shim(loader.json, load=timer.wrap("parse", loader.json.load))
+    if hasattr(loader, "build_vote_timeline"):
+        patches["build_vote_timeline"] = timer.wrap("write", loader.build_vote_timeline)
+    if hasattr(loader, "replace_votes_from_staging"):
+        # The INSERT ... SELECT writes Votes, but its time goes to matching in Postgres
+        patches["replace_votes_from_staging"] = timer.wrap("resolve", loader.replace_votes_from_staging)
+
+    originals = {name: getattr(loader, name) for name in patches}
+    for name, value in patches.items():
+        setattr(loader, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(loader, name, value)
+
+
+def politician_rows(member_file):
+    """Politicians rows for the fixture members, as Congress.gov would list them."""
+    with open(member_file, encoding="utf-8") as f:
+        members = json.load(f)
+    latest_congress = max(m["congress"] for m in members)
+    latest = {}
+    for m in members:
+        if m["icpsr"] not in latest or m["congress"] > latest[m["icpsr"]]["congress"]:
+            latest[m["icpsr"]] = m
+
+    rows = []
+    for m in latest.values():
+        last, _, rest = m["bioname"].partition(",")
+        rows.append((
+            rest.split()[0], last.title(), "Democratic" if m["party_code"] == 100 else "Republican",
+            m["chamber"], STATE_NAMES[m["state_abbrev"]], m["district_code"] or None,
+            m["congress"] == latest_congress, "Representative" if m["chamber"] == "House" else "Senator",
+        ))
+    return rows
+
+
+def seed_politicians(member_file):
+    from bin import populate_politicians
+
+    conn = psycopg2.connect(**config.conn_params)
+    try:
+        populate_politicians.create_politicians_table_if_not_exists(conn)
+        cur = conn.cursor()
+        create_data_version_table(cur)
+        cur.execute("TRUNCATE TABLE Politicians RESTART IDENTITY CASCADE;")
+        execute_values(cur, """
+            INSERT INTO Politicians (FirstName, LastName, Party, Chamber, State, District, IsActive, Role)
+            VALUES %s ON CONFLICT (FirstName, LastName, State) DO NOTHING;
+        """, politician_rows(member_file))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def table_counts(tables):
+    conn = psycopg2.connect(**config.conn_params)
+    try:
+        cur = conn.cursor()
+        counts = {}
+        for table in tables:
+            cur.execute(f"SELECT count(*) FROM {table};")
+            counts[table] = cur.fetchone()[0]
+        return counts
+    finally:
+        conn.close()
+
+
+def print_report(report):
+    print(f"\n{'loader':<24}{'wall s':>9}{'parse s':>9}{'resolve s':>11}{'write s':>9}{'rows':>12}{'rows/s':>10}")
+    for name, r in report["loaders"].items():
+        print(f"{name:<24}{r['wall_s']:>9}{r['parse_s']:>9}{r['resolve_s']:>11}{r['write_s']:>9}"
+              f"{r['rows']:>12,}{str(r['rows_per_s']):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dbname", required=True, help="scratch database the loaders write to")
+    parser.add_argument("--fixtures", default=DEFAULT_OUTPUT, help="output of generate_loader_fixtures.py")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/loaders-<commit>.json)")
+    parser.add_argument("--verbose", action="store_true", help="show the loaders' own output")
+    args = parser.parse_args()
+
+    if args.dbname == config.DB_NAME and os.getenv("TESTING") != "true":
+        sys.exit(f"Refusing to overwrite the configured application database '{args.dbname}'.")
+    member_file = os.path.join(args.fixtures, "HSall_members.json")
+    if not os.path.isfile(member_file):
+        sys.exit(f"No fixtures in {args.fixtures}; run benchmarks/generate_loader_fixtures.py first.")
+
+    # The loaders read config.conn_params when they connect
+    config.conn_params.update(dbname=args.dbname, options="-c search_path=pt,public")
+
+    from bin import build_fec_map, build_icpsr_map, populate_bills, populate_donors_and_donations, populate_votes
+    populate_bills.BILL_DATA_PATH = os.path.join(args.fixtures, "bills")
+    build_fec_map.FEC_DATA_FOLDER_PATH = os.path.join(args.fixtures, "contributions")
+    populate_donors_and_donations.FEC_DATA_FOLDER_PATH = build_fec_map.FEC_DATA_FOLDER_PATH
+    populate_donors_and_donations.DOWNLOAD_INDIV_FILES = False
+    populate_votes.VOTE_DATA_FOLDER_PATH = os.path.join(args.fixtures, "votes")
+    build_icpsr_map.MEMBER_FILE_PATH = member_file
+
+    # (name, module, entry point, tables whose rows it produces)
+    loaders = [
+        ("populate_bills", populate_bills,
+         lambda: populate_bills.parse_and_insert_enacted_laws_fast(populate_bills.BILL_DATA_PATH), ["Bills"]),
+        ("populate_bills_details", populate_bills,
+         lambda: populate_bills.parse_and_insert_enacted_laws_fast(populate_bills.BILL_DATA_PATH, details=True),
+         ["Bills", *populate_bills.BILL_DETAIL_COLUMNS]),
+        ("build_fec_map", build_fec_map, build_fec_map.build_mapping_table, ["fec_politician_map"]),
+        ("populate_donors_and_donations", populate_donors_and_donations, populate_donors_and_donations.main,
+         ["Donors", "Donations"]),
+        ("build_icpsr_map", build_icpsr_map, lambda: build_icpsr_map.build_icpsr_map(full=True),
+         ["icpsr_politician_map"]),
+        ("populate_votes", populate_votes, populate_votes.process_and_insert_votes, ["Votes"]),
+        ("populate_votes_sql", populate_votes, populate_votes.process_and_insert_votes_sql, ["Votes"]),
+    ]
+
+    seed_politicians(member_file)
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "fixtures": args.fixtures,
+        "loaders": {},
+    }
+    manifest_path = os.path.join(args.fixtures, "manifest.json")
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as f:
+            report["manifest"] = json.load(f)
+
+    log_path = os.path.join(args.fixtures, "loader_benchmark.log")
+    timer = StageTimer()
+    with open(log_path, "w") as log:
+        for name, module, run, tables in loaders:
+            print(f"Running {name}...", flush=True)
+            timer.reset()
+            output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(log)
+            start = time.perf_counter()
+            with instrumented(module, timer), output:
+                run()
+            wall = time.perf_counter() - start
+
+            counts = table_counts(tables)
+            rows = sum(counts.values())
+            if not rows:
+                print(f"  {name} wrote no rows; see {log_path}.")
+            report["loaders"][name] = {
+                "wall_s": round(wall, 2),
+                "parse_s": round(timer.seconds["parse"], 2),
+                "resolve_s": round(max(0.0, wall - timer.seconds["parse"] - timer.seconds["write"]), 2),
+                "write_s": round(timer.seconds["write"], 2),
+                "rows": rows,
+                "rows_per_s": round(rows / wall) if wall > 0 else None,
+                "tables": counts,
+            }
+
+    print_report(report)
+    output = args.output or os.path.join(RESULTS_DIR, f"loaders-{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Times name normalization on a realistic stream of FEC and Voteview names.
+
+The stream repeats a pool of people the way the loaders see them: each FEC
+cn cycle lists the same candidates again (with and without party tags and
+suffixes) and each Congress in the member file repeats its members. Three
+normalizers are timed over the same stream:
+
+    legacy    the regex cleaners build_fec_map.py and populate_votes.py used
+              to carry (clean_name_part + normalize_fec_name /
+              normalize_voteview_bioname), re-run on every name
+    uncached  bin/name_normalization.parse_name without its cache
+    memoized  parse_name as the loaders call it
+
+    python benchmarks/name_normalization_benchmark.py --names 300000
+
+Names/sec for each are printed and written as JSON (by default to
+benchmarks/results/, named after the current commit).
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from benchmarks.generate_loader_fixtures import FIRST_NAMES, LAST_NAME_ENDINGS, LAST_NAMES
+from benchmarks.load_test import RESULTS_DIR, git_commit
+from bin.name_normalization import parse_name
+
+NICKNAMES = {"William": "Bill", "Robert": "Bob", "Richard": "Dick", "James": "Jim", "Thomas": "Tom",
+             "Elizabeth": "Liz", "Joseph": "Joe", "Charles": "Chuck", "Michael": "Mike", "Daniel": "Dan"}
+PARTY_TAGS = ["", " (DEM)", " (REP)", " (IND)"]
+SUFFIXES = ["", "", "", "", " JR", " SR", " III"]
+
+
+# --- Legacy cleaners, as they were in the loaders ---
+def legacy_clean_name_part(name_part):
+    if not name_part: return ""
+    name = str(name_part).lower().strip()
+    name = re.sub(r"[.,\(\)]", " ", name)
+    name = re.sub(r"\s+(jr|sr|ii|iii|iv|md|phd)$", "", name, flags=re.IGNORECASE)
+    name = name.split(' ')[0].strip()
+    return name
+
+
+def _legacy_split(name):
+    cleaned_fname = ""; cleaned_lname = ""
+    if ',' in name:
+        parts = name.split(',', 1)
+        cleaned_lname = legacy_clean_name_part(parts[0])
+        cleaned_fname = legacy_clean_name_part(parts[1])
+    else:
+        parts = name.split()
+        if len(parts) > 1:
+            cleaned_fname = legacy_clean_name_part(parts[0])
+            cleaned_lname = legacy_clean_name_part(parts[-1])
+        elif len(parts) == 1:
+            cleaned_lname = legacy_clean_name_part(parts[0])
+    return (cleaned_fname, cleaned_lname)
+
+
+def legacy_normalize_fec_name(name_str):
+    name = str(name_str or '').strip().lower()
+    name = re.sub(r"\s*\([drpi].*\)$", "", name).strip()
+    return _legacy_split(name)
+
+
+def legacy_normalize_voteview_bioname(bioname_str):
+    name = str(bioname_str or '').strip().lower()
+    name = re.sub(r"\s*\([^\)]*\)", "", name).strip()
+    return _legacy_split(name)
+
+
+def name_stream(count, people, seed):
+    """count (source, name) pairs drawn from people, FEC style or Voteview style."""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(people):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES) + rng.choice(LAST_NAME_ENDINGS)
+        middle = rng.choice("ABCDEFGHJKLMNPRSTW")
+        nickname = f' "{NICKNAMES[first].upper()}"' if first in NICKNAMES and rng.random() < 0.3 else ""
+        pool.append((
+            f"{last.upper()}, {first.upper()} {middle}{rng.choice(SUFFIXES)}{nickname}{rng.choice(PARTY_TAGS)}",
+            f"{last.upper()}, {first} {middle}." + (f" ({NICKNAMES[first]})" if nickname else ""),
+        ))
+    stream = []
+    for _ in range(count):
+        fec, voteview = rng.choice(pool)
+        stream.append(("fec", fec) if rng.random() < 0.6 else ("voteview", voteview))
+    return stream
+
+
+def time_normalizer(stream, normalize):
+    start = time.perf_counter()
+    for source, name in stream:
+        normalize(source, name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=300_000, help="names in the stream")
+    parser.add_argument("--people", type=int, default=20_000, help="distinct people the names are drawn from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/names-<commit>.json)")
+    args = parser.parse_args()
+
+    stream = name_stream(args.names, args.people, args.seed)
+    uncached = parse_name.__wrapped__
+    normalizers = {
+        "legacy": lambda source, name: (legacy_normalize_fec_name(name) if source == "fec"
+                                        else legacy_normalize_voteview_bioname(name)),
+        "uncached": lambda source, name: uncached(name),
+        "memoized": lambda source, name: parse_name(name),
+    }
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "names": args.names,
+        "distinct_names": len({name for _, name in stream}),
+        "results": {},
+    }
+    print(f"{args.names:,} names, {report['distinct_names']:,} distinct\n")
+    print(f"{'normalizer':<12}{'seconds':>10}{'names/s':>14}")
+    for label, normalize in normalizers.items():
+        parse_name.cache_clear()
+        seconds = time_normalizer(stream, normalize)
+        report["results"][label] = {"seconds": round(seconds, 3), "names_per_s": round(args.names / seconds)}
+        print(f"{label:<12}{seconds:>10.2f}{args.names / seconds:>14,.0f}")
+    info = parse_name.cache_info()
+    report["results"]["memoized"]["cache_hit_rate"] = round(info.hits / (info.hits + info.misses), 4)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"names-{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
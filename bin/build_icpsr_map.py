@@ -0,0 +1,177 @@
+"""Builds icpsr_politician_map: Voteview member (ICPSR) -> PoliticianID.
+
+populate_votes.py resolves every vote through this table instead of
+matching member names itself. Members of the Congresses from START_CONGRESS
+on are read from HSall_members.json and matched with
+bin/candidate_matcher.py. Each row keeps the name, state and chamber it was
+matched from (politician_id is NULL for members without a match), so a
+rerun only matches members that are new, whose record changed or who were
+unmatched last time, and drops members no longer in the file. Rows of
+deleted politicians go with them (ON DELETE CASCADE) and are rematched on
+the next run; --full rematches everyone.
+
+    python bin/build_icpsr_map.py
+    python bin/build_icpsr_map.py --full
+"""
+import argparse
+import os
+import json
+import psycopg2
+from array import array
+from psycopg2.extras import execute_values
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config  # Imports your configuration file
+from app.schema import add_politician_name_keys
+from bin.candidate_matcher import CandidateMatcher
+from bin.loader_report import RunReport
+
+# --- CONFIGURATION ---
+MEMBER_FILE_PATH = config.MEMBER_FILE_PATH
+BATCH_SIZE = 1000
+START_CONGRESS = 108 # Votes are only loaded for bills from the 108th on
+
+report = RunReport("build_icpsr_map")
+
+# --- STATE ABBREVIATION MAP ---
+STATE_ABBREVIATION_MAP = {
+    'AL': 'alabama', 'AK': 'alaska', 'AS': 'american samoa', 'AZ': 'arizona', 'AR': 'arkansas',
+    'CA': 'california', 'CO': 'colorado', 'CT': 'connecticut', 'DE': 'delaware', 'DC': 'district of columbia',
+    'FL': 'florida', 'GA': 'georgia', 'GU': 'guam', 'HI': 'hawaii', 'ID': 'idaho',
+    'IL': 'illinois', 'IN': 'indiana', 'IA': 'iowa', 'KS': 'kansas', 'KY': 'kentucky',
+    'LA': 'louisiana', 'ME': 'maine', 'MD': 'maryland', 'MA': 'massachusetts', 'MI': 'michigan',
+    'MN': 'minnesota', 'MS': 'mississippi', 'MO': 'missouri', 'MT': 'montana', 'NE': 'nebraska',
+    'NV': 'nevada', 'NH': 'new hampshire', 'NJ': 'new jersey', 'NM': 'new mexico', 'NY': 'new york',
+    'NC': 'north carolina', 'ND': 'north dakota', 'MP': 'northern mariana islands', 'OH': 'ohio', 'OK': 'oklahoma',
+    'OR': 'oregon', 'PA': 'pennsylvania', 'PR': 'puerto rico', 'RI': 'rhode island', 'SC': 'south carolina',
+    'SD': 'south dakota', 'TN': 'tennessee', 'TX': 'texas', 'UT': 'utah', 'VT': 'vermont',
+    'VI': 'virgin islands', 'VA': 'virginia', 'WA': 'washington', 'WV': 'west virginia',
+    'WI': 'wisconsin', 'WY': 'wyoming'
+}
+
+
+def create_icpsr_map_table_if_not_exists(conn):
+    """Creates the icpsr_politician_map table if it doesn't already exist."""
+    print("Ensuring 'icpsr_politician_map' table exists...")
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS icpsr_politician_map (
+                icpsr INT PRIMARY KEY,
+                politician_id INT REFERENCES Politicians(PoliticianID) ON DELETE CASCADE,
+                bioname TEXT,
+                state TEXT,
+                chamber TEXT,
+                matched_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            );
+        """)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_icpsr_map_politician_id ON icpsr_politician_map (politician_id);")
+        conn.commit()
+        print("Table 'icpsr_politician_map' is ready.")
+    except Exception as e:
+        print(f"Error creating table: {e}"); conn.rollback(); raise e
+
+def load_members(member_filepath):
+    """{icpsr: (bioname, full_state_name, chamber)} from the member file, as of each member's latest Congress."""
+    print(f"Loading members from {member_filepath}...")
+    try:
+        with open(member_filepath, 'r', encoding='utf-8') as f: member_data = json.load(f)
+    except FileNotFoundError: print(f"Error: Member file not found at '{member_filepath}'"); raise
+    members = {}; latest = {}
+    for member in member_data:
+        icpsr, congress = member.get('icpsr'), member.get('congress') or 0
+        state = STATE_ABBREVIATION_MAP.get((member.get('state_abbrev') or '').strip().upper())
+        bioname = (member.get('bioname') or '').strip()
+        if not (icpsr and state and bioname) or congress < START_CONGRESS or congress < latest.get(icpsr, 0):
+            continue
+        members[icpsr] = (bioname, state, member.get('chamber')); latest[icpsr] = congress
+    print(f"Loaded {len(members)} members of the {START_CONGRESS}th Congress and later.")
+    return members
+
+def load_politician_matcher(cur):
+    """Politicians from the DB in a candidate matcher, indexed by lowercase full state name."""
+    print("Loading Politicians lookup from DB...")
+    matcher = CandidateMatcher()
+    cur.execute("SELECT PoliticianID, FirstNameKey, LastNameKey, StateKey, Chamber FROM Politicians") # already lowercase
+    for pid, fname, lname, state, chamber in cur.fetchall():
+        matcher.add(pid, fname, lname, (state or '').strip(), chamber) # e.g., 'new jersey'
+    print(f"Loaded {len(matcher)} politicians in {matcher.block_count} states.")
+    return matcher
+
+def update_icpsr_map(conn, members, full=False):
+    """Brings the map in line with members, matching only new, changed and unmatched ones (or all if full).
+
+    Returns (matched, unmatched, removed) counts of the members it touched.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT icpsr, politician_id, bioname, state, chamber FROM icpsr_politician_map")
+    existing = {icpsr: (pid, (bioname, state, chamber)) for icpsr, pid, bioname, state, chamber in cur.fetchall()}
+
+    removed = [icpsr for icpsr in existing if icpsr not in members]
+    if removed:
+        cur.execute("DELETE FROM icpsr_politician_map WHERE icpsr = ANY(%s)", (removed,))
+    to_match = [icpsr for icpsr, member in members.items()
+                if full or icpsr not in existing or existing[icpsr][0] is None or existing[icpsr][1] != member]
+    print(f"{len(existing)} members mapped before; matching {len(to_match)}, removing {len(removed)}.")
+
+    rows = []
+    if to_match:
+        with report.stage("load_lookups") as stage:
+            add_politician_name_keys(cur); conn.commit()
+            matcher = load_politician_matcher(cur); stage.rows_out += len(matcher)
+        with report.stage("match") as stage:
+            for icpsr in to_match:
+                bioname, state, chamber = members[icpsr]
+                rows.append((icpsr, matcher.match(bioname, state, chamber), bioname, state, chamber))
+            stage.rows_in += len(to_match); stage.rows_out += sum(row[1] is not None for row in rows)
+        print(matcher.format_stats())
+
+    with report.stage("write") as stage:
+        execute_values(cur, """
+            INSERT INTO icpsr_politician_map (icpsr, politician_id, bioname, state, chamber) VALUES %s
+            ON CONFLICT (icpsr) DO UPDATE SET politician_id = EXCLUDED.politician_id, bioname = EXCLUDED.bioname,
+                state = EXCLUDED.state, chamber = EXCLUDED.chamber, matched_at = now();
+        """, rows, page_size=BATCH_SIZE)
+        conn.commit(); stage.rows_out += len(rows)
+    cur.close()
+    matched = sum(row[1] is not None for row in rows)
+    return matched, len(rows) - matched, len(removed)
+
+def load_icpsr_politician_ids(cur):
+    """The map as a flat array indexed by ICPSR: PoliticianID, or 0 for members without one."""
+    cur.execute("SELECT icpsr, politician_id FROM icpsr_politician_map WHERE politician_id IS NOT NULL")
+    pairs = cur.fetchall()
+    ids = array('l', bytes(array('l').itemsize * (max((icpsr for icpsr, _ in pairs), default=-1) + 1)))
+    for icpsr, pid in pairs:
+        ids[icpsr] = pid
+    return ids
+
+def build_icpsr_map(full=False):
+    """Matches the member file against Politicians and updates icpsr_politician_map."""
+    conn = None
+    try:
+        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params)
+        create_icpsr_map_table_if_not_exists(conn)
+        with report.stage("parse") as stage:
+            members = load_members(MEMBER_FILE_PATH); stage.rows_out += len(members)
+        matched, unmatched, removed = update_icpsr_map(conn, members, full=full)
+
+        cur = conn.cursor()
+        cur.execute("SELECT COUNT(*), COUNT(politician_id) FROM icpsr_politician_map;"); total, mapped = cur.fetchone(); cur.close()
+        print(f"\n--- Mapping Summary ---")
+        print(f"Matched {matched} members this run, {unmatched} without a politician; removed {removed}.")
+        print(f"Total members mapped in DB: {mapped} of {total}")
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
+        if conn: conn.rollback()
+        raise
+    finally:
+        if conn: conn.close(); print("Database connection closed.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="rematch every member, not just new, changed and unmatched ones")
+    args = parser.parse_args()
+    with report.run():
+        build_icpsr_map(full=args.full)
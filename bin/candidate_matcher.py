@@ -0,0 +1,227 @@
+"""Matches people named in the source data to Politicians rows.
+
+FEC candidate files name people like 'PELOSI, NANCY P (DEM)' or
+'CRUZ, RAFAEL EDWARD "TED"', the Voteview member file like
+'CRUZ, Rafael Edward (Ted)'. CandidateMatcher indexes politicians by state
+(blocking: a name is only compared with the politicians of one state, and
+presidents with each other) and within a state by last name, then scores
+the candidates it finds:
+
+    last name   all tokens equal, one token of a compound name ('Herrera
+                Beutler' ~ 'BEUTLER'), else Jaro-Winkler similarity
+    first name  equal (including a quoted or bracketed nickname), a known
+                nickname ('bernie' ~ 'bernard'), a middle name the person
+                goes by, an initial, else Jaro-Winkler similarity
+
+When no indexed last name fits, the politicians of the state whose last
+name starts with the same letter and is of similar length are scored; such
+a fuzzy match also needs a first name that is equal or a nickname. A name
+matches only with one clear best candidate at or above the threshold; the
+office (House, Senate, President) breaks ties. Parsed names (see
+bin/name_normalization.py) and match results are cached, since every FEC
+cycle and every Congress in the member file repeats the same people.
+stats() reports the match rate and throughput.
+
+    matcher = CandidateMatcher()
+    matcher.add(412, "Nancy", "Pelosi", "california", "House")
+    matcher.match("PELOSI, NANCY P (DEM)", "california", "H")  # -> 412
+"""
+import time
+
+from bin.name_normalization import parse_name
+
+NICKNAME_GROUPS = [
+    ("albert", "al", "bert"), ("alan", "al"), ("alexander", "alex", "al"), ("alexandria", "alex"),
+    ("andrew", "andy", "drew"), ("anthony", "tony"), ("barbara", "barb"), ("benjamin", "ben"),
+    ("bernard", "bernie"), ("catherine", "kathy", "cathy", "kate"), ("charles", "chuck", "charlie", "chip"),
+    ("christopher", "chris"), ("christine", "chris"), ("cynthia", "cindy"), ("daniel", "dan", "danny"),
+    ("david", "dave"), ("deborah", "debbie", "deb"), ("donald", "don"), ("douglas", "doug"),
+    ("edward", "ed", "eddie", "ted", "ned"), ("elizabeth", "liz", "beth", "betsy", "betty"),
+    ("frederick", "fred"), ("gerald", "jerry"), ("gregory", "greg"), ("harold", "hal"), ("henry", "hank"),
+    ("james", "jim", "jimmy", "jamie"), ("jeffrey", "jeff"), ("jennifer", "jenny", "jen"),
+    ("john", "jack", "johnny", "jon"), ("jonathan", "jon"), ("joseph", "joe", "joey"), ("joshua", "josh"),
+    ("katherine", "kathy", "kate", "katie"), ("kathleen", "kathy"), ("kenneth", "ken", "kenny"),
+    ("kimberly", "kim"), ("lawrence", "larry"), ("leonard", "len", "lenny"), ("margaret", "maggie", "peggy", "meg"),
+    ("matthew", "matt"), ("michael", "mike", "mickey"), ("mitchell", "mitch"), ("nicholas", "nick"),
+    ("pamela", "pam"), ("patricia", "pat", "patty", "trish"), ("patrick", "pat"), ("peter", "pete"),
+    ("raymond", "ray"), ("rebecca", "becky"), ("richard", "dick", "rick", "rich"),
+    ("robert", "bob", "bobby", "rob", "bert"), ("ronald", "ron"), ("russell", "russ"), ("samuel", "sam"),
+    ("stephen", "steve", "steven"), ("susan", "sue", "suzanne"), ("theodore", "ted", "teddy"),
+    ("thomas", "tom", "tommy"), ("timothy", "tim"), ("victoria", "vicky"),
+    ("william", "bill", "billy", "will", "willie"), ("zachary", "zach"),
+]
+NICKNAMES = {}  # name -> ids of the groups it belongs to
+for _group_id, _group in enumerate(NICKNAME_GROUPS):
+    for _name in _group:
+        NICKNAMES.setdefault(_name, set()).add(_group_id)
+
+OFFICE_CODES = {"house": "H", "senate": "S", "executive": "P", "president": "P", "h": "H", "s": "S", "p": "P"}
+AMBIGUOUS = object()
+
+
+def jaro_winkler(a, b, prefix_scale=0.1):
+    """Jaro-Winkler similarity of two strings, from 0.0 to 1.0."""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_b = [False] * len_b
+    matches_a = []
+    for i, ch in enumerate(a):
+        for j in range(max(0, i - window), min(len_b, i + window + 1)):
+            if not matched_b[j] and b[j] == ch:
+                matched_b[j] = True
+                matches_a.append(ch)
+                break
+    if not matches_a:
+        return 0.0
+    matches_b = [b[j] for j in range(len_b) if matched_b[j]]
+    m = len(matches_a)
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) / 2
+    jaro = (m / len_a + m / len_b + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def same_given_name(x, y):
+    """True for equal names or nicknames of the same name ('bill' ~ 'william')."""
+    return x == y or bool(NICKNAMES.get(x, set()) & NICKNAMES.get(y, set()))
+
+
+def first_name_score(a, b):
+    """How well the first names of two ParsedNames agree, from 0.0 to 1.0."""
+    if not a.first or not b.first:
+        return 0.8  # one side has only a last name; rely on it
+    names_a = {a.first, *a.nicknames}
+    names_b = {b.first, *b.nicknames}
+    if names_a & names_b:
+        return 1.0
+    if any(same_given_name(x, y) for x in names_a for y in names_b):
+        return 0.95
+    if (any(same_given_name(x, m) for x in names_a for m in b.middle if len(m) > 1)
+            or any(same_given_name(y, m) for y in names_b for m in a.middle if len(m) > 1)):
+        return 0.9  # goes by a middle name
+    if (len(a.first) == 1 or len(b.first) == 1) and a.first[0] == b.first[0]:
+        return 0.85
+    return max(jaro_winkler(x, y) for x in names_a for y in names_b)
+
+
+def last_name_score(a, b):
+    if a.last == b.last:
+        return 1.0
+    if {t for t in a.last_tokens if len(t) > 2} & set(b.last_tokens):
+        return 0.92  # one part of a compound or hyphenated name
+    return jaro_winkler(a.last, b.last)
+
+
+class CandidateMatcher:
+    """An index of politicians by state and last name that scores names against them."""
+
+    def __init__(self, threshold=0.88, last_name_min=0.9, fuzzy_first_min=0.95):
+        self.threshold = threshold
+        self.last_name_min = last_name_min
+        self.fuzzy_first_min = fuzzy_first_min
+        # state -> ({last name or token: [entries]}, {initial of last name: [entries]}),
+        # entry = (pid, ParsedName, office)
+        self._blocks = {}
+        self._results = {}  # (name, state, office) -> pid or None
+        self.size = 0
+        self.lookups = 0
+        self.matched = 0
+        self.fuzzy = 0  # distinct names matched only by fuzzy scoring
+        self.ambiguous = 0  # distinct names with tied best candidates
+        self.seconds = 0.0
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def block_count(self):
+        return len(self._blocks)
+
+    def add(self, pid, first_name, last_name, state, office=None):
+        """Indexes a politician under a (lowercase, full) state name; office is a chamber or office code."""
+        parsed = parse_name(f"{last_name or ''}, {first_name or ''}")
+        if not parsed.last or not state:
+            return
+        entry = (pid, parsed, OFFICE_CODES.get(str(office or "").lower()))
+        index, by_initial = self._blocks.setdefault(state, ({}, {}))
+        by_initial.setdefault(parsed.last[0], []).append(entry)
+        for key in {parsed.last, *parsed.last_tokens}:
+            index.setdefault(key, []).append(entry)
+        self._results.clear()
+        self.size += 1
+
+    def match(self, name, state, office=None):
+        """The PoliticianID for a source name in a state, or None if there is no clear match."""
+        start = time.perf_counter()
+        self.lookups += 1
+        key = (name, state, office)
+        if key in self._results:
+            pid = self._results[key]
+        else:
+            pid = self._results[key] = self._match(parse_name(name), state, OFFICE_CODES.get(str(office or "").lower()))
+        if pid is not None:
+            self.matched += 1
+        self.seconds += time.perf_counter() - start
+        return pid
+
+    def _match(self, parsed, state, office):
+        if state not in self._blocks or not parsed.last:
+            return None
+        index, by_initial = self._blocks[state]
+        indexed = {id(e): e for key in {parsed.last, *parsed.last_tokens} for e in index.get(key, ())}
+        pid = self._best(parsed, indexed.values(), office)
+        if pid is None:
+            similar = [e for e in by_initial.get(parsed.last[0], ()) if abs(len(e[1].last) - len(parsed.last)) <= 2]
+            pid = self._best(parsed, similar, office, self.fuzzy_first_min)
+            if pid is not None and pid is not AMBIGUOUS:
+                self.fuzzy += 1
+        return None if pid is AMBIGUOUS else pid
+
+    def _best(self, parsed, entries, office, first_min=0.0):
+        """The single best-scoring pid, None if nothing qualifies, AMBIGUOUS if it is a tie."""
+        scored = []
+        for pid, candidate, candidate_office in entries:
+            last = last_name_score(parsed, candidate)
+            if last < self.last_name_min:
+                continue
+            first = first_name_score(parsed, candidate)
+            if first < first_min:
+                continue
+            score = round((last + first) / 2, 4)
+            if score >= self.threshold:
+                scored.append((score, office is not None and candidate_office == office, pid))
+        if not scored:
+            return None
+        scored.sort(reverse=True)
+        if len(scored) > 1 and scored[0][:2] == scored[1][:2] and scored[0][2] != scored[1][2]:
+            self.ambiguous += 1
+            return AMBIGUOUS
+        return scored[0][2]
+
+    def stats(self):
+        unique = len(self._results)
+        return {
+            "lookups": self.lookups,
+            "unique_names": unique,
+            "matched": self.matched,
+            "match_rate": round(self.matched / self.lookups, 4) if self.lookups else None,
+            "unique_matched": sum(pid is not None for pid in self._results.values()),
+            "fuzzy": self.fuzzy,
+            "ambiguous": self.ambiguous,
+            "names_per_s": round(self.lookups / self.seconds) if self.seconds > 0 else None,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        rate = f"{s['match_rate']:.1%}" if s["match_rate"] is not None else "-"
+        return (f"Matched {s['matched']:,} of {s['lookups']:,} names ({rate}); "
+                f"{s['unique_matched']:,} of {s['unique_names']:,} distinct, {s['fuzzy']} by fuzzy scoring, "
+                f"{s['ambiguous']} ambiguous; {s['names_per_s'] or '-'} names/s.")
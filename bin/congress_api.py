@@ -0,0 +1,259 @@
+"""Concurrent, rate-limited client for the Congress.gov API.
+
+Congress.gov allows 5,000 requests per hour per key. CongressClient shares
+one token bucket (CONGRESS_API_RATE_PER_HOUR, with bursts of up to
+CONGRESS_API_BURST requests) across CONGRESS_API_WORKERS threads, and
+retries 429, 5xx and connection errors with exponential backoff and full
+jitter, honouring Retry-After.
+
+Paginated lists are fetched in two rounds: the first page of every query
+(which gives the total count), then all remaining pages at once by offset,
+so e.g. the members of twelve Congresses take about as long as the slowest
+few requests rather than the sum of all of them.
+
+With a ResponseCache, responses are kept gzip-compressed on disk, keyed on
+URL and query parameters. Cached responses are revalidated with
+If-None-Match / If-Modified-Since (a 304 costs no transfer), except those
+stored as immutable, e.g. the members of a closed Congress, which are
+reused without a request. In offline mode everything is replayed from the
+cache and a response that is not cached is an error, so runs are
+repeatable without network access.
+
+    client = CongressClient(config.CONGRESS_GOV_API_KEY)
+    members = client.fetch_all("member", {"currentMember": "true"})
+    by_congress = client.fetch_many({c: ("member", {"congress": c}) for c in range(108, 120)})
+"""
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+import requests
+
+import app.config as config
+
+API_BASE_URL = "https://api.congress.gov/v3"
+PAGE_SIZE = 250  # the API's maximum limit
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CongressApiError(Exception):
+    """A request failed for good: a non-retryable status or too many retries."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, holding at most capacity."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class ResponseCache:
+    """Gzip-compressed JSON responses on disk, one file per URL and query parameters."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, url, params):
+        key = hashlib.sha256(f"{url}?{urlencode(sorted(params.items()))}".encode()).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    def load(self, url, params):
+        """The cached entry for the request, or None (a corrupt entry counts as missing)."""
+        try:
+            with gzip.open(self.path(url, params), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def store(self, url, params, body, etag=None, last_modified=None, immutable=False):
+        path = self.path(url, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "url": url,
+            "params": params,
+            "etag": etag,
+            "last_modified": last_modified,
+            "immutable": immutable,
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "body": body,
+        }
+        # Written aside and renamed so a concurrent reader never sees half a file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+
+class CongressClient:
+    """Fetches Congress.gov endpoints from a thread pool within the rate limit."""
+
+    def __init__(self, api_key, base_url=API_BASE_URL, rate_per_hour=None, burst=None, workers=None,
+                 max_retries=6, backoff_base=1.0, backoff_max=60.0, timeout=30, page_size=PAGE_SIZE,
+                 cache=None, offline=False, sleep=time.sleep):
+        if offline and cache is None:
+            raise ValueError("Offline mode needs a response cache")
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.workers = workers or config.CONGRESS_API_WORKERS
+        self.bucket = TokenBucket((rate_per_hour or config.CONGRESS_API_RATE_PER_HOUR) / 3600.0,
+                                  burst or config.CONGRESS_API_BURST, sleep=sleep)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.page_size = page_size
+        self.cache = cache
+        self.offline = offline
+        self.sleep = sleep
+        self.requests_sent = 0
+        self.retries = 0
+        self.cache_hits = 0  # served from the cache without a request
+        self.revalidated = 0  # 304 Not Modified
+        self._local = threading.local()  # one requests.Session per thread
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers["X-Api-Key"] = self.api_key or ""
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+
+    def backoff(self, attempt, retry_after=None):
+        """Seconds to wait before retry number attempt (0-based): full jitter, at least Retry-After."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after:
+            try:
+                delay = max(delay, min(self.backoff_max, float(retry_after)))
+            except ValueError:
+                pass  # an HTTP date; the jittered delay will do
+        return delay
+
+    def get(self, path, params=None, immutable=False):
+        """GETs base_url/path as JSON, retrying throttling, server and connection errors.
+
+        immutable marks a response that will never change: once cached as such
+        it is reused without revalidation. An entry cached before the query
+        became immutable (e.g. while its Congress was current) is revalidated
+        once more and stored as immutable.
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        params = dict(params or {}, format="json")
+        entry = self.cache.load(url, params) if self.cache else None
+        if entry and (self.offline or entry["immutable"]):
+            with self._lock:
+                self.cache_hits += 1
+            return entry["body"]
+        if self.offline:
+            raise CongressApiError(f"GET {url} {params} is not cached (offline mode)")
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            with self._lock:
+                self.requests_sent += 1
+            retry_after = None
+            try:
+                response = self._session().get(url, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code == 304 and entry:
+                    with self._lock:
+                        self.revalidated += 1
+                    return self._cached(url, params, entry["body"], response, immutable)
+                if response.status_code not in RETRY_STATUSES:
+                    if response.status_code >= 400:
+                        raise CongressApiError(f"GET {url} returned {response.status_code}")
+                    return self._cached(url, params, response.json(), response, immutable)
+                error = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+            if attempt == self.max_retries:
+                raise CongressApiError(f"GET {url} failed after {attempt + 1} attempts: {error}")
+            with self._lock:
+                self.retries += 1
+            self.sleep(self.backoff(attempt, retry_after))
+
+    def _cached(self, url, params, body, response, immutable):
+        if self.cache:
+            self.cache.store(url, params, body, etag=response.headers.get("ETag"),
+                             last_modified=response.headers.get("Last-Modified"), immutable=immutable)
+        return body
+
+    def fetch_many(self, queries, item_key="members", immutable=()):
+        """Fetches every page of several list queries concurrently.
+
+        queries maps a caller's key to (path, params); returns {key: [items]} with
+        the items of each query in API order. The responses of queries whose keys
+        are in immutable are cached as never changing.
+        """
+        def page(key, offset):
+            path, params = queries[key]
+            data = self.get(path, dict(params, offset=offset, limit=self.page_size), immutable=key in immutable)
+            return data.get(item_key, []), (data.get("pagination") or {}).get("count")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            first = {key: pool.submit(page, key, 0) for key in queries}
+            pages = {key: {0: future.result()[0]} for key, future in first.items()}
+            rest = {}
+            for key, future in first.items():
+                items, count = future.result()
+                if count is None:
+                    # No total to plan with; walk the pages until a short one
+                    offset = self.page_size
+                    while len(pages[key][offset - self.page_size]) == self.page_size:
+                        pages[key][offset] = page(key, offset)[0]
+                        offset += self.page_size
+                    continue
+                for offset in range(self.page_size, count, self.page_size):
+                    rest[(key, offset)] = pool.submit(page, key, offset)
+            for (key, offset), future in rest.items():
+                pages[key][offset] = future.result()[0]
+        return {key: [item for offset in sorted(by_offset) for item in by_offset[offset]]
+                for key, by_offset in pages.items()}
+
+    def fetch_all(self, path, params=None, item_key="members", immutable=False):
+        """Every item of one paginated list."""
+        return self.fetch_many({None: (path, params or {})}, item_key, [None] if immutable else ())[None]
@@ -0,0 +1,221 @@
+"""Per-stage timing and throughput reports for the loaders.
+
+Each loader keeps a module-level RunReport and marks its stages:
+
+    report = RunReport("populate_votes")
+
+    with report.stage("parse") as stage:
+        data = json.load(f)
+        stage.rows_in += len(data)
+
+Running the entry point under ``with report.run():`` resets the report,
+times the whole run and, whether or not it succeeds, prints a summary and
+writes the report as JSON to config.LOADER_REPORT_DIR
+(<loader>-<UTC timestamp>.json) for tracking ingest performance over time.
+The run's status is "error" if an exception leaves the block, so loaders
+let failures propagate (after rolling back) rather than printing and
+returning; sys.exit(0) still counts as "ok".
+
+Each stage records wall and CPU time, rows in and out, rows/sec and the
+process's peak RSS when it last finished. Entering a stage again adds to
+it, so a stage run once per file reports the total. A stage entered inside
+another is not counted in the outer one as well, so stage times add up to
+at most the run's time; the rest is reported as "other".
+
+    python bin/loader_report.py local/loader_runs/populate_votes-*.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config
+
+
+def peak_rss_mb():
+    """The process's peak resident set size so far, in MB (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Stage:
+    """Accumulated time and row counts for one named stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.peak_rss_mb = None
+
+    def as_dict(self):
+        rows = self.rows_out or self.rows_in
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall_s": round(self.wall_s, 3),
+            "cpu_s": round(self.cpu_s, 3),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "rows_per_s": round(rows / self.wall_s, 1) if rows and self.wall_s > 0 else None,
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+
+
+class RunReport:
+    """Collects stages for one loader run and saves them as a JSON report."""
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.reset()
+
+    def reset(self):
+        self.stages = {}
+        self._stack = []  # [stage, wall start, cpu start, nested wall, nested cpu]
+        self.started_at = None
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.status = None
+        self.error = None
+        self.path = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Times the block as stage name; yields the Stage for row counts."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+        frame = [stage, time.perf_counter(), time.process_time(), 0.0, 0.0]
+        self._stack.append(frame)
+        try:
+            yield stage
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame[1]
+            cpu = time.process_time() - frame[2]
+            stage.calls += 1
+            stage.wall_s += wall - frame[3]
+            stage.cpu_s += cpu - frame[4]
+            stage.peak_rss_mb = peak_rss_mb()
+            if self._stack:
+                self._stack[-1][3] += wall
+                self._stack[-1][4] += cpu
+
+    def count(self, name, rows_in=0, rows_out=0):
+        """Adds row counts to a stage without timing anything."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+        stage.rows_in += rows_in
+        stage.rows_out += rows_out
+
+    @contextlib.contextmanager
+    def run(self, save=True):
+        """Times a whole loader run, then prints and (by default) saves the report."""
+        self.reset()
+        self.started_at = datetime.now(timezone.utc)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        self.status = "ok"
+        try:
+            yield self
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                self.status = "error"
+                self.error = f"SystemExit: {e.code}"
+            raise
+        except BaseException as e:
+            self.status = "error"
+            self.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.wall_s = time.perf_counter() - wall_start
+            self.cpu_s = time.process_time() - cpu_start
+            print(format_report(self.as_dict()))
+            if save:
+                try:
+                    self.save()
+                    print(f"Run report saved to {self.path}")
+                except OSError as e:
+                    print(f"Warning: could not save run report: {e}")
+
+    def as_dict(self):
+        stages = [stage.as_dict() for stage in self.stages.values()]
+        staged_wall = sum(s["wall_s"] for s in stages)
+        return {
+            "loader": self.loader,
+            "started_at": self.started_at.isoformat(timespec="seconds") if self.started_at else None,
+            "status": self.status,
+            "error": self.error,
+            "wall_s": round(self.wall_s, 3),
+            "cpu_s": round(self.cpu_s, 3),
+            "other_wall_s": round(max(0.0, self.wall_s - staged_wall), 3),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": stages,
+            "host": socket.gethostname(),
+            "commit": git_commit(),
+            "argv": sys.argv,
+        }
+
+    def save(self, directory=None):
+        directory = directory or config.LOADER_REPORT_DIR
+        os.makedirs(directory, exist_ok=True)
+        stamp = (self.started_at or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+        self.path = os.path.join(directory, f"{self.loader}-{stamp}.json")
+        with open(self.path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+        return self.path
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_report(report):
+    """The report as a fixed-width table."""
+    lines = [
+        f"\n--- Run report: {report['loader']} ({report['status']}) ---",
+        f"{'stage':<22}{'wall s':>9}{'cpu s':>9}{'rows in':>12}{'rows out':>12}{'rows/s':>11}{'rss MB':>9}",
+    ]
+    for s in report["stages"]:
+        lines.append(f"{s['name']:<22}{s['wall_s']:>9.2f}{s['cpu_s']:>9.2f}{s['rows_in']:>12,}{s['rows_out']:>12,}"
+                     f"{str(s['rows_per_s'] or '-'):>11}{str(s['peak_rss_mb'] or '-'):>9}")
+    lines.append(f"{'other':<22}{report['other_wall_s']:>9.2f}")
+    lines.append(f"{'total':<22}{report['wall_s']:>9.2f}{report['cpu_s']:>9.2f}{'':>35}"
+                 f"{str(report['peak_rss_mb'] or '-'):>9}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print saved loader run reports.")
+    parser.add_argument("paths", nargs="+", help="report JSON files")
+    args = parser.parse_args()
+    for path in args.paths:
+        with open(path) as f:
+            report = json.load(f)
+        print(f"{path} ({report['started_at']}, commit {report.get('commit')})")
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Name and bill-number normalization shared by the loaders.
+
+The loaders see the same strings over and over: every FEC cn cycle repeats
+its candidates, every Congress in the Voteview member file repeats its
+members, and every roll call repeats a bill number. The normalizers here
+use precompiled patterns and are memoized with bounded LRU caches
+(NAME_CACHE_SIZE entries each), so a repeated string costs a dict lookup
+and memory stays flat on arbitrarily large inputs.
+
+    parse_name('PELOSI, NANCY P (DEM)')
+    # ParsedName(first='nancy', middle=('p',), last='pelosi', last_tokens=('pelosi',), nicknames=())
+    split_bill_number('H.R. 1234')      # ('hr', 1234)
+    split_last_first('Pelosi, Nancy')   # ('Nancy', 'Pelosi')
+
+benchmarks/name_normalization_benchmark.py measures names/sec.
+"""
+import functools
+import re
+from collections import namedtuple
+
+NAME_CACHE_SIZE = 1 << 16
+
+SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v", "md", "phd", "dds", "esq"})
+TITLES = frozenset({"mr", "mrs", "ms", "dr", "hon", "rev"})
+PARTY_WORDS = frozenset({"d", "r", "i", "l", "dem", "rep", "ind", "lib", "grn", "democrat", "republican", "independent"})
+
+ALIAS_PATTERN = re.compile(r'"([^"]*)"|\(([^)]*)\)')
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+BILL_TYPE_PATTERN = re.compile(r"[A-Za-z. ]*")
+BILL_NUM_PATTERN = re.compile(r"[0-9]+")
+BILL_TYPE_JUNK = str.maketrans("", "", " .")
+
+ParsedName = namedtuple("ParsedName", "first middle last last_tokens nicknames")
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def parse_name(name):
+    """Splits 'LAST, FIRST MIDDLE SUFFIX "NICK"' or 'First Middle Last' into lowercase parts."""
+    name = str(name or "").lower().replace("'", "").replace("’", "")
+    nicknames = []
+    if '"' in name or "(" in name:
+        for quoted, bracketed in ALIAS_PATTERN.findall(name):
+            alias = TOKEN_PATTERN.findall(quoted or bracketed)
+            if alias and alias[0] not in PARTY_WORDS:
+                nicknames.append(alias[0])
+        name = ALIAS_PATTERN.sub(" ", name)
+
+    if "," in name:
+        last_part, _, rest = name.partition(",")
+        last_tokens = [t for t in TOKEN_PATTERN.findall(last_part) if t not in SUFFIXES]
+        given = [t for t in TOKEN_PATTERN.findall(rest) if t not in SUFFIXES and t not in TITLES]
+    else:
+        tokens = [t for t in TOKEN_PATTERN.findall(name) if t not in SUFFIXES and t not in TITLES]
+        last_tokens, given = tokens[-1:], tokens[:-1]
+    return ParsedName(
+        first=given[0] if given else "",
+        middle=tuple(given[1:]),
+        last="".join(last_tokens),
+        last_tokens=tuple(last_tokens),
+        nicknames=tuple(nicknames),
+    )
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def split_bill_number(bill_number):
+    """(type code, number) of a bill number, e.g. 'H.R. 1234' -> ('hr', 1234); None without both.
+
+    Matches the bill_type and bill_num columns of Bills (app/schema.py).
+    """
+    bill_number = str(bill_number or "")
+    bill_type = BILL_TYPE_PATTERN.match(bill_number).group().lower().translate(BILL_TYPE_JUNK)
+    num = BILL_NUM_PATTERN.search(bill_number)
+    if not bill_type or not num:
+        return None
+    return bill_type, int(num.group())
+
+
+def split_last_first(full_name):
+    """(first, last) from a Congress.gov 'Last, First' name; a name without a comma is all last name."""
+    full_name = full_name or ""
+    if "," in full_name:
+        last_name, _, first_name = full_name.partition(",")
+        return first_name.strip(), last_name.strip()
+    return "", full_name.strip()
+
+
+def cache_info():
+    """Hit and miss counts of the memoized normalizers, for loader logs and benchmarks."""
+    return {func.__name__: func.cache_info() for func in (parse_name, split_bill_number)}
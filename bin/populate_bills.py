@@ -1,188 +1,350 @@
-import sys
-import os
-import zipfile 
-import io 
-import xml.etree.ElementTree as ET
-import psycopg2
-import datetime
-import time
-from psycopg2.extras import execute_values
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-import app.config as config   # Imports your configuration file
-
-# --- CONFIGURATION ---
-# All config is now pulled from test.py
-BILL_DATA_PATH = config.BILL_DATA_PATH
-
-# Define the range of Congresses you downloaded
-START_CONGRESS = 108
-END_CONGRESS = 119 
-INNER_ZIP_BASENAMES = ['hr', 's', 'hjres', 'sjres']
-BATCH_SIZE = 1000
-
-def create_bills_table_if_not_exists(conn):
-    """Creates the Bills table if it doesn't already exist."""
-    print("Ensuring 'Bills' table exists...")
-    try:
-        cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS Bills (
-                BillID SERIAL PRIMARY KEY,
-                BillNumber TEXT UNIQUE NOT NULL,
-                Title TEXT,
-                DateIntroduced DATE,
-                Congress INT,
-                subjects TEXT[]
-            );
-        """)
-        # Create the index
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_bills_congress ON Bills (Congress);")
-        conn.commit()
-        print("Table 'Bills' is ready.")
-    except Exception as e:
-        print(f"Error creating table: {e}"); conn.rollback(); raise e
-
-def clear_bills_table(conn):
-    """Deletes all rows from the Bills table."""
-    print("Clearing all old data from the 'Bills' table...")
-    try:
-        cur = conn.cursor()
-        cur.execute("DELETE FROM Bills;")
-        cur.execute("ALTER SEQUENCE Bills_BillID_seq RESTART WITH 1;")
-        conn.commit()
-        print("Table cleared successfully.")
-    except Exception as e:
-        print(f"Error clearing table: {e}"); conn.rollback(); raise e
-
-def parse_and_insert_enacted_laws_fast(base_path):
-    """Finds zip files in subfolders, unzips them, parses XMLs, and batch inserts laws WITH SUBJECTS."""
-    conn = None
-    total_inserted_count = 0
-    total_xml_files_processed = 0
-    
-    if not os.path.isdir(base_path):
-        print(f"Error: Base bills folder not found at '{base_path}'.")
-        print("Please ensure your 'bills' folder is correctly structured.")
-        return
-
-    try:
-        # Connect using the details from test.py
-        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params) 
-        
-        create_bills_table_if_not_exists(conn)
-        clear_bills_table(conn)
-        cur = conn.cursor()
-        overall_start_time = time.time()
-        print(f"Starting to process ZIP files from: {base_path}")
-
-        # Loop through each expected Congress number
-        for congress_num in range(START_CONGRESS, END_CONGRESS + 1):
-            congress_start_time = time.time()
-            congress_path = os.path.join(base_path, str(congress_num)) # Path to folder '108', '109', etc.
-            print(f"\n--- Processing Congress {congress_num} ---")
-            
-            if not os.path.isdir(congress_path):
-                print(f"Warning: Directory not found for Congress {congress_num} at '{congress_path}'. Skipping.")
-                continue
-                
-            laws_for_this_congress = [] 
-
-            # Loop through the expected inner zip basenames (hr, s, etc.)
-            for basename in INNER_ZIP_BASENAMES:
-                zip_filename = f"BILLSTATUS-{congress_num}-{basename}.zip"
-                zip_filepath = os.path.join(congress_path, zip_filename) # Path to the actual zip file
-                
-                if not os.path.isfile(zip_filepath):
-                    print(f" 	Warning: ZIP file '{zip_filename}' not found. Skipping.")
-                    continue
-                
-                print(f" 	Processing ZIP file: {zip_filename}...")
-                try:
-                    # Open the zip file directly from its path
-                    with zipfile.ZipFile(zip_filepath, 'r') as inner_zip_ref: 
-                        for member_filename in inner_zip_ref.namelist():
-                            if member_filename.endswith(".xml"):
-                                total_xml_files_processed += 1
-                                with inner_zip_ref.open(member_filename) as xml_file:
-                                    try:
-                                        xml_content_bytes = io.BytesIO(xml_file.read())
-                                        tree = ET.parse(xml_content_bytes); root = tree.getroot()
-
-                                        is_enacted = False
-                                        # Check if <laws> tag exists
-                                        if root.find('.//laws/item') is not None: is_enacted = True
-                                        else:
-                                            # Fallback: check latest action text
-                                            latest_action = root.find('.//latestAction/text')
-                                            if latest_action is not None and latest_action.text:
-                                                action = latest_action.text.strip().lower()
-                                                if "became public law" in action or "became private law" in action: is_enacted = True
-                                        
-                                        if is_enacted:
-                                            bill_node = root.find('.//bill');
-                                            if bill_node is None: continue
-                                            
-                                            b_type = bill_node.findtext('type','').strip(); b_num = bill_node.findtext('number','').strip()
-                                            b_title = bill_node.findtext('title','').strip()
-                                            b_intro_date = bill_node.findtext('.//introducedDate','').strip()
-                                            
-                                            # Extract subjects
-                                            subjects_list = []
-                                            policy_area_node = root.find('.//policyArea/name')
-                                            if policy_area_node is not None and policy_area_node.text:
-                                                subjects_list.append(policy_area_node.text.strip())
-
-                                            bill_num_ins = f"{b_type}{b_num}"; date_intro = None
-                                            if b_intro_date:
-                                                try: date_intro = datetime.date.fromisoformat(b_intro_date)
-                                                except: pass
-                                                
-                                            if bill_num_ins and bill_num_ins != 'NoneNone':
-                                                # Add tuple with 5 values
-                                                laws_for_this_congress.append((bill_num_ins, b_title, date_intro, congress_num, subjects_list))
-
-                                    except (ET.ParseError, Exception) as file_err: 
-                                        # print(f"Warning: Error parsing {member_filename}: {file_err}") # Uncomment for deep debug
-                                        pass # Suppress individual file parse errors
-                except (zipfile.BadZipFile, Exception) as zip_err:
-                     print(f" 	Error reading ZIP '{zip_filename}': {zip_err}. Skipping.")
-            
-            # Batch insert after processing all zips for this Congress
-            if laws_for_this_congress:
-                print(f"Found {len(laws_for_this_congress)} enacted laws for Congress {congress_num}. Batch inserting...")
-                # SQL now includes the 'subjects' column
-                sql = """
-                    INSERT INTO Bills (BillNumber, Title, DateIntroduced, Congress, subjects)
-                    VALUES %s
-                    ON CONFLICT (BillNumber) DO NOTHING;
-                """
-                try:
-                    execute_values(cur, sql, laws_for_this_congress, template=None, page_size=BATCH_SIZE)
-                    conn.commit(); print(f"Batch insert successful.")
-                    total_inserted_count += len(laws_for_this_congress)
-                except psycopg2.Error as db_err:
-                    print(f" 	DB batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
-            else:
-                print(f"Found 0 enacted laws for Congress {congress_num}.")
-            
-            print(f"--- Finished Congress {congress_num} in {time.time()-congress_start_time:.2f}s ---")
-
-        overall_end_time = time.time()
-        print(f"\n--- OVERALL SUCCESS ---")
-        print(f"Processed {total_xml_files_processed} XML files from all ZIP archives.")
-        cur.execute("SELECT COUNT(*) FROM Bills;"); final_count = cur.fetchone()[0]
-        print(f"Successfully inserted {final_count} unique laws.")
-        print(f"Total execution time: {overall_end_time - overall_start_time:.2f}s.")
-
-    except psycopg2.OperationalError as db_conn_err: print(f"--- DB CONNECTION ERROR --- Error: {db_conn_err}")
-    except Exception as e: print(f"An unexpected error occurred: {e}");
-    finally:
-        if conn:
-            try: cur.close()
-            except: pass
-            conn.close(); print("DB connection closed.")
-
-# Run the main function
-if __name__ == "__main__":
-    parse_and_insert_enacted_laws_fast(BILL_DATA_PATH)
\ No newline at end of file
+import argparse
+import sys
+import os
+import csv
+import zipfile 
+import io 
+import xml.etree.ElementTree as ET
+import psycopg2
+import datetime
+import time
+from psycopg2.extras import execute_values
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config   # Imports your configuration file
+from app.schema import add_bill_number_keys, bump_data_version
+from bin.loader_report import RunReport
+
+# --- CONFIGURATION ---
+# All config is now pulled from test.py
+BILL_DATA_PATH = config.BILL_DATA_PATH
+
+# Define the range of Congresses you downloaded
+START_CONGRESS = 108
+END_CONGRESS = 119 
+INNER_ZIP_BASENAMES = ['hr', 's', 'hjres', 'sjres']
+BATCH_SIZE = 1000
+
+report = RunReport("populate_bills")
+
+# --- Bill Details (--details) ---
+# Every bill, enacted or not, keyed by (congress, bill_type, bill_num) like
+# Bills' bill_type and bill_num columns. Filled from the same parse of each
+# BILLSTATUS XML as Bills.
+BILL_DETAIL_COLUMNS = {
+    "bill_status": ["congress", "bill_type", "bill_num", "title", "introduced_date", "policy_area", "is_enacted",
+                    "latest_action_date", "latest_action_text"],
+    "bill_subjects": ["congress", "bill_type", "bill_num", "subject"],
+    "bill_sponsors": ["congress", "bill_type", "bill_num", "role", "bioguide_id", "full_name", "party", "state",
+                      "sponsorship_date", "is_original_cosponsor"],
+    "bill_actions": ["congress", "bill_type", "bill_num", "seq", "action_date", "action_type", "text"],
+}
+
+def create_bills_table_if_not_exists(conn):
+    """Creates the Bills table if it doesn't already exist."""
+    print("Ensuring 'Bills' table exists...")
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS Bills (
+                BillID SERIAL PRIMARY KEY,
+                BillNumber TEXT UNIQUE NOT NULL,
+                Title TEXT,
+                DateIntroduced DATE,
+                Congress INT,
+                subjects TEXT[]
+            );
+        """)
+        # Create the index
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_bills_congress ON Bills (Congress);")
+        add_bill_number_keys(cur) # bill_type and bill_num, filled in from BillNumber on insert
+        conn.commit()
+        print("Table 'Bills' is ready.")
+    except Exception as e:
+        print(f"Error creating table: {e}"); conn.rollback(); raise e
+
+def clear_bills_table(conn):
+    """Deletes all rows from the Bills table."""
+    print("Clearing all old data from the 'Bills' table...")
+    try:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM Bills;")
+        cur.execute("ALTER SEQUENCE Bills_BillID_seq RESTART WITH 1;")
+        conn.commit()
+        print("Table cleared successfully.")
+    except Exception as e:
+        print(f"Error clearing table: {e}"); conn.rollback(); raise e
+
+def create_bill_detail_tables_if_not_exists(conn):
+    """Creates the bill_status, bill_subjects, bill_sponsors and bill_actions tables if they don't already exist."""
+    print("Ensuring bill detail tables exist...")
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS bill_status (
+                congress INT NOT NULL,
+                bill_type TEXT NOT NULL,
+                bill_num INT NOT NULL,
+                title TEXT,
+                introduced_date DATE,
+                policy_area TEXT,
+                is_enacted BOOLEAN NOT NULL,
+                latest_action_date DATE,
+                latest_action_text TEXT,
+                PRIMARY KEY (congress, bill_type, bill_num)
+            );
+            CREATE TABLE IF NOT EXISTS bill_subjects (
+                congress INT NOT NULL,
+                bill_type TEXT NOT NULL,
+                bill_num INT NOT NULL,
+                subject TEXT NOT NULL,
+                PRIMARY KEY (congress, bill_type, bill_num, subject)
+            );
+            CREATE TABLE IF NOT EXISTS bill_sponsors (
+                congress INT NOT NULL,
+                bill_type TEXT NOT NULL,
+                bill_num INT NOT NULL,
+                role TEXT NOT NULL, -- 'sponsor' or 'cosponsor'
+                bioguide_id TEXT,
+                full_name TEXT,
+                party TEXT,
+                state TEXT,
+                sponsorship_date DATE,
+                is_original_cosponsor BOOLEAN
+            );
+            CREATE TABLE IF NOT EXISTS bill_actions (
+                congress INT NOT NULL,
+                bill_type TEXT NOT NULL,
+                bill_num INT NOT NULL,
+                seq INT NOT NULL, -- order in the BILLSTATUS file
+                action_date DATE,
+                action_type TEXT,
+                text TEXT,
+                PRIMARY KEY (congress, bill_type, bill_num, seq)
+            );
+        """)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_bill_subjects_subject ON bill_subjects (subject);")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_bill_sponsors_bill ON bill_sponsors (congress, bill_type, bill_num);")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_bill_sponsors_bioguide_id ON bill_sponsors (bioguide_id);")
+        conn.commit()
+        print("Bill detail tables are ready.")
+    except Exception as e:
+        print(f"Error creating tables: {e}"); conn.rollback(); raise e
+
+def clear_bill_detail_tables(conn):
+    """Empties the bill detail tables."""
+    print("Clearing old bill details...")
+    try:
+        cur = conn.cursor()
+        cur.execute(f"TRUNCATE {', '.join(BILL_DETAIL_COLUMNS)};")
+        conn.commit()
+    except Exception as e:
+        print(f"Error clearing tables: {e}"); conn.rollback(); raise e
+
+def parse_date(text):
+    try: return datetime.date.fromisoformat((text or '').strip()[:10])
+    except ValueError: return None
+
+def is_bill_enacted(bill_node):
+    """Whether the bill element lists a law, or its latest action says it became one."""
+    # Direct children only: relatedBills entries (e.g. an enacted companion) have laws and latestActions of their own
+    if bill_node.find('laws/item') is not None: return True
+    action = (bill_node.findtext('latestAction/text') or '').strip().lower()
+    return "became public law" in action or "became private law" in action
+
+def extract_bill_details(root, congress_num, is_enacted):
+    """{table: [rows]} of one parsed BILLSTATUS document for the bill detail tables, or None if it names no bill."""
+    bill_node = root.find('.//bill')
+    if bill_node is None: return None
+    b_type = bill_node.findtext('type', '').strip().lower(); b_num = bill_node.findtext('number', '').strip()
+    if not b_type or not b_num.isdigit(): return None
+    key = (congress_num, b_type, int(b_num))
+
+    # Older files nest the subjects under billSubjects
+    subjects = [(node.text or '').strip() for node in bill_node.findall('subjects/legislativeSubjects/item/name')
+                + bill_node.findall('subjects/billSubjects/legislativeSubjects/item/name')]
+    sponsors = []
+    for role, path in (('sponsor', 'sponsors/item'), ('cosponsor', 'cosponsors/item')):
+        for item in bill_node.findall(path):
+            original = item.findtext('isOriginalCosponsor')
+            sponsors.append(key + (role, item.findtext('bioguideId'), item.findtext('fullName'), item.findtext('party'),
+                                   item.findtext('state'), parse_date(item.findtext('sponsorshipDate')),
+                                   None if original is None else original.strip().lower() == 'true'))
+    # Direct children only: amendments and related bills carry sponsors, actions and latestActions of their own
+    actions = [key + (seq, parse_date(item.findtext('actionDate')), item.findtext('type'), item.findtext('text'))
+               for seq, item in enumerate(bill_node.findall('actions/item'))]
+    return {
+        "bill_status": [key + (bill_node.findtext('title'), parse_date(bill_node.findtext('introducedDate')),
+                               bill_node.findtext('policyArea/name'), is_enacted,
+                               parse_date(bill_node.findtext('latestAction/actionDate')),
+                               bill_node.findtext('latestAction/text'))],
+        "bill_subjects": [key + (subject,) for subject in dict.fromkeys(subjects) if subject],
+        "bill_sponsors": sponsors,
+        "bill_actions": actions,
+    }
+
+def insert_bill_details(conn, cur, details):
+    """COPYs the collected {table: [rows]} into the bill detail tables; returns the number of rows."""
+    total = 0
+    for table, rows in details.items():
+        buffer = io.StringIO(); writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(['\\N' if value is None else value for value in row])
+        buffer.seek(0)
+        cur.copy_expert(f"COPY {table} ({', '.join(BILL_DETAIL_COLUMNS[table])}) FROM STDIN WITH (FORMAT csv, NULL '\\N');", buffer)
+        total += len(rows)
+    conn.commit()
+    return total
+
+def parse_and_insert_enacted_laws_fast(base_path, details=False):
+    """Finds zip files in subfolders, unzips them, parses XMLs, and batch inserts laws WITH SUBJECTS.
+
+    With details, the same pass also fills the bill detail tables for every bill.
+    """
+    conn = None
+    total_inserted_count = 0
+    total_xml_files_processed = 0
+    
+    if not os.path.isdir(base_path):
+        print(f"Error: Base bills folder not found at '{base_path}'.")
+        print("Please ensure your 'bills' folder is correctly structured.")
+        raise FileNotFoundError(base_path)
+
+    try:
+        # Connect using the details from test.py
+        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params) 
+        
+        create_bills_table_if_not_exists(conn)
+        clear_bills_table(conn)
+        if details:
+            create_bill_detail_tables_if_not_exists(conn)
+            clear_bill_detail_tables(conn)
+        cur = conn.cursor()
+        overall_start_time = time.time()
+        print(f"Starting to process ZIP files from: {base_path}")
+
+        # Loop through each expected Congress number
+        for congress_num in range(START_CONGRESS, END_CONGRESS + 1):
+            congress_start_time = time.time()
+            congress_path = os.path.join(base_path, str(congress_num)) # Path to folder '108', '109', etc.
+            print(f"\n--- Processing Congress {congress_num} ---")
+            
+            if not os.path.isdir(congress_path):
+                print(f"Warning: Directory not found for Congress {congress_num} at '{congress_path}'. Skipping.")
+                continue
+                
+            laws_for_this_congress = [] 
+            details_for_this_congress = {table: [] for table in BILL_DETAIL_COLUMNS}
+
+            # Loop through the expected inner zip basenames (hr, s, etc.)
+            for basename in INNER_ZIP_BASENAMES:
+                zip_filename = f"BILLSTATUS-{congress_num}-{basename}.zip"
+                zip_filepath = os.path.join(congress_path, zip_filename) # Path to the actual zip file
+                
+                if not os.path.isfile(zip_filepath):
+                    print(f" 	Warning: ZIP file '{zip_filename}' not found. Skipping.")
+                    continue
+                
+                print(f" 	Processing ZIP file: {zip_filename}...")
+                try:
+                    # Open the zip file directly from its path
+                    with zipfile.ZipFile(zip_filepath, 'r') as inner_zip_ref, report.stage("parse") as stage:
+                        for member_filename in inner_zip_ref.namelist():
+                            if member_filename.endswith(".xml"):
+                                total_xml_files_processed += 1; stage.rows_in += 1
+                                with inner_zip_ref.open(member_filename) as xml_file:
+                                    try:
+                                        xml_content_bytes = io.BytesIO(xml_file.read())
+                                        tree = ET.parse(xml_content_bytes); root = tree.getroot()
+                                        bill_node = root.find('.//bill')
+                                        if bill_node is None: continue
+                                        is_enacted = is_bill_enacted(bill_node)
+
+                                        if details:
+                                            for table, rows in (extract_bill_details(root, congress_num, is_enacted) or {}).items():
+                                                details_for_this_congress[table].extend(rows)
+                                        
+                                        if is_enacted:
+                                            b_type = bill_node.findtext('type','').strip(); b_num = bill_node.findtext('number','').strip()
+                                            b_title = bill_node.findtext('title','').strip()
+                                            b_intro_date = bill_node.findtext('introducedDate','').strip()
+                                            
+                                            # Extract subjects
+                                            subjects_list = []
+                                            policy_area_node = bill_node.find('policyArea/name')
+                                            if policy_area_node is not None and policy_area_node.text:
+                                                subjects_list.append(policy_area_node.text.strip())
+
+                                            bill_num_ins = f"{b_type}{b_num}"; date_intro = None
+                                            if b_intro_date:
+                                                try: date_intro = datetime.date.fromisoformat(b_intro_date)
+                                                except: pass
+                                                
+                                            if bill_num_ins and bill_num_ins != 'NoneNone':
+                                                # Add tuple with 5 values
+                                                laws_for_this_congress.append((bill_num_ins, b_title, date_intro, congress_num, subjects_list))
+                                                stage.rows_out += 1
+
+                                    except (ET.ParseError, Exception) as file_err: 
+                                        # print(f"Warning: Error parsing {member_filename}: {file_err}") # Uncomment for deep debug
+                                        pass # Suppress individual file parse errors
+                except (zipfile.BadZipFile, Exception) as zip_err:
+                     print(f" 	Error reading ZIP '{zip_filename}': {zip_err}. Skipping.")
+            
+            # Batch insert after processing all zips for this Congress
+            if laws_for_this_congress:
+                print(f"Found {len(laws_for_this_congress)} enacted laws for Congress {congress_num}. Batch inserting...")
+                # SQL now includes the 'subjects' column
+                sql = """
+                    INSERT INTO Bills (BillNumber, Title, DateIntroduced, Congress, subjects)
+                    VALUES %s
+                    ON CONFLICT (BillNumber) DO NOTHING;
+                """
+                try:
+                    with report.stage("write") as stage:
+                        execute_values(cur, sql, laws_for_this_congress, template=None, page_size=BATCH_SIZE)
+                        conn.commit(); stage.rows_out += len(laws_for_this_congress)
+                    print(f"Batch insert successful.")
+                    total_inserted_count += len(laws_for_this_congress)
+                except psycopg2.Error as db_err:
+                    print(f" 	DB batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
+            else:
+                print(f"Found 0 enacted laws for Congress {congress_num}.")
+
+            if details:
+                print(f"Inserting details of {len(details_for_this_congress['bill_status'])} bills...")
+                try:
+                    with report.stage("write") as stage:
+                        stage.rows_out += insert_bill_details(conn, cur, details_for_this_congress)
+                except psycopg2.Error as db_err:
+                    print(f" 	DB error inserting bill details: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
+            
+            print(f"--- Finished Congress {congress_num} in {time.time()-congress_start_time:.2f}s ---")
+
+        overall_end_time = time.time()
+        print(f"\n--- OVERALL SUCCESS ---")
+        print(f"Processed {total_xml_files_processed} XML files from all ZIP archives.")
+        cur.execute("SELECT COUNT(*) FROM Bills;"); final_count = cur.fetchone()[0]
+        print(f"Successfully inserted {final_count} unique laws.")
+        if details:
+            for table in BILL_DETAIL_COLUMNS:
+                cur.execute(f"SELECT COUNT(*) FROM {table};"); print(f"  {table}: {cur.fetchone()[0]} rows")
+        bump_data_version(cur, 'populate_bills'); conn.commit()
+        print(f"Total execution time: {overall_end_time - overall_start_time:.2f}s.")
+
+    except psycopg2.OperationalError as db_conn_err: print(f"--- DB CONNECTION ERROR --- Error: {db_conn_err}"); raise
+    except Exception as e: print(f"An unexpected error occurred: {e}"); raise
+    finally:
+        if conn:
+            try: cur.close()
+            except: pass
+            conn.close(); print("DB connection closed.")
+
+# Run the main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load enacted bills from the BILLSTATUS bulk data into Bills.")
+    parser.add_argument("--details", action="store_true",
+                        help="also load subjects, sponsors, cosponsors and actions of every bill, in the same pass")
+    args = parser.parse_args()
+    with report.run():
+        parse_and_insert_enacted_laws_fast(BILL_DATA_PATH, details=args.details)
\ No newline at end of file
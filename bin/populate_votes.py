@@ -1,287 +1,365 @@
-import os
-import json
-import psycopg2
-import time
-from psycopg2.extras import execute_values
-import re
-import sys
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-import app.config as config  # Imports your configuration file
-import traceback
-
-# --- CONFIGURATION ---
-# All config is now pulled from test.py
-VOTE_DATA_FOLDER_PATH = config.VOTE_DATA_FOLDER_PATH
-MEMBER_FILE_PATH = config.MEMBER_FILE_PATH
-BATCH_SIZE = 5000 
-START_CONGRESS = 108 # Required for the bill lookup
-
-# --- STATE ABBREVIATION MAP ---
-STATE_ABBREVIATION_MAP = {
-    'AL': 'alabama', 'AK': 'alaska', 'AS': 'american samoa', 'AZ': 'arizona', 'AR': 'arkansas',
-    'CA': 'california', 'CO': 'colorado', 'CT': 'connecticut', 'DE': 'delaware', 'DC': 'district of columbia',
-    'FL': 'florida', 'GA': 'georgia', 'GU': 'guam', 'HI': 'hawaii', 'ID': 'idaho',
-    'IL': 'illinois', 'IN': 'indiana', 'IA': 'iowa', 'KS': 'kansas', 'KY': 'kentucky',
-    'LA': 'louisiana', 'ME': 'maine', 'MD': 'maryland', 'MA': 'massachusetts', 'MI': 'michigan',
-    'MN': 'minnesota', 'MS': 'mississippi', 'MO': 'missouri', 'MT': 'montana', 'NE': 'nebraska',
-    'NV': 'nevada', 'NH': 'new hampshire', 'NJ': 'new jersey', 'NM': 'new mexico', 'NY': 'new york',
-    'NC': 'north carolina', 'ND': 'north dakota', 'MP': 'northern mariana islands', 'OH': 'ohio', 'OK': 'oklahoma',
-    'OR': 'oregon', 'PA': 'pennsylvania', 'PR': 'puerto rico', 'RI': 'rhode island', 'SC': 'south carolina',
-    'SD': 'south dakota', 'TN': 'tennessee', 'TX': 'texas', 'UT': 'utah', 'VT': 'vermont',
-    'VI': 'virgin islands', 'VA': 'virginia', 'WA': 'washington', 'WV': 'west virginia',
-    'WI': 'wisconsin', 'WY': 'wyoming'
-}
-STATE_ABBREVIATION_MAP.update({k.lower(): v for k, v in STATE_ABBREVIATION_MAP.items()})
-
-
-# --- Global Lookups ---
-# { (cleaned_lastname, cleaned_state): [ (PoliticianID, cleaned_firstname), ... ] }
-politician_db_lookup = {}
-bill_db_lookup = {}       # {normalized_bill_number: bill_id}
-icpsr_lookup = {}         # {icpsr_id: (cleaned_firstname, cleaned_lastname, cleaned_full_state_name)}
-rollcall_lookup = {}      # {(congress, rollnumber, chamber): bill_id}
-
-# Voteview cast_code mapping
-VOTEVIEW_CODE_MAP = {
-    1: 'Yea', 2: 'Yea', 3: 'Yea',
-    4: 'Nay', 5: 'Nay', 6: 'Nay',
-    7: 'Not Voting', 8: 'Not Voting', 9: 'Not Voting', 0: 'Not Voting'
-}
-
-# --- Helper Functions ---
-def clean_name_part(name_part):
-    """Aggressively cleans a name part to its simplest form."""
-    if not name_part: return ""
-    name = str(name_part).lower().strip()
-    name = re.sub(r"[.,\(\)]", " ", name) # Replace punctuation with space
-    name = re.sub(r"\s+(jr|sr|ii|iii|iv|md|phd)$", "", name, flags=re.IGNORECASE) # Remove suffixes
-    name = name.split(' ')[0].strip()
-    return name
-
-def normalize_voteview_bioname(bioname_str):
-    """Cleans Voteview bioname data, e.g., 'PELOSI, Nancy P (Dem)' -> ('nancy', 'pelosi')."""
-    name = str(bioname_str or '').strip().lower()
-    name = re.sub(r"\s*\([^\)]*\)", "", name).strip() # Remove (Nickname) or (Party)
-    
-    cleaned_fname = ""; cleaned_lname = ""
-    if ',' in name:
-        parts = name.split(',', 1)
-        cleaned_lname = clean_name_part(parts[0]) # Clean last name
-        cleaned_fname = clean_name_part(parts[1]) # Clean first name
-    else:
-        parts = name.split()
-        if len(parts) > 1:
-            cleaned_fname = clean_name_part(parts[0])
-            cleaned_lname = clean_name_part(parts[-1]) # Assume last part is last name
-        elif len(parts) == 1:
-            cleaned_lname = clean_name_part(parts[0])
-    return (cleaned_fname, cleaned_lname)
-
-# --- Database Functions ---
-def create_votes_table_if_not_exists(conn):
-    """Creates the Votes table if it doesn't already exist."""
-    print("Ensuring 'Votes' table exists...")
-    try:
-        cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS Votes (
-                VoteID SERIAL PRIMARY KEY,
-                PoliticianID INT REFERENCES Politicians(PoliticianID) ON DELETE CASCADE,
-                BillID INT REFERENCES Bills(BillID) ON DELETE CASCADE,
-                Vote TEXT,
-                UNIQUE(PoliticianID, BillID)
-            );
-        """)
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_votes_politician_id ON Votes (PoliticianID);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_votes_bill_id ON Votes (BillID);")
-        conn.commit()
-        print("Table 'Votes' is ready.")
-    except Exception as e:
-        print(f"Error creating table: {e}"); conn.rollback(); raise e
-
-def clear_votes_table(conn):
-    print("Clearing 'Votes' table..."); cur = conn.cursor()
-    try:
-        cur.execute("DELETE FROM Votes;");
-        cur.execute("ALTER SEQUENCE Votes_VoteID_seq RESTART WITH 1;");
-        conn.commit(); print("Table cleared.")
-    except Exception as e: print(f"Error clearing: {e}"); conn.rollback(); raise e
-
-def load_db_lookups(conn):
-    """Loads Politicians and Bills from the database."""
-    global politician_db_lookup, bill_db_lookup
-    cur = conn.cursor()
-    print("Loading Politicians lookup from DB (Cleaned)...");
-    cur.execute("SELECT PoliticianID, FirstName, LastName, State FROM Politicians")
-    for row in cur.fetchall():
-        pid, fname, lname, state = row
-        cleaned_fname = clean_name_part(fname)
-        cleaned_lname = clean_name_part(lname)
-        cleaned_state = str(state or '').strip().lower() # e.g., 'new jersey'
-        key = (cleaned_lname, cleaned_state) # Key = (lastname, full_state_name)
-        if key not in politician_db_lookup:
-            politician_db_lookup[key] = []
-        politician_db_lookup[key].append( (pid, cleaned_fname) )
-    print(f"Loaded {len(politician_db_lookup)} unique (LastName, State) keys.")
-    
-    print("Loading Bills lookup from DB...");
-    # We must adjust this to only load bills from 108th+
-    cur.execute(f"SELECT BillID, BillNumber FROM Bills WHERE Congress >= {START_CONGRESS}");
-    for row in cur.fetchall():
-        bid, bnumber = row
-        key = str(bnumber or '').strip().lower().replace(" ", "").replace(".", "")
-        bill_db_lookup[key] = bid
-    print(f"Loaded {len(bill_db_lookup)} enacted bills."); cur.close()
-
-def load_icpsr_lookup(member_filepath):
-    """Loads the Voteview member file (HSall_members.json)."""
-    global icpsr_lookup
-    print(f"Loading ICPSR mapping from {member_filepath}...")
-    try:
-        with open(member_filepath, 'r', encoding='utf-8') as f: member_data = json.load(f)
-        for member in member_data:
-            icpsr = member.get('icpsr')
-            state_abbr = member.get('state_abbrev', '').strip().upper()
-            bioname = member.get('bioname', '') 
-            
-            full_state_name = STATE_ABBREVIATION_MAP.get(state_abbr, '').lower()
-            fname_clean, lname_clean = normalize_voteview_bioname(bioname)
-            
-            if icpsr and full_state_name and (fname_clean or lname_clean):
-                icpsr_lookup[icpsr] = (fname_clean, lname_clean, full_state_name)
-        print(f"Loaded {len(icpsr_lookup)} ICPSR-to-Name mappings.")
-    except FileNotFoundError: print(f"Error: Member file not found at '{member_filepath}'"); raise
-    except Exception as e: print(f"Error reading member file: {e}"); raise
-
-def load_rollcall_lookup(vote_folder_path):
-    """Loads all _rollcalls.json files to map (congress, rollnumber) to BillID."""
-    global rollcall_lookup
-    print("Loading roll call to bill lookup...")
-    rollcall_files = sorted([f for f in os.listdir(vote_folder_path) if f.startswith('HS') and f.endswith('_rollcalls.json')])
-    if not rollcall_files: print(f"Error: No '*_rollcalls.json' files found in '{vote_folder_path}'"); raise FileNotFoundError
-    
-    for filename in rollcall_files:
-        filepath = os.path.join(vote_folder_path, filename)
-        print(f"  Reading {filename}...")
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f: data = json.load(f)
-            for roll_call in data:
-                bill_number = roll_call.get('bill_number')
-                bill_key = str(bill_number or '').strip().lower().replace(" ", "").replace(".", "")
-                bill_id = bill_db_lookup.get(bill_key)
-                if bill_id:
-                    key = (roll_call.get('congress'), roll_call.get('rollnumber'), roll_call.get('chamber'))
-                    rollcall_lookup[key] = bill_id
-        except Exception as e: print(f"    Warning: Error reading {filename}: {e}. Skipping file.")
-    print(f"Loaded {len(rollcall_lookup)} roll calls linked to enacted bills.")
-
-def find_politician_id(icpsr):
-    """Matches Voteview icpsr to our politician_db_lookup."""
-    key_parts = icpsr_lookup.get(icpsr)
-    if not key_parts: return None
-    fname_clean, lname_clean, state_clean = key_parts
-    db_key = (lname_clean, state_clean)
-    potential_matches = politician_db_lookup.get(db_key)
-    if not potential_matches: return None
-    if len(potential_matches) == 1: return potential_matches[0][0]
-    else:
-        for pid, fname_db_clean in potential_matches:
-            if fname_clean == fname_db_clean: return pid
-    return None
-
-def process_and_insert_votes():
-    """Reads _votes.json files, uses lookups, and batch inserts votes."""
-    conn = None; total_inserted_votes = 0; total_votes_processed = 0
-    try:
-        # Connect using the details from test.py
-        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params)
-        
-        create_votes_table_if_not_exists(conn)
-        load_db_lookups(conn)
-        load_icpsr_lookup(MEMBER_FILE_PATH)
-        load_rollcall_lookup(VOTE_DATA_FOLDER_PATH)
-        clear_votes_table(conn)
-        cur = conn.cursor()
-        overall_start_time = time.time()
-
-        vote_files = sorted([f for f in os.listdir(VOTE_DATA_FOLDER_PATH) if f.startswith('HS') and f.endswith('_votes.json')])
-        if not vote_files: 
-            print(f"Error: No '*_votes.json' files found in '{VOTE_DATA_FOLDER_PATH}'"); return
-            
-        print(f"Found {len(vote_files)} Voteview *votes* JSON files to process.")
-        votes_to_batch_insert = []
-
-        for filename in vote_files:
-            filepath = os.path.join(VOTE_DATA_FOLDER_PATH, filename)
-            print(f"\n--- Processing File: {filename} ---")
-            file_start_time = time.time(); file_votes_matched = 0
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f: data = json.load(f)
-            except Exception as e: print(f"Error reading file {filename}: {e}. Skipping."); continue
-            if not isinstance(data, list): print(f"Warning: Expected list in {filename}. Skipping."); continue
-
-            print(f"Processing {len(data)} individual vote records...")
-            for i, vote_record in enumerate(data):
-                total_votes_processed += 1
-                if (i + 1) % 50000 == 0: print(f"  Processed {i+1}/{len(data)} records...", end='\r')
-
-                try:
-                    congress = vote_record.get('congress'); rollnumber = vote_record.get('rollnumber')
-                    chamber = vote_record.get('chamber'); icpsr = vote_record.get('icpsr')
-                    cast_code = vote_record.get('cast_code')
-
-                    rollcall_key = (congress, rollnumber, chamber)
-                    bill_id = rollcall_lookup.get(rollcall_key)
-                    if not bill_id: continue
-                    
-                    politician_id = find_politician_id(icpsr)
-                    vote_string = VOTEVIEW_CODE_MAP.get(cast_code)
-                    
-                    if politician_id and bill_id and vote_string:
-                        votes_to_batch_insert.append((politician_id, bill_id, vote_string))
-                        file_votes_matched += 1
-                except: continue 
-
-                if len(votes_to_batch_insert) >= BATCH_SIZE:
-                    print(" " * 80, end='\r'); print(f"  Inserting batch of {len(votes_to_batch_insert)} votes...")
-                    sql_insert = "INSERT INTO Votes (PoliticianID, BillID, Vote) VALUES %s ON CONFLICT (PoliticianID, BillID) DO NOTHING;"
-                    try:
-                        execute_values(cur, sql_insert, votes_to_batch_insert, page_size=BATCH_SIZE)
-                        conn.commit(); total_inserted_votes += len(votes_to_batch_insert)
-                        votes_to_batch_insert = []
-                    except psycopg2.Error as db_err:
-                        print(f"\n  DB batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
-                        votes_to_batch_insert = []
-            
-            if votes_to_batch_insert:
-                print(" " * 80, end='\r'); print(f"  Inserting final batch of {len(votes_to_batch_insert)} votes...")
-                sql_insert = "INSERT INTO Votes (PoliticianID, BillID, Vote) VALUES %s ON CONFLICT (PoliticianID, BillID) DO NOTHING;"
-                try:
-                    execute_values(cur, sql_insert, votes_to_batch_insert, page_size=BATCH_SIZE)
-                    conn.commit(); total_inserted_votes += len(votes_to_batch_insert)
-                except psycopg2.Error as db_err:
-                    print(f"\n  DB final batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
-
-            print(" " * 80, end='\r')
-            print(f"  Matched {file_votes_matched} votes in this file.")
-            print(f"--- Finished file {filename} in {time.time() - file_start_time:.2f}s ---")
-
-        print(f"\n--- OVERALL SUCCESS ---")
-        print(f"Processed {total_votes_processed} individual vote records from {len(vote_files)} files.")
-        cur.execute("SELECT COUNT(*) FROM Votes;"); final_count = cur.fetchone()[0]
-        print(f"Successfully inserted {final_count} vote records linked to enacted laws.")
-        print(f"Total execution time: {time.time() - overall_start_time:.2f} seconds.")
-
-    except Exception as e:
-        print(f"\nAn unexpected error occurred: {e}"); traceback.print_exc()
-        if conn: conn.rollback()
-    finally:
-        if conn:
-            try: cur.close()
-            except: pass
-            conn.close(); print("Database connection closed.")
-
-if __name__ == "__main__":
-    process_and_insert_votes()
\ No newline at end of file
+import argparse
+import os
+import io
+import csv
+import json
+import psycopg2
+import time
+from psycopg2.extras import execute_values
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config  # Imports your configuration file
+from app.schema import BILL_NUM_SQL, BILL_TYPE_SQL, add_bill_number_keys, create_vote_timeline_table, rebuild_vote_timeline, cluster_vote_timeline, bump_data_version
+from bin.build_icpsr_map import load_icpsr_politician_ids
+from bin.name_normalization import split_bill_number
+from bin.loader_report import RunReport
+import traceback
+
+# --- CONFIGURATION ---
+# All config is now pulled from test.py
+VOTE_DATA_FOLDER_PATH = config.VOTE_DATA_FOLDER_PATH
+BATCH_SIZE = 5000 
+START_CONGRESS = 108 # Required for the bill lookup
+
+report = RunReport("populate_votes")
+
+# --- Global Lookups ---
+icpsr_politician_ids = None  # array indexed by icpsr -> PoliticianID (0 if unmatched), from icpsr_politician_map
+bill_db_lookup = {}       # {(congress, bill_type, bill_num): bill_id}
+rollcall_lookup = {}      # {(congress, rollnumber, chamber): bill_id}
+
+# Voteview cast_code mapping
+VOTEVIEW_CODE_MAP = {
+    1: 'Yea', 2: 'Yea', 3: 'Yea',
+    4: 'Nay', 5: 'Nay', 6: 'Nay',
+    7: 'Not Voting', 8: 'Not Voting', 9: 'Not Voting', 0: 'Not Voting'
+}
+
+# --- Database Functions ---
+def create_votes_table_if_not_exists(conn):
+    """Creates the Votes table if it doesn't already exist."""
+    print("Ensuring 'Votes' table exists...")
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS Votes (
+                VoteID SERIAL PRIMARY KEY,
+                PoliticianID INT REFERENCES Politicians(PoliticianID) ON DELETE CASCADE,
+                BillID INT REFERENCES Bills(BillID) ON DELETE CASCADE,
+                Vote TEXT,
+                UNIQUE(PoliticianID, BillID)
+            );
+        """)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_votes_politician_id ON Votes (PoliticianID);")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_votes_bill_id ON Votes (BillID);")
+        conn.commit()
+        print("Table 'Votes' is ready.")
+    except Exception as e:
+        print(f"Error creating table: {e}"); conn.rollback(); raise e
+
+def delete_votes(cur):
+    """Deletes every vote and restarts VoteID, leaving the commit to the caller."""
+    cur.execute("DELETE FROM Votes;");
+    cur.execute("ALTER SEQUENCE Votes_VoteID_seq RESTART WITH 1;");
+
+def clear_votes_table(conn):
+    print("Clearing 'Votes' table..."); cur = conn.cursor()
+    try:
+        delete_votes(cur)
+        conn.commit(); print("Table cleared.")
+    except Exception as e: print(f"Error clearing: {e}"); conn.rollback(); raise e
+
+def build_vote_timeline(conn):
+    """Rebuilds the denormalized politician_vote_timeline table served by the votes API."""
+    print("Rebuilding 'politician_vote_timeline'..."); cur = conn.cursor()
+    try:
+        create_vote_timeline_table(cur)
+        row_count = rebuild_vote_timeline(cur)
+        cluster_vote_timeline(cur)
+        conn.commit(); print(f"Timeline rebuilt with {row_count} rows.")
+    except Exception as e: print(f"Error rebuilding timeline: {e}"); conn.rollback(); raise e
+    finally: cur.close()
+
+def require_icpsr_map(cur):
+    """Raises unless icpsr_politician_map exists and maps at least one member.
+
+    Called before Votes is cleared: without the map no vote can be resolved,
+    and the run would replace the existing votes with nothing.
+    """
+    cur.execute("SELECT to_regclass('icpsr_politician_map') IS NOT NULL"); map_exists = cur.fetchone()[0]
+    mapped = 0
+    if map_exists:
+        cur.execute("SELECT COUNT(*) FROM icpsr_politician_map WHERE politician_id IS NOT NULL"); mapped = cur.fetchone()[0]
+    if not mapped:
+        raise RuntimeError("icpsr_politician_map is missing or empty; run bin/build_icpsr_map.py first. Votes left unchanged.")
+    return mapped
+
+def load_db_lookups(conn):
+    """Loads the ICPSR map (built by build_icpsr_map.py) and Bills from the database."""
+    global icpsr_politician_ids, bill_db_lookup
+    cur = conn.cursor()
+    print("Loading ICPSR-to-Politician map from DB...");
+    require_icpsr_map(cur)
+    icpsr_politician_ids = load_icpsr_politician_ids(cur)
+    print(f"Loaded {sum(1 for pid in icpsr_politician_ids if pid)} ICPSR-to-Politician mappings.")
+    
+    print("Loading Bills lookup from DB...");
+    add_bill_number_keys(cur); conn.commit()
+    # We must adjust this to only load bills from 108th+
+    cur.execute(f"SELECT BillID, Congress, bill_type, bill_num FROM Bills WHERE Congress >= {START_CONGRESS}");
+    for bid, congress, bill_type, bill_num in cur.fetchall():
+        bill_db_lookup[(congress, bill_type, bill_num)] = bid
+    print(f"Loaded {len(bill_db_lookup)} enacted bills."); cur.close()
+
+def load_rollcall_lookup(vote_folder_path):
+    """Loads all _rollcalls.json files to map (congress, rollnumber, chamber) to the BillID of the same Congress."""
+    global rollcall_lookup
+    print("Loading roll call to bill lookup...")
+    rollcall_files = sorted([f for f in os.listdir(vote_folder_path) if f.startswith('HS') and f.endswith('_rollcalls.json')])
+    if not rollcall_files: print(f"Error: No '*_rollcalls.json' files found in '{vote_folder_path}'"); raise FileNotFoundError
+    
+    for filename in rollcall_files:
+        filepath = os.path.join(vote_folder_path, filename)
+        print(f"  Reading {filename}...")
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f: data = json.load(f)
+            for roll_call in data:
+                bill = split_bill_number(roll_call.get('bill_number'))
+                bill_id = bill and bill_db_lookup.get((roll_call.get('congress'), *bill))
+                if bill_id:
+                    key = (roll_call.get('congress'), roll_call.get('rollnumber'), roll_call.get('chamber'))
+                    rollcall_lookup[key] = bill_id
+        except Exception as e: print(f"    Warning: Error reading {filename}: {e}. Skipping file.")
+    print(f"Loaded {len(rollcall_lookup)} roll calls linked to enacted bills.")
+
+def process_and_insert_votes():
+    """Reads _votes.json files, uses lookups, and batch inserts votes."""
+    conn = None; total_inserted_votes = 0; total_votes_processed = 0
+    try:
+        # Connect using the details from test.py
+        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params)
+        
+        create_votes_table_if_not_exists(conn)
+        with report.stage("load_lookups"):
+            load_db_lookups(conn)
+            load_rollcall_lookup(VOTE_DATA_FOLDER_PATH)
+        clear_votes_table(conn)
+        cur = conn.cursor()
+        overall_start_time = time.time()
+
+        vote_files = sorted([f for f in os.listdir(VOTE_DATA_FOLDER_PATH) if f.startswith('HS') and f.endswith('_votes.json')])
+        if not vote_files: 
+            print(f"Error: No '*_votes.json' files found in '{VOTE_DATA_FOLDER_PATH}'"); raise FileNotFoundError
+            
+        print(f"Found {len(vote_files)} Voteview *votes* JSON files to process.")
+        votes_to_batch_insert = []
+
+        for filename in vote_files:
+            filepath = os.path.join(VOTE_DATA_FOLDER_PATH, filename)
+            print(f"\n--- Processing File: {filename} ---")
+            file_start_time = time.time(); file_votes_matched = 0
+            
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f, report.stage("parse") as stage: data = json.load(f); stage.rows_out += len(data)
+            except Exception as e: print(f"Error reading file {filename}: {e}. Skipping."); continue
+            if not isinstance(data, list): print(f"Warning: Expected list in {filename}. Skipping."); continue
+
+            print(f"Processing {len(data)} individual vote records...")
+            with report.stage("resolve") as stage:
+                for i, vote_record in enumerate(data):
+                    total_votes_processed += 1; stage.rows_in += 1
+                    if (i + 1) % 50000 == 0: print(f"  Processed {i+1}/{len(data)} records...", end='\r')
+
+                    try:
+                        congress = vote_record.get('congress'); rollnumber = vote_record.get('rollnumber')
+                        chamber = vote_record.get('chamber'); icpsr = vote_record.get('icpsr')
+                        cast_code = vote_record.get('cast_code')
+
+                        rollcall_key = (congress, rollnumber, chamber)
+                        bill_id = rollcall_lookup.get(rollcall_key)
+                        if not bill_id: continue
+                    
+                        politician_id = icpsr_politician_ids[icpsr] if 0 <= icpsr < len(icpsr_politician_ids) else 0
+                        vote_string = VOTEVIEW_CODE_MAP.get(cast_code)
+                    
+                        if politician_id and bill_id and vote_string:
+                            votes_to_batch_insert.append((politician_id, bill_id, vote_string))
+                            file_votes_matched += 1; stage.rows_out += 1
+                    except: continue 
+
+                    if len(votes_to_batch_insert) >= BATCH_SIZE:
+                        print(" " * 80, end='\r'); print(f"  Inserting batch of {len(votes_to_batch_insert)} votes...")
+                        sql_insert = "INSERT INTO Votes (PoliticianID, BillID, Vote) VALUES %s ON CONFLICT (PoliticianID, BillID) DO NOTHING;"
+                        try:
+                            with report.stage("write") as write:
+                                execute_values(cur, sql_insert, votes_to_batch_insert, page_size=BATCH_SIZE)
+                                conn.commit(); write.rows_out += len(votes_to_batch_insert)
+                            total_inserted_votes += len(votes_to_batch_insert)
+                            votes_to_batch_insert = []
+                        except psycopg2.Error as db_err:
+                            print(f"\n  DB batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
+                            votes_to_batch_insert = []
+            
+            if votes_to_batch_insert:
+                print(" " * 80, end='\r'); print(f"  Inserting final batch of {len(votes_to_batch_insert)} votes...")
+                sql_insert = "INSERT INTO Votes (PoliticianID, BillID, Vote) VALUES %s ON CONFLICT (PoliticianID, BillID) DO NOTHING;"
+                try:
+                    with report.stage("write") as stage:
+                        execute_values(cur, sql_insert, votes_to_batch_insert, page_size=BATCH_SIZE)
+                        conn.commit(); stage.rows_out += len(votes_to_batch_insert)
+                    total_inserted_votes += len(votes_to_batch_insert)
+                except psycopg2.Error as db_err:
+                    print(f"\n  DB final batch error: {db_err}. Rolling back."); conn.rollback(); cur = conn.cursor()
+
+            print(" " * 80, end='\r')
+            print(f"  Matched {file_votes_matched} votes in this file.")
+            print(f"--- Finished file {filename} in {time.time() - file_start_time:.2f}s ---")
+
+        print(f"\n--- OVERALL SUCCESS ---")
+        print(f"Processed {total_votes_processed} individual vote records from {len(vote_files)} files.")
+        cur.execute("SELECT COUNT(*) FROM Votes;"); final_count = cur.fetchone()[0]
+        print(f"Successfully inserted {final_count} vote records linked to enacted laws.")
+        with report.stage("timeline"):
+            build_vote_timeline(conn)
+        bump_data_version(cur, 'populate_votes'); conn.commit()
+        print(f"Total execution time: {time.time() - overall_start_time:.2f} seconds.")
+
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}"); traceback.print_exc()
+        if conn: conn.rollback()
+        raise
+    finally:
+        if conn:
+            try: cur.close()
+            except: pass
+            conn.close(); print("Database connection closed.")
+
+# --- SQL-side resolution (--sql) ---
+# The raw Voteview records are COPYed into unlogged staging tables (no WAL;
+# their contents are rebuilt on every run) and resolved against
+# icpsr_politician_map and Bills by one INSERT ... SELECT.
+
+def create_vote_staging_tables(conn):
+    """Creates (or empties) the unlogged staging tables for the raw roll calls and votes."""
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS rollcalls_staging (
+            seq BIGINT, congress INT, chamber TEXT, rollnumber INT, bill_number TEXT
+        );
+    """)
+    cur.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS votes_staging (
+            seq BIGINT, congress INT, chamber TEXT, rollnumber INT, icpsr INT, cast_code INT
+        );
+    """)
+    cur.execute("TRUNCATE rollcalls_staging, votes_staging;")
+    conn.commit(); cur.close()
+
+def copy_voteview_files(conn, cur, suffix, table, fields):
+    """COPYs the given fields of every record in the HS*<suffix> files into table, numbered in file order.
+
+    Returns the number of records copied.
+    """
+    files = sorted([f for f in os.listdir(VOTE_DATA_FOLDER_PATH) if f.startswith('HS') and f.endswith(suffix)])
+    if not files: print(f"Error: No '*{suffix}' files found in '{VOTE_DATA_FOLDER_PATH}'"); raise FileNotFoundError
+    seq = 0
+    for filename in files:
+        print(f"  Copying {filename} into {table}...")
+        try:
+            with open(os.path.join(VOTE_DATA_FOLDER_PATH, filename), 'r', encoding='utf-8') as f, report.stage("parse") as stage:
+                data = json.load(f); stage.rows_out += len(data)
+        except Exception as e: print(f"    Warning: Error reading {filename}: {e}. Skipping file."); continue
+        buffer = io.StringIO(); writer = csv.writer(buffer)
+        for record in data:
+            seq += 1
+            writer.writerow([seq] + ['\\N' if record.get(field) is None else record.get(field) for field in fields])
+        buffer.seek(0)
+        with report.stage("write") as stage:
+            cur.copy_expert(f"COPY {table} (seq, {', '.join(fields)}) FROM STDIN WITH (FORMAT csv, NULL '\\N');", buffer)
+            stage.rows_out += len(data)
+    cur.execute(f"ANALYZE {table};"); conn.commit()
+    return seq
+
+def replace_votes_from_staging(conn, cur):
+    """Replaces Votes with the staged votes resolved to (PoliticianID, BillID); returns the count.
+
+    Keeps the Python path's choices: a roll call links to the bill of its
+    Congress with the same type and number (the last roll call file wins),
+    and the first vote of a politician on a bill is kept. The DELETE and the
+    INSERT commit together, so a failed INSERT leaves the old votes in place.
+    """
+    delete_votes(cur)
+    vote_case = " ".join(f"WHEN {code} THEN '{vote}'" for code, vote in VOTEVIEW_CODE_MAP.items())
+    cur.execute(f"""
+        WITH rollcalls AS (
+            SELECT DISTINCT ON (r.congress, r.chamber, r.rollnumber) r.congress, r.chamber, r.rollnumber, b.BillID
+            FROM rollcalls_staging r
+            JOIN Bills b ON b.Congress = r.congress
+                        AND b.bill_type = {BILL_TYPE_SQL.format(col='r.bill_number')}
+                        AND b.bill_num = {BILL_NUM_SQL.format(col='r.bill_number')}
+            WHERE r.congress >= %s
+            ORDER BY r.congress, r.chamber, r.rollnumber, r.seq DESC
+        )
+        INSERT INTO Votes (PoliticianID, BillID, Vote)
+        SELECT DISTINCT ON (m.politician_id, r.BillID) m.politician_id, r.BillID, CASE v.cast_code {vote_case} END
+        FROM votes_staging v
+        JOIN rollcalls r USING (congress, chamber, rollnumber)
+        JOIN icpsr_politician_map m ON m.icpsr = v.icpsr AND m.politician_id IS NOT NULL
+        WHERE v.cast_code IN %s
+        ORDER BY m.politician_id, r.BillID, v.seq
+        ON CONFLICT (PoliticianID, BillID) DO NOTHING;
+    """, (START_CONGRESS, tuple(VOTEVIEW_CODE_MAP)))
+    inserted = cur.rowcount
+    conn.commit()
+    return inserted
+
+def process_and_insert_votes_sql():
+    """Loads the raw Voteview files into staging tables and resolves the votes in Postgres."""
+    conn = None; cur = None
+    try:
+        print("Connecting to PostgreSQL..."); conn = psycopg2.connect(**config.conn_params)
+        create_votes_table_if_not_exists(conn)
+        create_vote_staging_tables(conn)
+        cur = conn.cursor(); overall_start_time = time.time()
+        add_bill_number_keys(cur); conn.commit()
+        print(f"{require_icpsr_map(cur)} members in icpsr_politician_map.")
+
+        print("Copying roll calls and votes into staging tables...")
+        rollcall_count = copy_voteview_files(conn, cur, '_rollcalls.json', 'rollcalls_staging', ['congress', 'chamber', 'rollnumber', 'bill_number'])
+        vote_count = copy_voteview_files(conn, cur, '_votes.json', 'votes_staging', ['congress', 'chamber', 'rollnumber', 'icpsr', 'cast_code'])
+        print(f"Staged {rollcall_count} roll calls and {vote_count} vote records.")
+
+        print("Replacing Votes with the votes resolved against icpsr_politician_map and Bills...")
+        with report.stage("resolve") as stage:
+            stage.rows_in += vote_count
+            inserted = replace_votes_from_staging(conn, cur); stage.rows_out += inserted
+        cur.execute("TRUNCATE rollcalls_staging, votes_staging;"); conn.commit()
+
+        print(f"\n--- OVERALL SUCCESS ---")
+        print(f"Successfully inserted {inserted} vote records linked to enacted laws.")
+        with report.stage("timeline"):
+            build_vote_timeline(conn)
+        bump_data_version(cur, 'populate_votes'); conn.commit()
+        print(f"Total execution time: {time.time() - overall_start_time:.2f} seconds.")
+
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}"); traceback.print_exc()
+        if conn: conn.rollback()
+        raise
+    finally:
+        if conn:
+            try: cur.close()
+            except: pass
+            conn.close(); print("Database connection closed.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load Voteview votes on enacted bills into Votes.")
+    parser.add_argument("--sql", action="store_true",
+                        help="COPY the raw files into staging tables and resolve the votes in Postgres")
+    args = parser.parse_args()
+    with report.run():
+        if args.sql:
+            process_and_insert_votes_sql()
+        else:
+            process_and_insert_votes()
\ No newline at end of file
@@ -0,0 +1,247 @@
+"""Runs the full ingest chain, in dependency order and in parallel where possible.
+
+Each loader runs as its own process (with its own database connection) as
+soon as the loaders it depends on have finished, up to --jobs at a time:
+
+    populate_politicians ──┬── build_fec_map ── populate_donors_and_donations ── populate_industries
+                           └── build_icpsr_map ──┐
+    populate_bills ──────────────────────────────┴── populate_votes
+
+Progress is kept in local/pipeline/state.json. If a loader fails, the ones
+depending on it are skipped; after fixing the cause, --resume reruns only
+what has not completed. Each loader's output goes to a log file next to
+the state, its run report (see bin/loader_report.py) is collected, and the
+run ends with a timing report that is also saved as JSON.
+
+    python bin/run_pipeline.py
+    python bin/run_pipeline.py --resume
+    python bin/run_pipeline.py --only populate_votes --only populate_industries
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PIPELINE_DIR = os.path.join(project_root, "local", "pipeline")
+
+# loader -> loaders whose tables it reads
+STAGES = {
+    "populate_politicians": [],
+    "populate_bills": [],
+    "build_fec_map": ["populate_politicians"],
+    "build_icpsr_map": ["populate_politicians"],
+    "populate_votes": ["build_icpsr_map", "populate_bills"],
+    "populate_donors_and_donations": ["build_fec_map"],
+    "populate_industries": ["populate_donors_and_donations"],
+}
+
+
+def stage_command(name):
+    return [sys.executable, os.path.join(project_root, "bin", f"{name}.py")]
+
+
+def topological_order(stages):
+    """Stage names with every stage after its dependencies; rejects cycles and unknown stages."""
+    order, visiting = [], set()
+
+    def visit(name, path):
+        if name in order:
+            return
+        if name not in stages:
+            raise ValueError(f"Unknown stage '{name}' (required by {path[-1]})")
+        if name in visiting:
+            raise ValueError("Dependency cycle: " + " -> ".join(path + [name]))
+        visiting.add(name)
+        for dep in stages[name]:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        order.append(name)
+
+    for name in stages:
+        visit(name, [])
+    return order
+
+
+class Pipeline:
+    """Schedules stages over a thread pool, each running its command as a subprocess."""
+
+    def __init__(self, stages, state_dir, jobs=3, command=stage_command, state=None):
+        self.stages = stages
+        self.order = topological_order(stages)
+        self.state_dir = state_dir
+        self.jobs = jobs
+        self.command = command
+        self.state_path = os.path.join(state_dir, "state.json")
+        self.state = state or {"stages": {}}
+        self._lock = threading.Lock()  # stages finish on worker threads
+
+    @classmethod
+    def load_state(cls, state_dir):
+        try:
+            with open(os.path.join(state_dir, "state.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_state(self):
+        with self._lock:
+            os.makedirs(self.state_dir, exist_ok=True)
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+
+    def status(self, name):
+        return self.state["stages"].get(name, {}).get("status")
+
+    def run(self, only=None):
+        """Runs every stage not already done (or just those in only); returns True if all succeeded."""
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        while os.path.exists(os.path.join(self.state_dir, run_id)):
+            run_id = run_id.split(".")[0] + f".{int(run_id.partition('.')[2] or 0) + 1}"
+        run_dir = os.path.join(self.state_dir, run_id)
+        os.makedirs(run_dir)
+        self.state["run_id"] = run_id
+        self.state["started_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        pending = [name for name in self.order
+                   if (name in only if only else self.status(name) != "done")]
+        for name in pending:
+            self.state["stages"][name] = {"status": "pending"}
+        self.save_state()
+
+        start = time.perf_counter()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            try:
+                while pending or running:
+                    for name in list(pending):
+                        deps = [self.status(dep) for dep in self.stages[name]]
+                        if any(status in ("failed", "skipped") for status in deps):
+                            pending.remove(name)
+                            self._finish(name, "skipped", note="a dependency did not complete")
+                        elif all(status == "done" for status in deps) and len(running) < self.jobs:
+                            pending.remove(name)
+                            running[pool.submit(self._run_stage, name, run_dir, start)] = name
+                    if not running:
+                        if pending:  # only reachable if a dependency was never run
+                            for name in pending:
+                                self._finish(name, "skipped", note="a dependency was not selected or done")
+                            pending = []
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        running.pop(future)
+                        future.result()
+            except KeyboardInterrupt:
+                for name in running.values():
+                    self._finish(name, "interrupted")
+                raise
+
+        self.state["wall_s"] = round(time.perf_counter() - start, 2)
+        self.save_state()
+        return all(self.status(name) == "done" for name in self.order if not only or name in only)
+
+    def _run_stage(self, name, run_dir, pipeline_start):
+        log_path = os.path.join(run_dir, f"{name}.log")
+        report_dir = os.path.join(run_dir, "reports")
+        env = dict(os.environ, LOADER_REPORT_DIR=report_dir, PYTHONUNBUFFERED="1")
+        record = self.state["stages"][name]
+        with self._lock:
+            record.update(status="running", log=log_path,
+                          offset_s=round(time.perf_counter() - pipeline_start, 2))
+        self.save_state()
+        print(f"[{record['offset_s']:>8.1f}s] started  {name}", flush=True)
+
+        stage_start = time.perf_counter()
+        try:
+            with open(log_path, "w") as log:
+                returncode = subprocess.run(self.command(name), stdout=log, stderr=subprocess.STDOUT,
+                                            env=env, cwd=project_root).returncode
+        except OSError as e:
+            returncode, note = None, str(e)
+        else:
+            note = None if returncode == 0 else f"exited with status {returncode}; see {log_path}"
+        wall = time.perf_counter() - stage_start
+
+        report = None
+        reports = sorted(glob.glob(os.path.join(report_dir, f"{name}-*.json")))
+        if reports:
+            with open(reports[-1]) as f:
+                report = json.load(f)
+        self._finish(name, "done" if returncode == 0 else "failed", wall_s=round(wall, 2),
+                     returncode=returncode, note=note, report=report)
+
+    def _finish(self, name, status, **fields):
+        with self._lock:
+            record = self.state["stages"].setdefault(name, {})
+            record.update(status=status, finished_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                          **{k: v for k, v in fields.items() if v is not None})
+        self.save_state()
+        wall = f" in {record['wall_s']:.1f}s" if "wall_s" in record else ""
+        note = f" ({record['note']})" if record.get("note") else ""
+        print(f"{'':>12}{status:<9}{name}{wall}{note}", flush=True)
+
+
+def format_timing(state, order):
+    lines = [f"\n{'stage':<32}{'status':<13}{'start s':>9}{'wall s':>9}{'cpu s':>9}{'rss MB':>9}  slowest step"]
+    for name in order:
+        record = state["stages"].get(name)
+        if not record:
+            continue
+        report = record.get("report") or {}
+        stages = report.get("stages") or []
+        slowest = max(stages, key=lambda s: s["wall_s"], default=None)
+        lines.append(
+            f"{name:<32}{record['status']:<13}{str(record.get('offset_s', '-')):>9}"
+            f"{str(record.get('wall_s', '-')):>9}{str(report.get('cpu_s', '-')):>9}"
+            f"{str(report.get('peak_rss_mb', '-')):>9}"
+            + (f"  {slowest['name']} ({slowest['wall_s']:.1f}s)" if slowest else "")
+        )
+    stage_total = sum(r.get("wall_s", 0) for r in state["stages"].values())
+    lines.append(f"\nPipeline wall time {state.get('wall_s', 0):.1f}s for {stage_total:.1f}s of stage time.")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resume", action="store_true", help="skip stages that completed in the last run")
+    parser.add_argument("--only", action="append", choices=list(STAGES), metavar="STAGE",
+                        help="run just this stage (repeatable); its dependencies must be done")
+    parser.add_argument("--jobs", type=int, default=3, help="stages to run at once")
+    parser.add_argument("--state-dir", default=PIPELINE_DIR, help="where state, logs and reports are kept")
+    parser.add_argument("--dry-run", action="store_true", help="print the order stages would start in")
+    args = parser.parse_args()
+
+    state = Pipeline.load_state(args.state_dir) if (args.resume or args.only) else None
+    pipeline = Pipeline(STAGES, args.state_dir, jobs=args.jobs, state=state)
+    if args.dry_run:
+        for name in pipeline.order:
+            if args.only and name not in args.only or not args.only and pipeline.status(name) == "done":
+                continue
+            deps = ", ".join(STAGES[name]) or "-"
+            print(f"{name:<32}after: {deps}")
+        return
+
+    try:
+        ok = pipeline.run(only=args.only)
+    except KeyboardInterrupt:
+        sys.exit("\nInterrupted; rerun with --resume to continue.")
+    print(format_timing(pipeline.state, pipeline.order))
+    report_path = os.path.join(args.state_dir, pipeline.state["run_id"], "pipeline.json")
+    with open(report_path, "w") as f:
+        json.dump(pipeline.state, f, indent=2)
+    print(f"Timing report saved to {report_path}")
+    if not ok:
+        sys.exit("Some stages did not complete; rerun with --resume after fixing them.")
+
+
+if __name__ == "__main__":
+    main()
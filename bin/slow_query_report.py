@@ -0,0 +1,137 @@
+"""Summarizes the slow query log written by app/slow_queries.py.
+
+Groups the logged statements by fingerprint and prints the top offenders by
+total time, with call counts, mean/p95/max duration and the endpoints that
+ran them. Rotated files (slow_queries.log.1, .2, ...) are read too.
+
+    python bin/slow_query_report.py
+    python bin/slow_query_report.py --top 5 --endpoint get_politician_votes --plans
+"""
+import argparse
+import json
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+import app.config as config
+
+
+def read_records(path):
+    """Yields the records in path and its rotated backups, oldest first."""
+    paths = [f"{path}.{n}" for n in range(config.SLOW_QUERY_LOG_BACKUPS, 0, -1)] + [path]
+    for log_path in paths:
+        if not os.path.exists(log_path):
+            continue
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by rotation or a crash
+
+
+def _percentile(ordered, pct):
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(records, endpoint=None):
+    """Aggregates records per fingerprint, sorted by total time descending."""
+    groups = {}
+    for record in records:
+        if endpoint and record.get("endpoint") != endpoint:
+            continue
+        group = groups.setdefault(record["fingerprint"], {
+            "fingerprint": record["fingerprint"],
+            "sql": record["sql"],
+            "durations": [],
+            "cancelled": 0,
+            "endpoints": set(),
+            "params": record.get("params"),
+            "plan": None,
+            "plan_ms": None,
+        })
+        group["durations"].append(record["duration_ms"])
+        group["cancelled"] += bool(record.get("cancelled"))
+        if record.get("endpoint"):
+            group["endpoints"].add(record["endpoint"])
+        # Keep the plan of the slowest sampled call
+        if record.get("plan") and (group["plan_ms"] is None or record["duration_ms"] > group["plan_ms"]):
+            group["plan"] = record["plan"]
+            group["plan_ms"] = record["duration_ms"]
+
+    summary = []
+    for group in groups.values():
+        durations = sorted(group.pop("durations"))
+        group.update({
+            "calls": len(durations),
+            "total_ms": round(sum(durations), 2),
+            "mean_ms": round(sum(durations) / len(durations), 2),
+            "p95_ms": _percentile(durations, 95),
+            "max_ms": durations[-1],
+            "endpoints": sorted(group["endpoints"]),
+        })
+        summary.append(group)
+    summary.sort(key=lambda g: g["total_ms"], reverse=True)
+    return summary
+
+
+def format_plan(plan):
+    """Returns an indented one-line-per-node outline of an EXPLAIN JSON plan."""
+    root = plan[0] if isinstance(plan, list) else plan
+    lines = []
+
+    def walk(node, depth):
+        label = node.get("Node Type", "?")
+        if node.get("Relation Name"):
+            label += f" on {node['Relation Name']}"
+        if node.get("Index Name"):
+            label += f" using {node['Index Name']}"
+        lines.append(
+            f"{'  ' * depth}{label}  (rows={node.get('Actual Rows')}, "
+            f"time={node.get('Actual Total Time')} ms, "
+            f"hit={node.get('Shared Hit Blocks', 0)}, read={node.get('Shared Read Blocks', 0)})"
+        )
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(root["Plan"], 0)
+    lines.append(f"Planning {root.get('Planning Time')} ms, execution {root.get('Execution Time')} ms")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=config.SLOW_QUERY_LOG_PATH, help="slow query log file")
+    parser.add_argument("--top", type=int, default=10, help="number of statements to show")
+    parser.add_argument("--endpoint", help="only statements run by this endpoint")
+    parser.add_argument("--plans", action="store_true", help="print the slowest captured plan of each")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    summary = summarize(read_records(args.path), endpoint=args.endpoint)[:args.top]
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    if not summary:
+        print(f"No slow queries logged in {args.path}")
+        return
+
+    for rank, group in enumerate(summary, 1):
+        print(f"#{rank} {group['fingerprint']}  total {group['total_ms']:.0f} ms  "
+              f"calls {group['calls']}  mean {group['mean_ms']:.1f}  "
+              f"p95 {group['p95_ms']:.1f}  max {group['max_ms']:.1f}"
+              + (f"  cancelled {group['cancelled']}" if group["cancelled"] else ""))
+        print(f"   endpoints: {', '.join(group['endpoints']) or '-'}")
+        print(f"   params: {json.dumps(group['params'])}")
+        print(f"   {group['sql'][:500]}")
+        if args.plans and group["plan"]:
+            print(f"   plan of the slowest sampled call ({group['plan_ms']:.1f} ms):")
+            for line in format_plan(group["plan"]):
+                print(f"     {line}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from datetime import date, timedelta
 
+from app.schema import rebuild_vote_timeline, bump_data_version
+
 
 def seed_politicians(cursor):
     """Seed 60 politicians with diverse attributes."""
@@ -1101,3 +1103,5 @@ def seed_all_data(cursor):
     seed_donors(cursor)
     seed_donations(cursor)
     seed_votes(cursor)
+    rebuild_vote_timeline(cursor)
+    bump_data_version(cursor, "seed_test_data")
@@ -0,0 +1,78 @@
+"""Tests for the async entry point (app/async_main.py).
+
+The async app shares its SQL and response shaping with app/main.py, so these
+tests check that both apps return the same responses for the same requests.
+Skipped when the optional async dependencies are not installed.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("quart")
+pytest.importorskip("psycopg_pool")
+
+from app.async_main import app as async_app
+
+
+PATHS = [
+    "/api/politicians/search?name=john",
+    "/api/politician/1",
+    "/api/politician/999999",
+    "/api/politicians?ids=3,1,999999",
+    "/api/donors/search?name=smith",
+    "/api/donor/1",
+    "/api/donors?ids=2,1",
+    "/api/donor/1/donations",
+    "/api/donor/1/donations?page=1&per_page=1",
+    "/api/politician/1/votes",
+    "/api/politician/1/votes?sort=asc&type=hr&page=1",
+    "/api/politician/1/donations/summary",
+    "/api/politician/1/profile?top=2",
+    "/api/politician/1/donations/summary/filtered?topic=Health",
+    "/api/bills/subjects",
+]
+
+
+def async_get_all(paths):
+    """Requests each path from the async app; returns [(status, body bytes)]."""
+    async def run():
+        results = []
+        async with async_app.test_app() as test_app:
+            client = test_app.test_client()
+            for path in paths:
+                response = await client.get(path)
+                results.append((response.status_code, await response.get_data()))
+        return results
+    return asyncio.run(run())
+
+
+class TestAsyncApi:
+    """The async app mirrors the sync app's /api/* responses."""
+
+    def test_responses_match_sync_app(self, client, seed_test_data):
+        """Every route returns the same status and JSON from both apps."""
+        async_results = async_get_all(PATHS)
+        for path, (status, body) in zip(PATHS, async_results):
+            sync_response = client.get(path)
+            assert status == sync_response.status_code, path
+            assert json.loads(body) == json.loads(sync_response.data), path
+
+    def test_ndjson_export_matches_sync_app(self, client, seed_test_data):
+        """Streamed exports produce the same records."""
+        path = "/api/donor/1/donations?format=ndjson"
+        [(status, body)] = async_get_all([path])
+        assert status == 200
+        sync_lines = client.get(path).data.decode().splitlines()
+        assert body.decode().splitlines() == sync_lines
+
+    def test_validation_errors(self):
+        """Parameter validation matches the sync app."""
+        results = async_get_all([
+            "/api/politicians?ids=abc",
+            "/api/donor/1/donations?page=0",
+            "/api/donor/1/donations?format=xml",
+            "/api/politician/1/profile?top=abc",
+        ])
+        assert [status for status, _ in results] == [400, 400, 400, 400]
@@ -0,0 +1,69 @@
+"""Tests for the name matcher shared by build_fec_map.py and build_icpsr_map.py."""
+import pytest
+
+from bin.candidate_matcher import CandidateMatcher, jaro_winkler
+
+
+def test_jaro_winkler():
+    assert jaro_winkler("martha", "marhta") == pytest.approx(0.961, abs=1e-3)
+    assert jaro_winkler("dwayne", "duane") == pytest.approx(0.84, abs=1e-3)
+    assert jaro_winkler("dixon", "dicksonx") == pytest.approx(0.813, abs=1e-3)
+    assert jaro_winkler("abc", "") == 0.0
+    assert jaro_winkler("same", "same") == 1.0
+
+
+@pytest.fixture
+def matcher():
+    m = CandidateMatcher()
+    m.add(1, "Nancy", "Pelosi", "california", "House")
+    m.add(2, "Ted", "Cruz", "texas", "Senate")
+    m.add(3, "Bernard", "Sanders", "vermont", "Senate")
+    m.add(4, "Debbie", "Wasserman Schultz", "florida", "House")
+    m.add(5, "Adam", "Smith", "washington", "House")
+    m.add(6, "Jaime", "Herrera Beutler", "washington", "House")
+    m.add(7, "John", "Kennedy", "louisiana", "Senate")
+    m.add(8, "John", "Kennedy", "louisiana", "House")
+    m.add(9, "Mike", "Johnson", "louisiana", "House")
+    m.add(10, "Joseph R.", "Biden", "us", "Executive")
+    return m
+
+
+class TestCandidateMatcher:
+    """Names match within their state on last name plus a compatible first name."""
+
+    @pytest.mark.parametrize("name, state, office, pid", [
+        ("PELOSI, NANCY P (DEM)", "california", "H", 1),
+        ('CRUZ, RAFAEL EDWARD "TED"', "texas", "S", 2),       # nickname given in the source
+        ("SANDERS, BERNIE", "vermont", "S", 3),               # known nickname
+        ("WASSERMAN SCHULTZ, DEBBIE", "florida", "H", 4),     # compound last name
+        ("BEUTLER, JAIME HERRERA", "washington", "H", 6),     # one part of it
+        ("PELOSSI, NANCY", "california", "H", 1),             # misspelt, found by fuzzy scoring
+        ("JOHNSON, JAMES MICHAEL", "louisiana", "House", 9),  # goes by a middle name
+        ("BIDEN, JOSEPH R JR", "us", "P", 10),
+    ])
+    def test_matches(self, matcher, name, state, office, pid):
+        assert matcher.match(name, state, office) == pid
+
+    def test_blocked_by_state(self, matcher):
+        assert matcher.match("PELOSI, NANCY", "texas", "H") is None
+
+    def test_different_first_name_does_not_match(self, matcher):
+        assert matcher.match("SMITH, JOHN", "washington", "H") is None
+
+    def test_office_breaks_ties(self, matcher):
+        assert matcher.match("KENNEDY, JOHN NEELY", "louisiana", "S") == 7
+        assert matcher.match("KENNEDY, JOHN", "louisiana", "H") == 8
+
+    def test_unresolvable_tie_is_not_matched(self, matcher):
+        assert matcher.match("KENNEDY, JOHN", "louisiana") is None
+        assert matcher.ambiguous == 1
+
+    def test_stats_count_repeated_lookups(self, matcher):
+        for _ in range(3):
+            matcher.match("PELOSI, NANCY", "california", "H")
+            matcher.match("SMITH, JOHN", "washington", "H")
+        stats = matcher.stats()
+        assert stats["lookups"] == 6 and stats["matched"] == 3
+        assert stats["unique_names"] == 2 and stats["unique_matched"] == 1
+        assert stats["match_rate"] == 0.5
+        assert "Matched 3 of 6 names (50.0%)" in matcher.format_stats()
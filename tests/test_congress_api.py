@@ -0,0 +1,231 @@
+"""Tests for the Congress.gov client, against a local stand-in server."""
+import gzip
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from bin.congress_api import CongressApiError, CongressClient, ResponseCache, TokenBucket
+
+MEMBERS_PER_CONGRESS = 23
+
+
+class FakeCongressApi(BaseHTTPRequestHandler):
+    """Serves /v3/member with offset/limit pagination, ETags and scripted failures."""
+
+    server_version = "FakeCongressApi"
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with server.lock:
+            server.requests.append(query)
+            server.conditional.append(self.headers.get("If-None-Match"))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            failure = server.failures.pop(0) if server.failures else None
+        try:
+            time.sleep(server.delay)
+            if failure:
+                self.send_response(failure)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+            if self.headers.get("X-Api-Key") != "test-key":
+                self.send_response(403)
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == server.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            congress = query.get("congress", "cur")
+            offset, limit = int(query["offset"]), int(query["limit"])
+            members = [{"name": f"Member{n}, {congress}"} for n in range(MEMBERS_PER_CONGRESS)]
+            body = json.dumps({
+                "members": members[offset:offset + limit],
+                "pagination": {"count": len(members)},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", server.etag)
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeCongressApi)
+    server.lock = threading.Lock()
+    server.requests, server.conditional, server.failures = [], [], []
+    server.etag = '"v1"'
+    server.active = server.max_active = 0
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_port}/v3"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(api, **kwargs):
+    options = dict(rate_per_hour=3_600_000, burst=100, workers=8, page_size=5, backoff_base=0.01)
+    options.update(kwargs)
+    return CongressClient("test-key", base_url=api.base_url, **options)
+
+
+class TestTokenBucket:
+    """The bucket allows a burst, then the configured rate."""
+
+    def test_burst_then_rate(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=lambda: now[0], sleep=sleep)
+        for _ in range(5):
+            bucket.acquire()
+        assert now[0] == pytest.approx(1.0)  # 3 immediately, then one every 0.5s
+        assert slept == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_rate_limits_client(self, api):
+        client = make_client(api, rate_per_hour=36_000, burst=1)  # 10 requests/second
+        start = time.perf_counter()
+        client.fetch_all("member", {"congress": 118})  # 5 pages
+        assert time.perf_counter() - start >= 0.35
+
+
+class TestFetching:
+    """Pages and queries are fetched concurrently and reassembled in order."""
+
+    def test_all_pages_in_order(self, api):
+        members = make_client(api).fetch_all("member", {"congress": 118})
+        assert [m["name"] for m in members] == [f"Member{n}, 118" for n in range(MEMBERS_PER_CONGRESS)]
+        offsets = sorted(int(q["offset"]) for q in api.requests)
+        assert offsets == [0, 5, 10, 15, 20]
+        assert all(q["format"] == "json" for q in api.requests)
+
+    def test_congresses_fetched_in_parallel(self, api):
+        api.delay = 0.2
+        client = make_client(api)
+        start = time.perf_counter()
+        result = client.fetch_many({c: ("member", {"congress": c}) for c in range(108, 120)})
+        elapsed = time.perf_counter() - start
+        assert sorted(result) == list(range(108, 120))
+        assert all(len(members) == MEMBERS_PER_CONGRESS for members in result.values())
+        assert len(api.requests) == 12 * 5
+        assert api.max_active == 8
+        assert elapsed < 12 * 5 * 0.2 / 4
+
+
+class TestRetries:
+    """Throttling and server errors are retried; client errors are not."""
+
+    def test_retries_throttling_and_server_errors(self, api):
+        api.failures = [429, 503, 502]
+        client = make_client(api, workers=1)
+        members = client.fetch_all("member", {"currentMember": "true"})
+        assert len(members) == MEMBERS_PER_CONGRESS
+        assert client.retries == 3
+        assert client.requests_sent == 5 + 3
+
+    def test_gives_up_after_max_retries(self, api):
+        api.failures = [503] * 10
+        client = make_client(api, workers=1, max_retries=2)
+        with pytest.raises(CongressApiError, match="after 3 attempts: HTTP 503"):
+            client.fetch_all("member")
+
+    def test_client_error_not_retried(self, api):
+        client = CongressClient("wrong-key", base_url=api.base_url, backoff_base=0.01)
+        with pytest.raises(CongressApiError, match="returned 403"):
+            client.get("member", {"offset": 0, "limit": 5})
+        assert client.retries == 0
+
+    def test_backoff_grows_with_jitter(self, api):
+        client = make_client(api, backoff_base=1.0, backoff_max=8.0)
+        delays = [client.backoff(attempt) for attempt in range(6) for _ in range(50)]
+        assert all(0 <= d <= 8.0 for d in delays)
+        assert max(client.backoff(0) for _ in range(50)) <= 1.0
+        assert client.backoff(0, retry_after="3") >= 3.0
+
+
+class TestResponseCache:
+    """Cached responses are revalidated, reused when immutable and replayed offline."""
+
+    def test_revalidates_with_etag(self, api, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        first = make_client(api, cache=cache).fetch_all("member", {"currentMember": "true"})
+        client = make_client(api, cache=cache)
+        assert client.fetch_all("member", {"currentMember": "true"}) == first
+        assert client.requests_sent == 5
+        assert client.revalidated == 5
+        assert api.conditional[-5:] == ['"v1"'] * 5
+
+    def test_changed_response_replaces_entry(self, api, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        make_client(api, cache=cache).fetch_all("member", {"congress": 119})
+        api.etag = '"v2"'
+        client = make_client(api, cache=cache)
+        client.fetch_all("member", {"congress": 119})
+        assert client.revalidated == 0
+        entry = cache.load(f"{api.base_url}/member", {"congress": 119, "offset": 0, "limit": 5, "format": "json"})
+        assert entry["etag"] == '"v2"'
+
+    def test_immutable_responses_reused_without_requests(self, api, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        queries = {c: ("member", {"congress": c}) for c in (117, 118, 119)}
+        make_client(api, cache=cache).fetch_many(queries, immutable=[117, 118])
+        client = make_client(api, cache=cache)
+        result = client.fetch_many(queries, immutable=[117, 118])
+        assert all(len(members) == MEMBERS_PER_CONGRESS for members in result.values())
+        assert client.cache_hits == 10
+        assert client.requests_sent == 5  # only the open Congress is revalidated
+
+    def test_mutable_entry_revalidated_once_when_immutable(self, api, tmp_path):
+        """A page cached while its Congress was current is revalidated before it is reused for good."""
+        cache = ResponseCache(str(tmp_path))
+        params = {"congress": 119, "offset": 0, "limit": 5}
+        make_client(api, cache=cache).get("member", params)
+        client = make_client(api, cache=cache)
+        client.get("member", params, immutable=True)
+        assert client.requests_sent == 1 and client.revalidated == 1
+        assert api.conditional[-1] == '"v1"'
+        assert cache.load(f"{api.base_url}/member", dict(params, format="json"))["immutable"]
+        client.get("member", params, immutable=True)
+        assert client.requests_sent == 1 and client.cache_hits == 1
+
+    def test_offline_replays_from_cache(self, api, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        expected = make_client(api, cache=cache).fetch_all("member", {"congress": 118})
+        sent = len(api.requests)
+        client = CongressClient(None, base_url=api.base_url, page_size=5, cache=cache, offline=True)
+        assert client.fetch_all("member", {"congress": 118}) == expected
+        assert client.requests_sent == 0 and len(api.requests) == sent
+        with pytest.raises(CongressApiError, match="not cached"):
+            client.fetch_all("member", {"congress": 117})
+
+    def test_entries_are_compressed(self, api, tmp_path):
+        make_client(api, cache=ResponseCache(str(tmp_path))).fetch_all("member", {"congress": 118})
+        paths = [os.path.join(d, f) for d, _, files in os.walk(tmp_path) for f in files]
+        assert len(paths) == 5 and all(p.endswith(".json.gz") for p in paths)
+        with gzip.open(paths[0], "rt") as f:
+            assert json.load(f)["body"]["pagination"]["count"] == MEMBERS_PER_CONGRESS
+
+    def test_offline_requires_cache(self):
+        with pytest.raises(ValueError):
+            CongressClient(None, offline=True)
@@ -0,0 +1,110 @@
+"""Tests for conditional requests and compression (app/http_cache.py)."""
+
+import gzip
+import json
+
+from app import config
+from app.http_cache import make_api_etag
+
+
+class TestApiConditionalRequests:
+    """API responses carry a data-version ETag and honor If-None-Match."""
+
+    def test_api_response_has_etag(self, client, seed_test_data):
+        """GET responses under /api/ include a weak ETag and Last-Modified."""
+        response = client.get("/api/politician/1")
+        assert response.status_code == 200
+        etag, weak = response.get_etag()
+        assert etag and weak
+        assert response.last_modified is not None
+        assert "no-cache" in response.headers["Cache-Control"]
+
+    def test_if_none_match_returns_304(self, client, seed_test_data):
+        """A repeat request with the ETag gets an empty 304."""
+        first = client.get("/api/politician/1/votes?page=1")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/politician/1/votes?page=1", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_etag_varies_by_query(self, client, seed_test_data):
+        """Different query strings get different ETags."""
+        page_1 = client.get("/api/politician/1/votes?page=1").headers["ETag"]
+        page_2 = client.get("/api/politician/1/votes?page=2").headers["ETag"]
+        assert page_1 != page_2
+
+        response = client.get("/api/politician/1/votes?page=2", headers={"If-None-Match": page_1})
+        assert response.status_code == 200
+
+    def test_etag_changes_with_data_version(self, client, seed_test_data):
+        """Bumping the data version invalidates earlier ETags."""
+        from app.http_cache import reset_data_version_cache
+        from app.schema import bump_data_version
+
+        etag = client.get("/api/politician/1").headers["ETag"]
+
+        cursor = seed_test_data.cursor()
+        bump_data_version(cursor, "test")
+        seed_test_data.commit()
+        cursor.close()
+        reset_data_version_cache()
+
+        response = client.get("/api/politician/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_errors_and_exports_have_no_etag(self, client, seed_test_data):
+        """Error responses and streamed exports are not tagged."""
+        assert "ETag" not in client.get("/api/politician/999999").headers
+        assert "ETag" not in client.get("/api/donor/1/donations?format=csv").headers
+
+
+class TestCompression:
+    """Large responses are compressed for clients that accept it."""
+
+    def test_large_api_response_is_gzipped(self, client, seed_test_data, monkeypatch):
+        """Responses over the threshold are gzip-encoded and decode to the same JSON."""
+        monkeypatch.setattr(config, "COMPRESS_MIN_SIZE", 1)
+        plain = client.get("/api/bills/subjects")
+        compressed = client.get("/api/bills/subjects", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in plain.headers
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert json.loads(gzip.decompress(compressed.data)) == json.loads(plain.data)
+
+    def test_small_response_not_compressed(self, client, seed_test_data, monkeypatch):
+        """Responses under the threshold are sent as-is."""
+        monkeypatch.setattr(config, "COMPRESS_MIN_SIZE", 10_000_000)
+        response = client.get("/api/bills/subjects", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+
+class TestTemplateCaching:
+    """HTML pages are cacheable and conditional; no database needed."""
+
+    def test_template_has_long_lived_cache_headers(self, client):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert f"max-age={config.TEMPLATE_MAX_AGE}" in response.headers["Cache-Control"]
+        assert "ETag" in response.headers
+
+    def test_template_revalidates_with_304(self, client):
+        etag = client.get("/donor_search.html").headers["ETag"]
+        response = client.get("/donor_search.html", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_template_is_gzipped(self, client, monkeypatch):
+        monkeypatch.setattr(config, "COMPRESS_MIN_SIZE", 1)
+        plain = client.get("/")
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data) == plain.data
+
+
+def test_make_api_etag_depends_on_version_and_path():
+    assert make_api_etag(1, "/api/donor/1?") == make_api_etag(1, "/api/donor/1?")
+    assert make_api_etag(1, "/api/donor/1?") != make_api_etag(2, "/api/donor/1?")
+    assert make_api_etag(1, "/api/donor/1?") != make_api_etag(1, "/api/donor/2?")
@@ -0,0 +1,72 @@
+"""Tests for the API JSON providers in app/json_provider.py.
+
+These exercise the encoders directly and do not need the test database.
+"""
+
+import json
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+
+import psycopg2.extras
+import pytest
+
+from app.main import app
+from app.json_provider import OrjsonProvider, StdlibProvider, json_array_sql, orjson
+
+
+class FakeCursor:
+    """Just enough of a cursor for DictRow to be constructed."""
+
+    def __init__(self, columns):
+        self.index = OrderedDict((name, i) for i, name in enumerate(columns))
+        self.description = [(name,) for name in columns]
+
+
+def make_row(**values):
+    row = psycopg2.extras.DictRow(FakeCursor(list(values)))
+    row[:] = list(values.values())
+    return row
+
+
+PROVIDERS = [StdlibProvider]
+if orjson is not None:
+    PROVIDERS.append(OrjsonProvider)
+
+
+@pytest.mark.parametrize("provider_class", PROVIDERS)
+class TestJSONProviders:
+    """Both providers serialize database types the same way."""
+
+    def test_decimal_becomes_number(self, provider_class):
+        provider = provider_class(app)
+        assert json.loads(provider.dumps({"amount": Decimal("2500.50")})) == {"amount": 2500.5}
+
+    def test_dates_are_iso(self, provider_class):
+        provider = provider_class(app)
+        data = json.loads(provider.dumps({"d": date(2023, 1, 15), "dt": datetime(2023, 1, 15, 9, 30)}))
+        assert data["d"] == "2023-01-15"
+        assert data["dt"].startswith("2023-01-15T09:30")
+
+    def test_dictrow_becomes_object(self, provider_class):
+        provider = provider_class(app)
+        row = make_row(donorid=1, name="Alice", amount=Decimal("10.00"))
+        assert json.loads(provider.dumps([row])) == [{"donorid": 1, "name": "Alice", "amount": 10.0}]
+
+    def test_response_is_json(self, provider_class):
+        provider = provider_class(app)
+        with app.app_context():
+            response = provider.response({"subjects": ["Health", "Taxation"]})
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == {"subjects": ["Health", "Taxation"]}
+
+    def test_unknown_type_raises(self, provider_class):
+        provider = provider_class(app)
+        with pytest.raises(TypeError):
+            provider.dumps({"x": object()})
+
+
+def test_json_array_sql_wraps_query():
+    """The wrapped query aggregates rows and strips the trailing semicolon."""
+    sql = json_array_sql("SELECT 1 AS a ORDER BY a;\n")
+    assert sql == "SELECT COALESCE(json_agg(q), '[]'::json)::text FROM (SELECT 1 AS a ORDER BY a) q;"
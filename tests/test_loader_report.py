@@ -0,0 +1,110 @@
+"""Tests for the loader run reports."""
+import json
+import time
+
+import pytest
+
+from app import config
+from bin.loader_report import RunReport, format_report
+
+
+def _stages(report):
+    return {s["name"]: s for s in report.as_dict()["stages"]}
+
+
+class TestStages:
+    """Stages accumulate time and rows by name."""
+
+    def test_repeated_stage_accumulates(self):
+        report = RunReport("test_loader")
+        for rows in (3, 4):
+            with report.stage("parse") as stage:
+                stage.rows_in += rows
+                stage.rows_out += rows - 1
+        parse = _stages(report)["parse"]
+        assert parse["calls"] == 2
+        assert (parse["rows_in"], parse["rows_out"]) == (7, 5)
+
+    def test_nested_stage_not_counted_twice(self):
+        report = RunReport("test_loader")
+        with report.stage("resolve"):
+            with report.stage("write"):
+                time.sleep(0.05)
+        stages = _stages(report)
+        assert stages["write"]["wall_s"] >= 0.05
+        assert stages["resolve"]["wall_s"] < 0.05
+
+    def test_rows_per_second(self):
+        report = RunReport("test_loader")
+        with report.stage("write") as stage:
+            time.sleep(0.01)
+            stage.rows_out += 100
+        write = _stages(report)["write"]
+        assert write["rows_per_s"] == pytest.approx(100 / report.stages["write"].wall_s, abs=0.1)
+        assert write["peak_rss_mb"] > 0
+
+
+class TestRun:
+    """A run prints the report and saves it as JSON."""
+
+    def test_saves_report(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(config, "LOADER_REPORT_DIR", str(tmp_path))
+        report = RunReport("test_loader")
+        with report.run():
+            with report.stage("parse") as stage:
+                stage.rows_in += 10
+
+        [path] = tmp_path.glob("test_loader-*.json")
+        saved = json.loads(path.read_text())
+        assert saved["loader"] == "test_loader"
+        assert saved["status"] == "ok"
+        assert saved["stages"][0]["rows_in"] == 10
+        assert saved["wall_s"] >= saved["stages"][0]["wall_s"]
+        assert "--- Run report: test_loader (ok) ---" in capsys.readouterr().out
+
+    def test_failed_run_still_saved(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "LOADER_REPORT_DIR", str(tmp_path))
+        report = RunReport("test_loader")
+        with pytest.raises(ValueError):
+            with report.run():
+                raise ValueError("bad row")
+        [path] = tmp_path.glob("test_loader-*.json")
+        saved = json.loads(path.read_text())
+        assert saved["status"] == "error"
+        assert saved["error"] == "ValueError: bad row"
+
+    def test_loader_failure_reaches_report(self, tmp_path, monkeypatch):
+        """A real loader entry point that cannot connect ends its run as an error."""
+        import psycopg2
+        from bin import build_icpsr_map
+
+        monkeypatch.setattr(config, "LOADER_REPORT_DIR", str(tmp_path))
+        monkeypatch.setattr(config, "conn_params", dict(config.conn_params, host="127.0.0.1", port="1"))
+        with pytest.raises(psycopg2.OperationalError):
+            with build_icpsr_map.report.run():
+                build_icpsr_map.build_icpsr_map()
+        [path] = tmp_path.glob("build_icpsr_map-*.json")
+        saved = json.loads(path.read_text())
+        assert saved["status"] == "error"
+        assert saved["error"].startswith("OperationalError")
+
+    @pytest.mark.parametrize("code, status", [(0, "ok"), (None, "ok"), (2, "error")])
+    def test_exit_code_sets_status(self, tmp_path, monkeypatch, code, status):
+        monkeypatch.setattr(config, "LOADER_REPORT_DIR", str(tmp_path))
+        report = RunReport("test_loader")
+        with pytest.raises(SystemExit):
+            with report.run():
+                raise SystemExit(code)
+        [path] = tmp_path.glob("test_loader-*.json")
+        assert json.loads(path.read_text())["status"] == status
+
+    def test_run_resets_previous_stages(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "LOADER_REPORT_DIR", str(tmp_path))
+        report = RunReport("test_loader")
+        with report.run(save=False):
+            with report.stage("parse"):
+                pass
+        with report.run(save=False):
+            pass
+        assert report.as_dict()["stages"] == []
+        assert "total" in format_report(report.as_dict())
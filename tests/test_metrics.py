@@ -0,0 +1,62 @@
+"""Tests for request instrumentation and the /metrics endpoint."""
+
+from app.metrics import Histogram
+
+
+class TestApiMetrics:
+    """API requests record DB time and rows per route."""
+
+    def test_server_timing_includes_db_time(self, client, seed_test_data):
+        response = client.get("/api/politician/1/votes")
+        assert response.status_code == 200
+        timing = response.headers["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "app;dur=" in timing and "total;dur=" in timing
+
+    def test_metrics_record_route_with_rows(self, client, seed_test_data):
+        client.get("/api/politician/1")
+        body = client.get("/metrics").data.decode()
+        route = 'route="/api/politician/<int:politician_id>"'
+        assert f"http_request_db_seconds_count{{{route}}}" in body
+        assert f'http_requests_total{{{route},status="200"}}' in body
+        # At least one row was returned, so the le="0" bucket is not the total
+        rows_zero = [l for l in body.splitlines()
+                     if l.startswith(f'http_response_db_rows_bucket{{{route},le="0"}}')][0]
+        rows_total = [l for l in body.splitlines()
+                      if l.startswith(f"http_response_db_rows_count{{{route}}}")][0]
+        assert int(rows_zero.split()[-1]) < int(rows_total.split()[-1])
+
+    def test_cache_hits_counted(self, client, seed_test_data):
+        etag = client.get("/api/politician/1").headers["ETag"]
+        assert client.get("/api/politician/1", headers={"If-None-Match": etag}).status_code == 304
+        body = client.get("/metrics").data.decode()
+        assert 'http_cache_hits_total{route="/api/politician/<int:politician_id>"}' in body
+
+
+def test_metrics_endpoint_format(client):
+    """/metrics serves Prometheus text including the page just requested."""
+    client.get("/donor_search.html")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.data.decode()
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_count{route="/donor_search.html"}' in body
+    assert 'http_response_bytes_bucket{route="/donor_search.html",le="+Inf"}' in body
+
+
+def test_server_timing_on_pages(client):
+    response = client.get("/")
+    assert "total;dur=" in response.headers["Server-Timing"]
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Test.", (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe("/r", value)
+    lines = histogram.render()
+    assert 'test_seconds_bucket{route="/r",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{route="/r",le="1.0"} 3' in lines
+    assert 'test_seconds_bucket{route="/r",le="+Inf"} 4' in lines
+    assert 'test_seconds_count{route="/r"} 4' in lines
+    assert 'test_seconds_sum{route="/r"} 3.65' in lines
@@ -0,0 +1,54 @@
+"""Tests for the memoized normalizers shared by the loaders."""
+import pytest
+
+from bin.name_normalization import (NAME_CACHE_SIZE, cache_info, parse_name, split_bill_number,
+                                    split_last_first)
+
+
+class TestParseName:
+    """Source name formats parse into the same lowercase parts."""
+
+    @pytest.mark.parametrize("name, first, middle, last", [
+        ("PELOSI, NANCY P (DEM)", "nancy", ("p",), "pelosi"),
+        ("SMITH, CHRISTOPHER H JR", "christopher", ("h",), "smith"),
+        ("VAN HOLLEN, CHRIS", "chris", (), "vanhollen"),
+        ("O'ROURKE, BETO", "beto", (), "orourke"),
+        ("Nancy Pelosi", "nancy", (), "pelosi"),
+        ("Dr. Ron Paul Jr.", "ron", (), "paul"),
+        ("", "", (), ""),
+        (None, "", (), ""),
+    ])
+    def test_parts(self, name, first, middle, last):
+        parsed = parse_name(name)
+        assert (parsed.first, parsed.middle, parsed.last) == (first, middle, last)
+
+    def test_nicknames_quoted_or_bracketed(self):
+        assert parse_name('CRUZ, RAFAEL EDWARD "TED"').nicknames == ("ted",)
+        assert parse_name("CRUZ, Rafael Edward (Ted)").nicknames == ("ted",)
+        assert parse_name("SANDERS, BERNARD (IND)").nicknames == ()
+
+    def test_memoized_with_bounded_cache(self):
+        parse_name.cache_clear()
+        for _ in range(3):
+            parse_name("PELOSI, NANCY P (DEM)")
+        info = cache_info()["parse_name"]
+        assert (info.hits, info.misses) == (2, 1)
+        assert info.maxsize == NAME_CACHE_SIZE
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("H.R. 1234", ("hr", 1234)), ("HR1234", ("hr", 1234)), (" S.J.Res. 5 ", ("sjres", 5)),
+    ("HJRES12", ("hjres", 12)), ("S", None), ("1234", None), (None, None),
+])
+def test_split_bill_number(raw, expected):
+    assert split_bill_number(raw) == expected
+
+
+@pytest.mark.parametrize("full_name, expected", [
+    ("Pelosi, Nancy", ("Nancy", "Pelosi")),
+    ("Ocasio-Cortez,  Alexandria ", ("Alexandria", "Ocasio-Cortez")),
+    ("Cher", ("", "Cher")),
+    (None, ("", "")),
+])
+def test_split_last_first(full_name, expected):
+    assert split_last_first(full_name) == expected
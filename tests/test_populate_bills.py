@@ -0,0 +1,165 @@
+"""Tests for the BILLSTATUS parsing in populate_bills.py."""
+import datetime
+import xml.etree.ElementTree as ET
+
+from bin.name_normalization import split_bill_number
+from bin.populate_bills import (
+    BILL_DETAIL_COLUMNS, clear_bill_detail_tables, create_bill_detail_tables_if_not_exists,
+    extract_bill_details, insert_bill_details, is_bill_enacted,
+)
+
+# An enacted companion bill, listed before the bill's own latestAction
+RELATED_BILLS = """
+    <relatedBills>
+      <item>
+        <title>Companion Act</title>
+        <congress>118</congress>
+        <number>99</number>
+        <type>S</type>
+        <latestAction>
+          <actionDate>2023-12-01</actionDate>
+          <text>Became Public Law No: 118-50.</text>
+        </latestAction>
+      </item>
+    </relatedBills>"""
+
+
+def _bill(body):
+    return ET.fromstring(f"<billStatus><bill>{body}</bill></billStatus>").find("bill")
+
+
+class TestIsBillEnacted:
+    """Only the bill's own laws and latestAction count."""
+
+    def test_listed_law(self):
+        assert is_bill_enacted(_bill("<laws><item><type>Public Law</type><number>118-50</number></item></laws>"))
+
+    def test_latest_action(self):
+        assert is_bill_enacted(_bill("<latestAction><text>Became Private Law No: 118-1.</text></latestAction>"))
+
+    def test_enacted_companion_ignored(self):
+        bill = _bill(RELATED_BILLS + """
+            <latestAction>
+              <actionDate>2023-04-01</actionDate>
+              <text>Referred to the House Committee on Ways and Means.</text>
+            </latestAction>""")
+        assert not is_bill_enacted(bill)
+
+    def test_no_latest_action(self):
+        assert not is_bill_enacted(_bill("<title>Untitled</title>"))
+
+
+# Laid out like a BILLSTATUS file: related bills and an amendment with
+# actions of their own come before the bill's policyArea, subjects and
+# latestAction. The subjects use the older billSubjects nesting.
+BILL_STATUS = f"""
+<billStatus>
+  <bill>
+    <number>12</number>
+    <type>HJRES</type>
+    <introducedDate>2023-03-01</introducedDate>
+    <congress>118</congress>
+    <title>A joint resolution on taxes.</title>
+    {RELATED_BILLS}
+    <amendments>
+      <amendment>
+        <number>5</number>
+        <actions><item><actionDate>2023-06-01</actionDate><text>Amendment offered.</text></item></actions>
+        <sponsors><item><bioguideId>Z000001</bioguideId><fullName>Amendment Sponsor</fullName></item></sponsors>
+      </amendment>
+    </amendments>
+    <actions>
+      <item><actionDate>2023-03-01</actionDate><type>IntroReferral</type><text>Introduced in House</text></item>
+      <item><actionDate>2023-04-01</actionDate><type>IntroReferral</type><text>Referred to committee.</text></item>
+    </actions>
+    <sponsors>
+      <item><bioguideId>A000001</bioguideId><fullName>Rep. Adams, Ann [D-CA-1]</fullName>
+        <party>D</party><state>CA</state></item>
+    </sponsors>
+    <cosponsors>
+      <item><bioguideId>B000002</bioguideId><fullName>Rep. Brown, Bo [R-TX-2]</fullName><party>R</party>
+        <state>TX</state><sponsorshipDate>2023-03-01</sponsorshipDate><isOriginalCosponsor>True</isOriginalCosponsor></item>
+      <item><bioguideId>C000003</bioguideId><fullName>Rep. Cole, Cy [D-NY-3]</fullName><party>D</party>
+        <state>NY</state><sponsorshipDate>2023-05-02</sponsorshipDate><isOriginalCosponsor>False</isOriginalCosponsor></item>
+      <item><bioguideId>D000004</bioguideId><fullName>Rep. Diaz, Di [D-FL-4]</fullName></item>
+    </cosponsors>
+    <subjects>
+      <billSubjects>
+        <legislativeSubjects>
+          <item><name>Income tax rates</name></item>
+          <item><name>Tax administration</name></item>
+          <item><name>Income tax rates</name></item>
+        </legislativeSubjects>
+      </billSubjects>
+    </subjects>
+    <policyArea><name>Taxation</name></policyArea>
+    <latestAction>
+      <actionDate>2023-04-01</actionDate>
+      <text>Referred to the House Committee on Ways and Means.</text>
+    </latestAction>
+  </bill>
+</billStatus>"""
+
+
+def _details():
+    return extract_bill_details(ET.fromstring(BILL_STATUS), 118, False)
+
+
+class TestExtractBillDetails:
+    """One BILLSTATUS document becomes rows for each detail table."""
+
+    def test_key_matches_bill_number_split(self):
+        key = (118,) + split_bill_number("HJRES12")
+        assert key == (118, "hjres", 12)
+        for rows in _details().values():
+            assert all(row[:3] == key for row in rows)
+
+    def test_status_from_the_bill_itself(self):
+        [status] = _details()["bill_status"]
+        assert status[3:] == ("A joint resolution on taxes.", datetime.date(2023, 3, 1), "Taxation", False,
+                              datetime.date(2023, 4, 1), "Referred to the House Committee on Ways and Means.")
+
+    def test_older_subject_nesting_deduplicated(self):
+        assert [row[3] for row in _details()["bill_subjects"]] == ["Income tax rates", "Tax administration"]
+
+    def test_current_subject_nesting(self):
+        root = ET.fromstring(BILL_STATUS.replace("<billSubjects>", "").replace("</billSubjects>", ""))
+        subjects = extract_bill_details(root, 118, False)["bill_subjects"]
+        assert [row[3] for row in subjects] == ["Income tax rates", "Tax administration"]
+
+    def test_sponsors_and_original_cosponsors(self):
+        sponsors = [(row[3], row[4], row[8], row[9]) for row in _details()["bill_sponsors"]]
+        assert sponsors == [
+            ("sponsor", "A000001", None, None),
+            ("cosponsor", "B000002", datetime.date(2023, 3, 1), True),
+            ("cosponsor", "C000003", datetime.date(2023, 5, 2), False),
+            ("cosponsor", "D000004", None, None),
+        ]
+
+    def test_amendment_actions_excluded(self):
+        actions = [row[3:] for row in _details()["bill_actions"]]
+        assert actions == [
+            (0, datetime.date(2023, 3, 1), "IntroReferral", "Introduced in House"),
+            (1, datetime.date(2023, 4, 1), "IntroReferral", "Referred to committee."),
+        ]
+
+    def test_document_without_bill(self):
+        assert extract_bill_details(ET.fromstring("<billStatus/>"), 118, False) is None
+
+
+class TestInsertBillDetails:
+    """Extracted rows are COPYed into the detail tables as they are."""
+
+    def test_rows_round_trip(self, db_connection):
+        conn = db_connection
+        create_bill_detail_tables_if_not_exists(conn)
+        clear_bill_detail_tables(conn)
+        details = _details()
+        cur = conn.cursor()
+        assert insert_bill_details(conn, cur, details) == sum(map(len, details.values()))
+
+        for table, rows in details.items():
+            cur.execute(f"SELECT {', '.join(BILL_DETAIL_COLUMNS[table])} FROM {table}")
+            assert sorted(cur.fetchall(), key=repr) == sorted(rows, key=repr), table
+        clear_bill_detail_tables(conn)
+        cur.close()
@@ -0,0 +1,114 @@
+"""Tests for populate_votes.py's SQL-side resolution (--sql).
+
+A few roll calls and votes are written as Voteview files, COPYed into the
+staging tables and resolved against the seeded Politicians and a handful of
+bills added here.
+"""
+import json
+
+import psycopg2
+import pytest
+
+from bin import populate_votes
+from bin.build_icpsr_map import create_icpsr_map_table_if_not_exists
+
+
+def _write(folder, name, records):
+    (folder / name).write_text(json.dumps(records))
+
+
+@pytest.fixture
+def staged(seed_test_data, tmp_path, monkeypatch):
+    """Seed data plus an ICPSR map, three bills and staged Voteview records.
+
+    Returns (conn, cur, politician ids, {(congress, bill number): BillID}).
+    """
+    conn = seed_test_data
+    cur = conn.cursor()
+    cur.execute("SELECT PoliticianID FROM Politicians ORDER BY PoliticianID LIMIT 3")
+    pids = [row[0] for row in cur.fetchall()]
+    bills = {}
+    for congress, number in ((117, "H.R.9001"), (118, "H.R.9001"), (118, "S.9002")):
+        cur.execute("INSERT INTO Bills (BillNumber, Title, Congress) VALUES (%s, %s, %s) RETURNING BillID",
+                    (number, f"Test bill {number}", congress))
+        bills[(congress, number)] = cur.fetchone()[0]
+    conn.commit()
+
+    create_icpsr_map_table_if_not_exists(conn)
+    cur.execute("DELETE FROM icpsr_politician_map")
+    # 103 is known but unmatched; 104 is not in the map at all
+    cur.executemany("INSERT INTO icpsr_politician_map (icpsr, politician_id) VALUES (%s, %s)",
+                    [(101, pids[0]), (102, pids[1]), (103, None), (105, pids[2])])
+    conn.commit()
+
+    _write(tmp_path, "HS117_rollcalls.json", [
+        {"congress": 117, "chamber": "House", "rollnumber": 1, "bill_number": "HR9001"},
+    ])
+    _write(tmp_path, "HS118a_rollcalls.json", [
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "bill_number": "HR9001"},
+        {"congress": 118, "chamber": "House", "rollnumber": 2, "bill_number": "S9002"},
+    ])
+    # Roll call 2 again in a later file: it now links to H.R. 9001
+    _write(tmp_path, "HS118b_rollcalls.json", [
+        {"congress": 118, "chamber": "House", "rollnumber": 2, "bill_number": "HR9001"},
+    ])
+    _write(tmp_path, "HS117_votes.json", [
+        {"congress": 117, "chamber": "House", "rollnumber": 1, "icpsr": 101, "cast_code": 1},
+    ])
+    _write(tmp_path, "HS118_votes.json", [
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "icpsr": 101, "cast_code": 6},
+        {"congress": 118, "chamber": "House", "rollnumber": 2, "icpsr": 101, "cast_code": 1},
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "icpsr": 102, "cast_code": 9},
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "icpsr": 103, "cast_code": 1},
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "icpsr": 104, "cast_code": 1},
+        {"congress": 118, "chamber": "House", "rollnumber": 1, "icpsr": 105, "cast_code": 10},
+        {"congress": 118, "chamber": "House", "rollnumber": 2, "icpsr": 105, "cast_code": None},
+    ])
+    monkeypatch.setattr(populate_votes, "VOTE_DATA_FOLDER_PATH", str(tmp_path))
+
+    populate_votes.create_vote_staging_tables(conn)
+    assert populate_votes.copy_voteview_files(
+        conn, cur, "_rollcalls.json", "rollcalls_staging", ["congress", "chamber", "rollnumber", "bill_number"]) == 4
+    assert populate_votes.copy_voteview_files(
+        conn, cur, "_votes.json", "votes_staging", ["congress", "chamber", "rollnumber", "icpsr", "cast_code"]) == 8
+    yield conn, cur, pids, bills
+    cur.close()
+
+
+def _votes(cur):
+    cur.execute("SELECT PoliticianID, BillID, Vote FROM Votes")
+    return {(pid, bill_id): vote for pid, bill_id, vote in cur.fetchall()}
+
+
+class TestResolveFromStaging:
+    """Staged votes resolve the same way the Python path resolves them."""
+
+    def test_resolved_votes(self, staged):
+        conn, cur, pids, bills = staged
+        assert populate_votes.replace_votes_from_staging(conn, cur) == 3
+        assert _votes(cur) == {
+            # Same bill number in another Congress links to that Congress's bill
+            (pids[0], bills[(117, "H.R.9001")]): "Yea",
+            # Roll calls 1 and 2 are both on H.R. 9001 now; the first vote is kept
+            (pids[0], bills[(118, "H.R.9001")]): "Nay",
+            (pids[1], bills[(118, "H.R.9001")]): "Not Voting",
+        }
+
+    def test_seeded_votes_replaced(self, staged):
+        conn, cur, pids, bills = staged
+        populate_votes.replace_votes_from_staging(conn, cur)
+        cur.execute("SELECT COUNT(*) FROM Votes WHERE BillID <> ALL(%s)", (list(bills.values()),))
+        assert cur.fetchone()[0] == 0
+        cur.execute("SELECT MIN(VoteID) FROM Votes")
+        assert cur.fetchone()[0] == 1
+
+    def test_failed_insert_keeps_votes(self, staged, monkeypatch):
+        """The DELETE is rolled back with the INSERT that failed."""
+        conn, cur, pids, bills = staged
+        before = _votes(cur)
+        assert before
+        monkeypatch.setattr(populate_votes, "START_CONGRESS", "not a number")
+        with pytest.raises(psycopg2.DataError):
+            populate_votes.replace_votes_from_staging(conn, cur)
+        conn.rollback()
+        assert _votes(cur) == before
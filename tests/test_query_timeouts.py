@@ -0,0 +1,75 @@
+"""Tests for per-endpoint statement timeouts and their 503 responses."""
+
+import json
+
+from psycopg2.pool import PoolError
+
+import app.main as main
+from app import config
+from app.db import get_db_connection, release_db_connection, get_timeout_counts, statement_timeout_for
+
+
+class TestStatementTimeouts:
+    """Queries over their endpoint's budget are cancelled and reported as 503."""
+
+    def test_budget_is_set_on_checkout(self, setup_test_db):
+        """The connection's statement_timeout is the requested budget."""
+        conn = get_db_connection(statement_timeout_ms=1234)
+        try:
+            cur = conn.cursor()
+            cur.execute("SHOW statement_timeout;")
+            assert cur.fetchone()[0] == "1234ms"
+            cur.close()
+        finally:
+            release_db_connection(conn)
+
+    def test_budget_ends_with_the_checkout(self, setup_test_db):
+        """The budget is transaction-local, so it does not leak to the next user."""
+        conn = get_db_connection(statement_timeout_ms=1234)
+        release_db_connection(conn)
+
+        conn = get_db_connection(statement_timeout_ms=0)
+        try:
+            cur = conn.cursor()
+            cur.execute("SHOW statement_timeout;")
+            assert cur.fetchone()[0] != "1234ms"
+            cur.close()
+        finally:
+            release_db_connection(conn)
+
+    def test_slow_query_returns_503(self, client, seed_test_data, monkeypatch):
+        """A query cancelled by statement_timeout gets a 503 with Retry-After."""
+        monkeypatch.setattr(main, "SEARCH_DONORS_SQL",
+                            "SELECT DonorID, Name, pg_sleep(1) FROM Donors WHERE Name ILIKE %s;")
+        monkeypatch.setitem(config.STATEMENT_TIMEOUTS_MS, "search_donors_route", 50)
+        before = get_timeout_counts().get(("search_donors_route", "statement"), 0)
+
+        response = client.get("/api/donors/search?name=smith")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(config.RETRY_AFTER_SECONDS)
+        assert json.loads(response.data)["retryAfter"] == config.RETRY_AFTER_SECONDS
+        assert get_timeout_counts()[("search_donors_route", "statement")] == before + 1
+
+        # The connection went back to the pool in a usable state
+        monkeypatch.undo()
+        assert client.get("/api/donors/search?name=smith").status_code == 200
+
+
+def test_pool_timeout_returns_503(client, monkeypatch):
+    """Waiting too long for a pooled connection is also a 503."""
+    def no_connection(*args, **kwargs):
+        raise PoolError("Timed out waiting for a database connection")
+
+    monkeypatch.setattr(main, "get_db_connection", no_connection)
+    before = get_timeout_counts().get(("get_donor", "pool"), 0)
+
+    response = client.get("/api/donor/1")
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert get_timeout_counts()[("get_donor", "pool")] == before + 1
+
+
+def test_statement_timeout_for_uses_endpoint_budget(monkeypatch):
+    monkeypatch.setitem(config.STATEMENT_TIMEOUTS_MS, "search_donors_route", 1500)
+    assert statement_timeout_for("search_donors_route") == 1500
+    assert statement_timeout_for("no_such_endpoint") == config.STATEMENT_TIMEOUT_MS
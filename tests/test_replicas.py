@@ -0,0 +1,86 @@
+"""Tests for read-replica routing.
+
+The test database stands in for a healthy replica of itself; an unused local
+port stands in for one that is down.
+"""
+import pytest
+from psycopg2.extensions import make_dsn
+
+from app import config, db
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    """Replaces the configured replicas; call with DSNs to set them up."""
+    created = []
+
+    def configure(*dsns):
+        pools = [db.DatabasePool(f"replica{n}", dsn) for n, dsn in enumerate(dsns, 1)]
+        created.extend(pools)
+        monkeypatch.setattr(db, "_replicas", pools)
+        monkeypatch.setattr(db, "_last_health_check", 0.0)
+        return pools
+
+    yield configure
+    for replica in created:
+        if replica._pool is not None:
+            replica._pool.closeall()
+
+
+def _test_database_dsn():
+    return make_dsn(**{k: v for k, v in config.conn_params.items() if v is not None})
+
+
+DOWN_DSN = "host=127.0.0.1 port=1 dbname=missing"
+
+
+class TestReplicaRouting:
+    """GET requests read from healthy replicas, falling back to the primary."""
+
+    def test_get_served_by_replica(self, client, seed_test_data, replicas):
+        [replica] = replicas(_test_database_dsn())
+        response = client.get("/api/politician/1")
+        assert response.status_code == 200
+        assert replica.healthy
+        assert replica.checkouts >= 1
+
+    def test_round_robin_across_replicas(self, client, seed_test_data, replicas):
+        first, second = replicas(_test_database_dsn(), _test_database_dsn())
+        for _ in range(4):
+            assert client.get("/api/politician/1").status_code == 200
+        assert first.checkouts >= 2 and second.checkouts >= 2
+
+    def test_unreachable_replica_falls_back(self, client, seed_test_data, replicas):
+        [replica] = replicas(DOWN_DSN)
+        primary_before = db._primary.checkouts
+        response = client.get("/api/politician/1")
+        assert response.status_code == 200
+        assert not replica.healthy
+        assert replica.error
+        assert db._primary.checkouts > primary_before
+
+    def test_lagging_replica_skipped(self, client, seed_test_data, replicas, monkeypatch):
+        # A negative allowance makes even a caught-up replica count as behind
+        monkeypatch.setattr(config, "DB_REPLICA_MAX_VERSION_LAG", -1)
+        [replica] = replicas(_test_database_dsn())
+        response = client.get("/api/politician/1")
+        assert response.status_code == 200
+        assert not replica.healthy
+        assert "data version" in replica.error
+        assert replica.checkouts == 1  # the health check only
+
+    def test_writes_use_primary(self, app, setup_test_db, replicas):
+        [replica] = replicas(_test_database_dsn())
+        with app.test_request_context("/api/politician/1"):
+            conn = db.get_db_connection(readonly=False)
+            db.release_db_connection(conn)
+        assert replica.checkouts == 0
+
+
+def test_metrics_report_replica_health(client, replicas):
+    """/metrics lists checkouts per pool and replica health."""
+    replicas(DOWN_DSN)
+    db.check_replicas(force=True)
+    body = client.get("/metrics").data.decode()
+    assert 'db_pool_checkouts_total{pool="primary"}' in body
+    assert 'db_replica_healthy{pool="replica1"} 0' in body
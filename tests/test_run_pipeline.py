@@ -0,0 +1,90 @@
+"""Tests for the ingest pipeline scheduler, with stand-in stage commands."""
+import json
+import sys
+
+import pytest
+
+from bin.run_pipeline import STAGES, Pipeline, stage_command, topological_order
+
+
+def fake_command(fail=(), seconds=0.3):
+    """Stage commands that sleep, or exit 1 for the stages in fail."""
+    def command(name):
+        code = f"import sys, time; time.sleep({seconds}); print('ran {name}'); sys.exit({int(name in fail)})"
+        return [sys.executable, "-c", code]
+    return command
+
+
+class TestOrder:
+    """Stages are ordered after their dependencies."""
+
+    def test_loader_order(self):
+        order = topological_order(STAGES)
+        for name, deps in STAGES.items():
+            assert all(order.index(dep) < order.index(name) for dep in deps)
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            topological_order({"a": ["b"], "b": ["a"]})
+
+    def test_unknown_dependency_rejected(self):
+        with pytest.raises(ValueError, match="Unknown stage 'missing'"):
+            topological_order({"a": ["missing"]})
+
+
+class TestRun:
+    """Independent stages overlap; failures stop dependents; --resume picks up."""
+
+    def test_independent_stages_run_concurrently(self, tmp_path):
+        pipeline = Pipeline(STAGES, str(tmp_path), jobs=3, command=fake_command())
+        assert pipeline.run()
+        stages = pipeline.state["stages"]
+        assert all(record["status"] == "done" for record in stages.values())
+        # Politicians and bills start together; votes waits for both
+        assert stages["populate_bills"]["offset_s"] < 0.25
+        assert stages["populate_politicians"]["offset_s"] < 0.25
+        assert stages["populate_votes"]["offset_s"] >= 0.3
+        assert pipeline.state["wall_s"] < sum(record["wall_s"] for record in stages.values())
+        assert "ran populate_bills" in open(stages["populate_bills"]["log"]).read()
+
+    def test_failure_skips_dependents(self, tmp_path):
+        pipeline = Pipeline(STAGES, str(tmp_path), command=fake_command(fail={"build_fec_map"}, seconds=0))
+        assert not pipeline.run()
+        status = {name: record["status"] for name, record in pipeline.state["stages"].items()}
+        assert status["build_fec_map"] == "failed"
+        assert status["populate_donors_and_donations"] == "skipped"
+        assert status["populate_industries"] == "skipped"
+        assert status["populate_votes"] == "done"
+
+    def test_resume_reruns_only_incomplete(self, tmp_path):
+        Pipeline(STAGES, str(tmp_path), command=fake_command(fail={"build_fec_map"}, seconds=0)).run()
+
+        state = Pipeline.load_state(str(tmp_path))
+        resumed = Pipeline(STAGES, str(tmp_path), command=fake_command(seconds=0), state=state)
+        assert resumed.run()
+        stages = resumed.state["stages"]
+        assert all(record["status"] == "done" for record in stages.values())
+        rerun = {name for name, record in stages.items() if resumed.state["run_id"] in record["log"]}
+        assert rerun == {"build_fec_map", "populate_donors_and_donations", "populate_industries"}
+
+    def test_only_requires_done_dependencies(self, tmp_path):
+        pipeline = Pipeline(STAGES, str(tmp_path), command=fake_command(seconds=0))
+        assert not pipeline.run(only=["populate_votes"])
+        assert pipeline.status("populate_votes") == "skipped"
+
+    def test_real_loader_failure_is_recorded(self, tmp_path, monkeypatch):
+        """A loader that cannot reach the database exits non-zero and reports the error."""
+        monkeypatch.setenv("DB_HOST", "127.0.0.1")
+        monkeypatch.setenv("DB_PORT", "1")  # nothing listens there
+        stages = {"build_icpsr_map": [], "populate_votes": ["build_icpsr_map"]}
+        pipeline = Pipeline(stages, str(tmp_path), command=stage_command)
+        assert not pipeline.run()
+        record = pipeline.state["stages"]["build_icpsr_map"]
+        assert record["status"] == "failed"
+        assert record["returncode"] != 0
+        assert record["report"]["status"] == "error"
+        assert "OperationalError" in record["report"]["error"]
+        assert pipeline.status("populate_votes") == "skipped"
+        # The saved state agrees, so --resume would rerun the loader
+        with open(tmp_path / "state.json") as f:
+            assert json.load(f)["stages"]["build_icpsr_map"]["status"] == "failed"
@@ -0,0 +1,131 @@
+"""Tests for the slow query log and its report."""
+import json
+
+import psycopg2
+import psycopg2.errors
+import pytest
+
+from app import config, slow_queries
+from bin.slow_query_report import read_records, summarize
+
+
+@pytest.fixture
+def slow_log(tmp_path, monkeypatch):
+    """Enables the slow query log for every query, writing to a temp file."""
+    path = tmp_path / "slow_queries.log"
+    monkeypatch.setattr(config, "SLOW_QUERY_LOG_PATH", str(path))
+    monkeypatch.setattr(config, "SLOW_QUERY_MS", 0.0)
+    monkeypatch.setattr(config, "SLOW_QUERY_EXPLAIN_SAMPLE", 0.0)
+    slow_queries.close_log()
+    yield path
+    slow_queries.close_log()
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestNormalization:
+    """Statements differing only in values share a fingerprint."""
+
+    def test_literals_and_whitespace(self):
+        sql = slow_queries.normalize_sql(
+            "SELECT *\n  FROM Bills  WHERE Congress = 118 AND BillNumber = 'H.R. 1' LIMIT 25;"
+        )
+        assert sql == "SELECT * FROM Bills WHERE Congress = ? AND BillNumber = ? LIMIT ?"
+
+    def test_placeholders_and_identifiers_kept(self):
+        sql = slow_queries.normalize_sql("SELECT t1.x FROM t1 WHERE id = %s AND n = %(n)s")
+        assert sql == "SELECT t1.x FROM t1 WHERE id = %s AND n = %(n)s"
+
+    def test_vote_filters_fingerprint_separately(self):
+        base = "SELECT 1 FROM Votes v WHERE v.PoliticianID = %s"
+        with_type = base + " AND b.BillNumber LIKE ANY(%s)"
+        assert (slow_queries.fingerprint(slow_queries.normalize_sql(base))
+                != slow_queries.fingerprint(slow_queries.normalize_sql(with_type)))
+
+    def test_params_shape(self):
+        assert slow_queries.params_shape((42, ["hr", "s"], None, [])) == ["int", "str[2]", "null", "empty[0]"]
+        assert slow_queries.params_shape({"name": "%smith%"}) == {"name": "str"}
+        assert slow_queries.params_shape(None) is None
+
+
+class TestRecording:
+    """Only queries over the threshold are written."""
+
+    def test_over_threshold_logged(self, slow_log):
+        slow_queries.record_query("SELECT * FROM Donors WHERE DonorID = %s", (7,), 0.25, 1, "get_donor")
+        [record] = _read(slow_log)
+        assert record["sql"] == "SELECT * FROM Donors WHERE DonorID = %s"
+        assert record["params"] == ["int"]
+        assert record["duration_ms"] == 250.0
+        assert record["rows"] == 1
+        assert record["endpoint"] == "get_donor"
+        assert "plan" not in record
+
+    def test_under_threshold_skipped(self, slow_log, monkeypatch):
+        monkeypatch.setattr(config, "SLOW_QUERY_MS", 500.0)
+        slow_queries.record_query("SELECT 1", None, 0.1)
+        assert not slow_log.exists() or slow_log.read_text() == ""
+
+    def test_disabled_by_default(self, slow_log, monkeypatch):
+        monkeypatch.setattr(config, "SLOW_QUERY_MS", None)
+        slow_queries.record_query("SELECT 1", None, 60.0)
+        assert not slow_log.exists() or slow_log.read_text() == ""
+
+    def test_cancelled_logged_without_explain(self, slow_log, monkeypatch):
+        """A statement cancelled by its statement_timeout is flagged and never re-run."""
+        monkeypatch.setattr(config, "SLOW_QUERY_EXPLAIN_SAMPLE", 1.0)
+        error = psycopg2.errors.QueryCanceled("canceling statement due to statement timeout")
+        slow_queries.record_query("SELECT * FROM Votes WHERE PoliticianID = %s", (1,), 4.0, -1,
+                                  "get_politician_votes", error=error, timeout_ms=4000)
+        assert slow_queries._explain_queue.unfinished_tasks == 0
+        [record] = _read(slow_log)
+        assert record["cancelled"] is True
+        assert record["error"] == "QueryCanceled"
+        assert record["rows"] is None
+        assert "plan" not in record and "explain_error" not in record
+
+    def test_explain_prefers_replica(self, monkeypatch):
+        """EXPLAIN connects to a configured replica rather than the primary."""
+        calls = []
+        monkeypatch.setattr(config, "DB_REPLICA_DSNS", ["host=down", "host=replica2"])
+
+        def connect(*args, **kwargs):
+            calls.append(args)
+            if args == ("host=down",):
+                raise psycopg2.OperationalError("could not connect")
+            return "conn"
+
+        monkeypatch.setattr(slow_queries.psycopg2, "connect", connect)
+        assert slow_queries._explain_connect() == "conn"
+        assert calls == [("host=down",), ("host=replica2",)]
+
+    def test_api_queries_logged_with_sampled_plan(self, client, seed_test_data, slow_log, monkeypatch):
+        monkeypatch.setattr(config, "SLOW_QUERY_EXPLAIN_SAMPLE", 1.0)
+        response = client.get("/api/politician/1/votes?type=hr")
+        assert response.status_code == 200
+        slow_queries._explain_queue.join()
+
+        records = [r for r in _read(slow_log) if r["endpoint"] == "get_politician_votes"]
+        assert records
+        assert all("plan" in r for r in records)
+        assert records[0]["plan"][0]["Plan"]["Node Type"]
+
+
+def test_report_ranks_by_total_time(slow_log):
+    """The report groups by fingerprint and sorts by total time."""
+    slow_queries.record_query("SELECT * FROM Donors WHERE DonorID = %s", (1,), 0.1, 1, "get_donor")
+    slow_queries.record_query("SELECT * FROM Donors WHERE DonorID = %s", (2,), 0.3, 1, "get_donor")
+    slow_queries.record_query("SELECT * FROM Bills WHERE BillID = %s", (3,), 0.35, 1, "get_politician_votes")
+
+    summary = summarize(read_records(str(slow_log)))
+    assert [g["calls"] for g in summary] == [2, 1]
+    assert summary[0]["total_ms"] == 400.0
+    assert summary[0]["max_ms"] == 300.0
+    assert summary[0]["endpoints"] == ["get_donor"]
+
+    assert summary[0]["cancelled"] == 0
+
+    only_votes = summarize(read_records(str(slow_log)), endpoint="get_politician_votes")
+    assert [g["sql"] for g in only_votes] == ["SELECT * FROM Bills WHERE BillID = %s"]